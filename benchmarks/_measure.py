@@ -0,0 +1,23 @@
+"""
+Timing shared by the benchmark scripts.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+def measure(
+    name: str, size: int, repeats: int, operation: Callable[[], object]
+) -> None:
+    """
+    Print the best of repeated timings of an operation over size values, in total
+    and per value.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:>26}: {best * 1000:8.2f}ms ({best / size * 1e9:6.0f}ns per value)")
@@ -0,0 +1,51 @@
+"""
+Measure arithmetic on monetary values, including the construction of the resulting
+instances.
+
+Usage: python benchmarks/arithmetic.py [values] [repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+
+from _measure import measure
+
+from immoney import Round
+from immoney.currencies import SEK
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    monies = [SEK.from_subunit(value) for value in range(1, size + 1)]
+    overdrafts = [SEK.overdraft_from_subunit(value) for value in range(1, size + 1)]
+    one = SEK.from_subunit(1)
+
+    measure("money + money", size, repeats, lambda: [value + one for value in monies])
+    measure("money - money", size, repeats, lambda: [one - value for value in monies])
+    measure(
+        "money + overdraft",
+        size,
+        repeats,
+        lambda: [a + b for a, b in zip(monies, overdrafts, strict=True)],
+    )
+    measure("-money", size, repeats, lambda: [-value for value in monies])
+    measure("money * int", size, repeats, lambda: [value * 3 for value in monies])
+    factor = Decimal("1.25")
+    measure(
+        "money * decimal", size, repeats, lambda: [value * factor for value in monies]
+    )
+    measure(
+        "money * decimal, rounded",
+        size,
+        repeats,
+        lambda: [value.multiply_and_round(factor, Round.HALF_UP) for value in monies],
+    )
+    measure("money // int", size, repeats, lambda: [value // 3 for value in monies])
+    measure("money < money", size, repeats, lambda: [value < one for value in monies])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measure construction of value instances, both for values missing from the instance
+cache and for cached values.
+
+Usage: python benchmarks/construction.py [values] [repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+from fractions import Fraction
+
+from _measure import measure
+
+from immoney import Money
+from immoney import Overdraft
+from immoney import SubunitFraction
+from immoney.currencies import SEK
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    values = range(1, size + 1)
+    fractions = [Fraction(value, 3) for value in values]
+
+    # Sequential values are never found in the instance cache.
+    measure(
+        "money, cache miss",
+        size,
+        repeats,
+        lambda: [Money.from_subunit(value, SEK) for value in values],
+    )
+    measure(
+        "overdraft, cache miss",
+        size,
+        repeats,
+        lambda: [Overdraft.from_subunit(value, SEK) for value in values],
+    )
+    measure(
+        "fraction, cache miss",
+        size,
+        repeats,
+        lambda: [SubunitFraction(fraction, SEK) for fraction in fractions],
+    )
+    measure(
+        "money, cache hit",
+        size,
+        repeats,
+        lambda: [Money.from_subunit(1, SEK) for _ in values],
+    )
+    small = [value % 1_000 for value in values]
+    measure(
+        "small money",
+        size,
+        repeats,
+        lambda: [SEK.from_subunit(value) for value in small],
+    )
+    SEK.preallocate(1_000)
+    measure(
+        "small money, preallocated",
+        size,
+        repeats,
+        lambda: [SEK.from_subunit(value) for value in small],
+    )
+
+
+if __name__ == "__main__":
+    main()
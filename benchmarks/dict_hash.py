@@ -0,0 +1,52 @@
+"""
+Measure dict and set workloads keyed by monetary values, which are dominated by
+hashing.
+
+Usage: python benchmarks/dict_hash.py [values] [repeats]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from fractions import Fraction
+
+from _measure import measure
+
+from immoney.currencies import EUR
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    rng = random.Random(0)
+    currencies = (SEK, NOK, EUR)
+    # Values are created once up front, so that only hashing is measured.
+    monies = [
+        rng.choice(currencies).from_subunit(rng.randint(0, 1_000)) for _ in range(size)
+    ]
+    overdrafts = [
+        rng.choice(currencies).overdraft_from_subunit(rng.randint(1, 1_000))
+        for _ in range(size)
+    ]
+    fractions = [
+        rng.choice(currencies).fraction(Fraction(rng.randint(0, 1_000), 3))
+        for _ in range(size)
+    ]
+    currency_keys = [value.currency for value in monies]
+    keys = {value: index for index, value in enumerate(monies)}
+
+    measure("currency dict", size, repeats, lambda: dict.fromkeys(currency_keys))
+    measure("money set", size, repeats, lambda: set(monies))
+    measure("overdraft set", size, repeats, lambda: set(overdrafts))
+    measure("subunit fraction set", size, repeats, lambda: set(fractions))
+    measure(
+        "money dict lookup", size, repeats, lambda: [keys[value] for value in monies]
+    )
+
+
+if __name__ == "__main__":
+    main()
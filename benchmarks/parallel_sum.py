@@ -0,0 +1,51 @@
+"""
+Measure how summation of a large ledger file scales with the number of worker
+processes.
+
+Usage: python benchmarks/parallel_sum.py [rows] [max workers]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from immoney.parallel import parallel_sum_file
+
+
+def write_ledger(path: Path, rows: int) -> None:
+    rng = random.Random(0)
+    with path.open("w") as file:
+        for _ in range(rows):
+            code = rng.choice(("SEK", "NOK", "EUR"))
+            sign = "-" if rng.random() < 0.3 else ""
+            file.write(
+                f"{code},{sign}{rng.randint(0, 1_000_000)}.{rng.randint(10, 99)}\n"
+            )
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "ledger.csv"
+        write_ledger(path, rows)
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            parallel_sum_file(path, max_workers=workers, chunk_size=1024 * 1024)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>3} workers: {elapsed:8.3f}s "
+                f"({rows / elapsed:,.0f} rows/s, speedup {baseline / elapsed:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from ._base import Overdraft
 from ._base import ParsableMoneyValue
 from ._base import Round
 from ._base import SubunitFraction
+from ._rate import Rate
 from ._version import __version__
 from ._version import __version_tuple__
 
@@ -16,4 +17,5 @@ __all__ = (
     "Round",
     "Overdraft",
     "ParsableMoneyValue",
+    "Rate",
 )
@@ -3,6 +3,8 @@ from __future__ import annotations
 import abc
 import enum
 import math
+import sys
+from collections.abc import Callable
 from decimal import Decimal
 from fractions import Fraction
 from functools import cached_property
@@ -11,6 +13,7 @@ from typing import Any
 from typing import ClassVar
 from typing import Final
 from typing import Generic
+from typing import SupportsIndex
 from typing import TypeAlias
 from typing import final
 from typing import overload
@@ -21,6 +24,7 @@ from typing_extensions import Self
 from typing_extensions import TypeVar
 from typing_extensions import assert_never
 
+from . import _cache
 from ._cache import InstanceCache
 from ._frozen import Frozen
 from ._parsers import Nat
@@ -46,6 +50,11 @@ valid_subunit: Final = frozenset({10**i for i in range(20)})
 class Currency(Frozen, abc.ABC):
     code: ClassVar[Abstract[str]]
     subunit: ClassVar[Abstract[int]]
+    # Number of Money instances, from zero subunits and up, that are allocated up
+    # front and returned instead of instances from the instance cache.
+    # Subclasses can override this, or call preallocate() at runtime.
+    preallocated_subunits: ClassVar[int] = 0
+    _hash: ClassVar[int]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -56,6 +65,9 @@ class Currency(Frozen, abc.ABC):
             raise InvalidSubunit(
                 "Currency subunits other than powers of 10 are not supported"
             )
+        # Currencies are hashed on every lookup of a cached value instance, so the
+        # hash is computed once per class.
+        cls._hash = hash((cls, cls.code, cls.subunit))
 
     def __str__(self) -> str:
         return self.code
@@ -67,7 +79,22 @@ class Currency(Frozen, abc.ABC):
         return Money(value, self)
 
     def __hash__(self) -> int:
-        return hash((type(self), self.code, self.subunit))
+        return self._hash
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        # Pickle by reference to the module-level instance named by the currency
+        # code, so that unpickling restores the singleton rather than a copy.
+        # Currencies that aren't bound like that are pickled by value.
+        code: str = self.code
+        if getattr(sys.modules.get(type(self).__module__), code, None) is self:
+            return code
+        return super().__reduce_ex__(protocol)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        return self
 
     @cached_property
     def subunit_width(self) -> int:
@@ -105,7 +132,39 @@ class Currency(Frozen, abc.ABC):
 
         return parse_nat(exact)
 
+    @cached_property
+    def _preallocated(self) -> tuple[Money[Self], ...]:
+        return self._allocate(self.preallocated_subunits)
+
+    def _allocate(self, stop: int) -> tuple[Money[Self], ...]:
+        # Instances are constructed without going through the instance cache, to not
+        # evict its entries.
+        construct = Money._construct
+        return tuple(construct(subunits, self) for subunits in range(stop))
+
+    def preallocate(self, stop: int) -> None:
+        """
+        Allocate Money instances for all subunit values in range(stop), replacing any
+        previously preallocated instances. Pass zero to release them.
+
+        >>> from immoney.currencies import SEK
+        >>> SEK.preallocate(10_000)
+        >>> SEK.from_subunit(150) is SEK.from_subunit(150)
+        True
+        >>> SEK.preallocate(0)
+        """
+        if stop < 0:
+            raise ValueError("Cannot preallocate a negative number of instances.")
+        # The table is cached in the instance dictionary, like any cached_property,
+        # which doesn't go through Frozen.__setattr__().
+        self.__dict__["_preallocated"] = self._allocate(stop)
+
     def from_subunit(self, value: int) -> Money[Self]:
+        if type(value) is int and value >= 0:
+            preallocated = self._preallocated
+            if value < len(preallocated):
+                _cache.preallocated_hits += 1
+                return preallocated[value]
         return Money.from_subunit(value, self)
 
     def overdraft_from_subunit(self, value: int) -> Overdraft[Self]:
@@ -184,17 +243,49 @@ C_inv = TypeVar(
 
 def _dispatch_type(subunits: int, currency: C_inv) -> Money[C_inv] | Overdraft[C_inv]:
     return (
-        Money.from_subunit(subunits, currency)
+        currency.from_subunit(subunits)
         if subunits >= 0
         else Overdraft.from_subunit(-subunits, currency)
     )
 
 
+def _restore_signed_subunits(
+    subunits: int,
+    currency: C_inv,
+) -> Money[C_inv] | Overdraft[C_inv]:
+    # Pickles of Money and Overdraft reference this function by name, so it must
+    # keep its name, module and signature for stored pickles to remain loadable.
+    return _dispatch_type(subunits, currency)
+
+
+# Bounds of signed 64-bit integers, for fixed-width representations of subunits.
+int64_min: Final = -(2**63)
+int64_max: Final = 2**63 - 1
+
+
+def _signed_subunits(value: object) -> int:
+    # Money counts as positive and Overdraft as negative subunits. The monetary
+    # types are final, so exact type checks suffice.
+    if type(value) is Money:
+        return value.subunits
+    if type(value) is Overdraft:
+        return -value.subunits
+    raise TypeError(
+        f"Expected Money or Overdraft, got value of type {type(value).__qualname__!r}."
+    )
+
+
 C_co = TypeVar("C_co", bound=Currency, covariant=True, default=Currency)
 
 
 class _ValueCurrencyPair(Frozen, Generic[C_co], metaclass=InstanceCache):
-    __slots__ = ("subunits", "currency")
+    __slots__ = ("subunits", "currency", "_hash")
+
+    # Attributes are set with object.__setattr__(), which mypy doesn't recognize as
+    # initialization of final names.
+    subunits: Final[Nat]  # type: ignore[misc]
+    currency: Final[C_co]  # type: ignore[misc]
+    _hash: Final[int]  # type: ignore[misc]
 
     @overload
     def __init__(self, *, subunits: int, currency: C_co) -> None: ...
@@ -207,9 +298,12 @@ class _ValueCurrencyPair(Frozen, Generic[C_co], metaclass=InstanceCache):
         value: ParsableMoneyValue,
         currency: C_co,
     ) -> None:
-        # Type ignore is safe because metaclass delegates normalization to _normalize().
-        self.subunits: Final[Nat] = value  # type: ignore[assignment]
-        self.currency: Final = currency
+        # Values are already normalized, because the metaclass delegates
+        # normalization to _normalize().
+        self._check_uninitialized("_hash")
+        object.__setattr__(self, "subunits", value)
+        object.__setattr__(self, "currency", currency)
+        object.__setattr__(self, "_hash", hash((type(self), currency, value)))
 
     @classmethod
     def _normalize(
@@ -217,15 +311,20 @@ class _ValueCurrencyPair(Frozen, Generic[C_co], metaclass=InstanceCache):
         *args: object,
         **kwargs: object,
     ) -> tuple[Nat, Currency]:
-        match args, kwargs:
-            case ((value, currency_arg), {}):
-                currency = _parse_currency_from_arg(cls, currency_arg)
-                return currency.normalize_to_subunits(value), currency
-            case ((), {"subunits": int(subunits), "currency": currency_arg}):
-                currency = _parse_currency_from_arg(cls, currency_arg)
-                return parse_nat(subunits), currency
-            case _:
-                raise TypeError(f"Invalid call signature for {cls.__qualname__}")
+        # This runs for every instantiation, and explicit checks are considerably
+        # faster than structural pattern matching on the arguments.
+        if len(args) == 2:
+            value, currency_arg = args
+            currency = _parse_currency_from_arg(cls, currency_arg)
+            return currency.normalize_to_subunits(value), currency
+        if (
+            not args
+            and isinstance(subunits := kwargs.get("subunits"), int)
+            and "currency" in kwargs
+        ):
+            currency = _parse_currency_from_arg(cls, kwargs["currency"])
+            return parse_nat(subunits), currency
+        raise TypeError(f"Invalid call signature for {cls.__qualname__}")
 
     def __repr__(self) -> str:
         main_unit, subunits = self.str_parts()
@@ -246,15 +345,45 @@ class _ValueCurrencyPair(Frozen, Generic[C_co], metaclass=InstanceCache):
             else (string_value[:-subunit_width], string_value[-subunit_width:])
         )
 
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        return self
+
+
+class _PreallocatedCache(InstanceCache):
+    """
+    The instance cache of Money, which returns instances from the preallocated
+    instances of the currency when there are any for the normalized value, so that
+    every way of constructing a value returns the same instance.
+    """
+
+    _normalize: Callable[..., tuple[Nat, Currency]]
+
+    def __call__(cls, *args: object, **kwargs: object) -> Any:
+        subunits, currency = cls._normalize(*args, **kwargs)
+        preallocated = currency._preallocated
+        if subunits < len(preallocated) and type(subunits) is int:
+            _cache.preallocated_hits += 1
+            return preallocated[subunits]
+        return cls._instantiate(subunits, currency)
+
 
 @final
-class Money(_ValueCurrencyPair[C_co], Generic[C_co]):
+class Money(_ValueCurrencyPair[C_co], Generic[C_co], metaclass=_PreallocatedCache):
     def __str__(self) -> str:
         main_units, subunits = self.str_parts()
         return f"{main_units}.{subunits}\xa0{self.currency.code}"
 
     def __hash__(self) -> int:
-        return hash((type(self), self.currency, self.subunits))
+        return self._hash
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[[int, C_co], Money[C_co] | Overdraft[C_co]], tuple[int, C_co]]:
+        # Restoring through the instance cache returns interned instances.
+        return _restore_signed_subunits, (self.subunits, self.currency)
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, int) and other == 0:
@@ -333,8 +462,9 @@ class Money(_ValueCurrencyPair[C_co], Generic[C_co]):
         if isinstance(other, Fraction):
             return SubunitFraction(self.subunits * other, self.currency)
         if isinstance(other, Decimal):
+            numerator, denominator = other.as_integer_ratio()
             return SubunitFraction(
-                Fraction(self.subunits) * Fraction(other),
+                Fraction(self.subunits * numerator, denominator),
                 self.currency,
             )
         return NotImplemented
@@ -354,6 +484,22 @@ class Money(_ValueCurrencyPair[C_co], Generic[C_co]):
     ) -> SubunitFraction[C_co] | Overdraft[C_co] | Self:
         return self.__mul__(other)
 
+    def multiply_and_round(
+        self,
+        factor: int | Fraction | Decimal,
+        rounding: Round,
+    ) -> Money[C_co] | Overdraft[C_co]:
+        """
+        Multiply by factor and round the product to a whole number of subunits. This is
+        equivalent to (self * factor).round_either(rounding), but never creates an
+        intermediate SubunitFraction.
+
+        >>> from immoney.currencies import SEK
+        >>> SEK("9.99").multiply_and_round(Decimal("1.25"), Round.HALF_UP)
+        Money('12.49', SEK)
+        """
+        return _multiply_and_round(self.subunits, factor, rounding, self.currency)
+
     def __floordiv__(self: Money[C_co], other: object) -> tuple[Money[C_co], ...]:
         """
         Divides the original value over the numerator and returns a tuple of new
@@ -419,6 +565,11 @@ class Money(_ValueCurrencyPair[C_co], Generic[C_co]):
     @classmethod
     # This needs HKT to allow typing to work properly for subclasses of Money.
     def from_subunit(cls, value: int, currency: C_inv) -> Money[C_inv]:
+        if type(value) is int and value >= 0 and isinstance(currency, Currency):
+            preallocated = currency._preallocated
+            if value < len(preallocated):
+                _cache.preallocated_hits += 1
+                return preallocated[value]
         return cls(
             subunits=value,
             currency=currency,
@@ -454,16 +605,73 @@ class Round(enum.Enum):
     HALF_DOWN = enum.auto()
 
 
-HALF: Final = Fraction(1, 2)
+def _round_ratio(numerator: int, denominator: int, rounding: Round) -> int:
+    """
+    Round numerator / denominator to an integer, using only integer arithmetic. The
+    denominator must be positive.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if not remainder:
+        return quotient
+
+    match rounding:
+        case Round.DOWN:
+            return quotient
+        case Round.UP:
+            return quotient + 1
+        case Round.HALF_UP:
+            return quotient + (2 * remainder >= denominator)
+        case Round.HALF_EVEN:
+            doubled = 2 * remainder
+            if doubled == denominator:
+                return quotient + (quotient & 1)
+            return quotient + (doubled > denominator)
+        case Round.HALF_DOWN:
+            return quotient + (2 * remainder > denominator)
+        case no_match:
+            assert_never(no_match)
+
+
+def _ratio(factor: int | Fraction | Decimal) -> tuple[int, int]:
+    # Decimal.as_integer_ratio() reads the coefficient and exponent directly, and
+    # is much cheaper than going through a Fraction.
+    if isinstance(factor, int):
+        return factor, 1
+    if isinstance(factor, Fraction | Decimal):
+        return factor.as_integer_ratio()
+    raise TypeError(f"Cannot multiply by {type(factor).__qualname__!r}.")
+
+
+def _multiply_and_round(
+    subunits: int,
+    factor: int | Fraction | Decimal,
+    rounding: Round,
+    currency: C_inv,
+) -> Money[C_inv] | Overdraft[C_inv]:
+    numerator, denominator = _ratio(factor)
+    return _dispatch_type(
+        _round_ratio(subunits * numerator, denominator, rounding),
+        currency,
+    )
 
 
 @final
 class SubunitFraction(Frozen, Generic[C_co], metaclass=InstanceCache):
-    __slots__ = ("value", "currency")
+    __slots__ = ("value", "currency", "_hash")
+
+    # Attributes are set with object.__setattr__(), which mypy doesn't recognize as
+    # initialization of final names.
+    value: Final[Fraction]  # type: ignore[misc]
+    currency: Final[C_co]  # type: ignore[misc]
+    _hash: Final[int]  # type: ignore[misc]
 
     def __init__(self, value: Fraction | Decimal | int, currency: C_co, /) -> None:
-        self.value: Final = Fraction(value)
-        self.currency: Final = currency
+        self._check_uninitialized("_hash")
+        fraction = Fraction(value)
+        object.__setattr__(self, "value", fraction)
+        object.__setattr__(self, "currency", currency)
+        # Hashing a Fraction is comparatively expensive, so it's done once.
+        object.__setattr__(self, "_hash", hash((type(self), currency, fraction)))
 
     @classmethod
     def _normalize(
@@ -477,7 +685,16 @@ class SubunitFraction(Frozen, Generic[C_co], metaclass=InstanceCache):
         return f"{type(self).__qualname__}({str(self.value)!r}, {self.currency})"
 
     def __hash__(self) -> int:
-        return hash((type(self), self.currency, self.value))
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Fraction, C_co]]:
+        return type(self), (self.value, self.currency)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        return self
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, int) and other == 0:
@@ -618,27 +835,7 @@ class SubunitFraction(Frozen, Generic[C_co], metaclass=InstanceCache):
         )
 
     def _round_subunit(self, rounding: Round) -> int:
-        remainder = self.value % 1
-
-        match rounding:
-            case Round.DOWN:
-                return math.floor(self.value)
-            case Round.UP:
-                return math.ceil(self.value)
-            case Round.HALF_UP:
-                if remainder >= HALF:
-                    return math.ceil(self.value)
-                else:
-                    return math.floor(self.value)
-            case Round.HALF_EVEN:
-                return round(self.value)
-            case Round.HALF_DOWN:
-                if remainder > HALF:
-                    return math.ceil(self.value)
-                else:
-                    return math.floor(self.value)
-            case no_match:
-                assert_never(no_match)
+        return _round_ratio(self.value.numerator, self.value.denominator, rounding)
 
     def round_either(self, rounding: Round) -> Money[C_co] | Overdraft[C_co]:
         return _dispatch_type(self._round_subunit(rounding), self.currency)
@@ -687,7 +884,13 @@ class Overdraft(_ValueCurrencyPair[C_co], Generic[C_co]):
         return f"-{main_units}.{subunits}\xa0{self.currency.code}"
 
     def __hash__(self) -> int:
-        return hash((type(self), self.currency, self.subunits))
+        return self._hash
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[[int, C_co], Money[C_co] | Overdraft[C_co]], tuple[int, C_co]]:
+        # Restoring through the instance cache returns interned instances.
+        return _restore_signed_subunits, (-self.subunits, self.currency)
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Overdraft):
@@ -807,7 +1010,11 @@ class Overdraft(_ValueCurrencyPair[C_co], Generic[C_co]):
         if isinstance(other, Fraction):
             return SubunitFraction(-self.subunits * other, self.currency)
         if isinstance(other, Decimal):
-            return SubunitFraction(-self.subunits * Fraction(other), self.currency)
+            numerator, denominator = other.as_integer_ratio()
+            return SubunitFraction(
+                Fraction(-self.subunits * numerator, denominator),
+                self.currency,
+            )
         return NotImplemented
 
     @overload
@@ -822,6 +1029,18 @@ class Overdraft(_ValueCurrencyPair[C_co], Generic[C_co]):
     ) -> Money[C_co] | SubunitFraction[C_co] | Self:
         return self.__mul__(other)
 
+    def multiply_and_round(
+        self,
+        factor: int | Fraction | Decimal,
+        rounding: Round,
+    ) -> Money[C_co] | Overdraft[C_co]:
+        """
+        Multiply by factor and round the product to a whole number of subunits. This is
+        equivalent to (self * factor).round_either(rounding), but never creates an
+        intermediate SubunitFraction.
+        """
+        return _multiply_and_round(-self.subunits, factor, rounding, self.currency)
+
     def __floordiv__(self, other: object) -> tuple[Self | Money[C_co], ...]:
         """
         Divides the original value over the numerator and returns a tuple of new
@@ -902,3 +1121,6 @@ class Overdraft(_ValueCurrencyPair[C_co], Generic[C_co]):
             source_type=source_type,
             adapter=OverdraftAdapter,
         )
+
+
+Monetary: TypeAlias = Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]
@@ -1,6 +1,22 @@
+from collections import deque
 from collections.abc import Callable
 from functools import lru_cache
 from typing import Any
+from typing import Final
+
+# The default bound of lru_cache.
+default_maxsize: Final = 128
+
+# The classes and normalized arguments of the most recently created instances, as an
+# approximation of the contents of the cache, which lru_cache doesn't expose. Keys of
+# instances that were evicted and created again may occur more than once. Recording
+# adds to the cost of every cache miss, so it's disabled, None, unless enabled with
+# record().
+recent: deque[tuple["InstanceCache", tuple[object, ...]]] | None = None
+
+# The number of instances returned from tables of preallocated instances, which
+# replace cache hits for the values they hold.
+preallocated_hits = 0
 
 
 class InstanceCache(type):
@@ -15,11 +31,46 @@ class InstanceCache(type):
 
     _normalize: Callable[..., tuple[object, ...]]
 
+    def _create(cls, *args: object) -> object:
+        if recent is not None:
+            recent.append((cls, args))
+        return super().__call__(*args)
+
     # lru_cache has a default bound, so while this does consume memory, it's a trivial
     # amount, and worth it.
-    @lru_cache  # noqa: B019
-    def __instantiate(cls, *args: object) -> object:
+    _instantiate = lru_cache(maxsize=default_maxsize)(_create)
+
+    def _construct(cls, *args: object) -> Any:
+        """
+        Construct an instance from already normalized arguments, bypassing the cache.
+        """
         return super().__call__(*args)
 
     def __call__(cls, *args: object, **kwargs: object) -> Any:
-        return cls.__instantiate(*cls._normalize(*args, **kwargs))
+        return cls._instantiate(*cls._normalize(*args, **kwargs))
+
+
+def resize(maxsize: int) -> None:
+    """
+    Replace the instance cache with an empty cache bounded to maxsize instances.
+    """
+    global recent, preallocated_hits
+    if maxsize < 0:
+        raise ValueError("Cache size must not be negative.")
+    InstanceCache._instantiate = lru_cache(maxsize=maxsize)(InstanceCache._create)
+    preallocated_hits = 0
+    if recent is not None:
+        recent = deque(maxlen=maxsize)
+
+
+def record(enabled: bool) -> None:
+    """
+    Start recording the keys of created instances, bounded to the size of the cache,
+    or stop recording and discard the recorded keys.
+    """
+    global recent
+    recent = (
+        deque(maxlen=InstanceCache._instantiate.cache_info().maxsize)
+        if enabled
+        else None
+    )
@@ -0,0 +1,84 @@
+"""
+Compact string form of monetary values, used for storage and transport.
+
+Money and Overdraft are formatted as "<code>:<signed subunits>", and SubunitFraction as
+"<code>:<numerator>/<denominator>", e.g. "SEK:-150" and "SEK:1/3".
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+
+def format_compact(
+    value: Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency],
+) -> str:
+    if isinstance(value, Money):
+        return f"{value.currency.code}:{value.subunits}"
+    if isinstance(value, Overdraft):
+        return f"{value.currency.code}:-{value.subunits}"
+    if isinstance(value, SubunitFraction):
+        fraction = value.value
+        return f"{value.currency.code}:{fraction.numerator}/{fraction.denominator}"
+    raise TypeError(f"Cannot format value of type {type(value)!r}.")
+
+
+def _split(text: str, registry: CurrencyRegistry[Currency]) -> tuple[Currency, str]:
+    code, separator, amount = text.partition(":")
+    if not separator:
+        raise ParseError(f"Invalid compact monetary value: {text!r}.")
+    try:
+        return registry[code], amount
+    except KeyError:
+        raise ParseError(f"Unknown currency code: {code!r}.") from None
+
+
+def _parse_int(amount: str) -> int:
+    # int() also accepts surrounding whitespace and underscores, which are not part
+    # of the format.
+    digits = amount[1:] if amount.startswith("-") else amount
+    if not (digits.isascii() and digits.isdigit()):
+        raise ParseError(f"Invalid subunits: {amount!r}.")
+    return int(amount)
+
+
+def parse_compact_money(
+    text: str,
+    registry: CurrencyRegistry[Currency],
+) -> Money[Currency] | Overdraft[Currency]:
+    currency, amount = _split(text, registry)
+    return _dispatch_type(_parse_int(amount), currency)
+
+
+def parse_compact_fraction(
+    text: str,
+    registry: CurrencyRegistry[Currency],
+) -> SubunitFraction[Currency]:
+    currency, amount = _split(text, registry)
+    numerator, separator, denominator = amount.partition("/")
+    if not separator:
+        raise ParseError(f"Invalid subunit fraction: {amount!r}.")
+    denominator_value = _parse_int(denominator)
+    if denominator_value == 0:
+        raise ParseError("Subunit fraction denominator cannot be zero.")
+    return SubunitFraction(
+        Fraction(_parse_int(numerator), denominator_value),
+        currency,
+    )
+
+
+def parse_compact(
+    text: str,
+    registry: CurrencyRegistry[Currency],
+) -> Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]:
+    if "/" in text:
+        return parse_compact_fraction(text, registry)
+    return parse_compact_money(text, registry)
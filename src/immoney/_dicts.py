@@ -0,0 +1,24 @@
+"""
+Dictionary representations of monetary values, shared by the Pydantic integration and
+the JSON helpers.
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+
+class MoneyDict(TypedDict):
+    subunits: int
+    currency: str
+
+
+class SubunitFractionDict(TypedDict):
+    numerator: int
+    denominator: int
+    currency: str
+
+
+class OverdraftDict(TypedDict):
+    overdraft_subunits: int
+    currency: str
@@ -4,14 +4,26 @@ from .errors import FrozenInstanceError
 
 
 class Frozen:
+    """
+    Base class of immutable types. All attribute assignment raises
+    FrozenInstanceError, so __init__ must set attributes with object.__setattr__().
+    """
+
     __slots__ = ("__weakref__",)
 
     # Using Never makes mypy give a type error for assignment to attributes (because
     # Never is the bottom type).
     def __setattr__(self, key: str, value: Never) -> None:
-        if all(hasattr(self, attribute) for attribute in self.__slots__):
+        raise FrozenInstanceError(
+            f"Instances of {type(self).__qualname__!r} are immutable, cannot write "
+            f"to attribute {key!r}"
+        )
+
+    def _check_uninitialized(self, attribute: str) -> None:
+        # Attributes are set with object.__setattr__() in __init__(), so calling
+        # __init__() again on an existing instance would mutate it in place.
+        if hasattr(self, attribute):
             raise FrozenInstanceError(
-                f"Instances of {type(self).__qualname__!r} are immutable, cannot write "
-                f"to attribute {key!r}"
+                f"Instances of {type(self).__qualname__!r} are immutable, cannot "
+                f"initialize an existing instance"
             )
-        super().__setattr__(key, value)
@@ -5,7 +5,6 @@ from collections.abc import Iterable
 from fractions import Fraction
 from typing import Any
 from typing import Protocol
-from typing import TypedDict
 from typing import get_args
 
 from pydantic_core import core_schema
@@ -15,28 +14,15 @@ from . import Currency
 from . import Money
 from . import Overdraft
 from . import SubunitFraction
+from ._dicts import MoneyDict
+from ._dicts import OverdraftDict
+from ._dicts import SubunitFractionDict
 from .currencies import registry as default_registry
 from .registry import CurrencyRegistry
 
 C = TypeVar("C", bound=Currency, default=Currency)
 
 
-class MoneyDict(TypedDict):
-    subunits: int
-    currency: str
-
-
-class SubunitFractionDict(TypedDict):
-    numerator: int
-    denominator: int
-    currency: str
-
-
-class OverdraftDict(TypedDict):
-    overdraft_subunits: int
-    currency: str
-
-
 def extract_currency_type_arg(source_type: type) -> type[Currency]:
     match get_args(source_type):
         case (type() as currency_type,) if issubclass(currency_type, Currency):
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import Decimal
+from fractions import Fraction
+from typing import Final
+from typing import final
+from typing import overload
+
+from typing_extensions import Self
+
+from ._base import C_inv
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import Round
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _round_ratio
+from ._base import _signed_subunits
+from ._cache import InstanceCache
+from ._frozen import Frozen
+
+RateValue = int | str | Decimal | Fraction
+
+
+def _check_not_float(value: object) -> None:
+    # Fraction() accepts floats, whose binary approximation would silently become the
+    # exact value of the rate, so they're rejected like elsewhere in the library.
+    if isinstance(value, float):
+        raise TypeError(
+            f"Cannot create {Rate.__qualname__} from float, use a str or Decimal."
+        )
+
+
+@final
+class Rate(Frozen, metaclass=InstanceCache):
+    """
+    An exact, dimensionless factor, such as a tax rate or an interest rate. Rates are
+    stored as a reduced numerator and denominator pair, so applying one to a monetary
+    value only involves integer arithmetic.
+
+    >>> from immoney.currencies import SEK
+    >>> vat = Rate.from_percentage(25)
+    >>> vat
+    Rate('1/4')
+    >>> SEK(10) * vat
+    SubunitFraction('250', SEK)
+    >>> vat.apply(SEK("0.10"), Round.HALF_UP)
+    Money('0.03', SEK)
+    """
+
+    __slots__ = ("numerator", "denominator", "_hash")
+
+    # Attributes are set with object.__setattr__(), which mypy doesn't recognize as
+    # initialization of final names.
+    numerator: Final[int]  # type: ignore[misc]
+    denominator: Final[int]  # type: ignore[misc]
+    _hash: Final[int]  # type: ignore[misc]
+
+    def __init__(self, value: RateValue, denominator: int = 1, /) -> None:
+        # Values are already normalized, because the metaclass delegates
+        # normalization to _normalize().
+        self._check_uninitialized("_hash")
+        object.__setattr__(self, "numerator", value)
+        object.__setattr__(self, "denominator", denominator)
+        object.__setattr__(self, "_hash", hash((type(self), value, denominator)))
+
+    @classmethod
+    def _normalize(
+        cls,
+        value: RateValue,
+        denominator: int = 1,
+        /,
+    ) -> tuple[int, int]:
+        _check_not_float(value)
+        _check_not_float(denominator)
+        return (Fraction(value) / denominator).as_integer_ratio()
+
+    @classmethod
+    def from_percentage(cls, value: RateValue) -> Rate:
+        """
+        >>> Rate.from_percentage("12.5")
+        Rate('1/8')
+        """
+        _check_not_float(value)
+        return cls(Fraction(value), 100)
+
+    @property
+    def fraction(self) -> Fraction:
+        return Fraction(self.numerator, self.denominator)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({str(self.fraction)!r})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[int, int]]:
+        return type(self), (self.numerator, self.denominator)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Rate):
+            return (
+                self.numerator == other.numerator
+                and self.denominator == other.denominator
+            )
+        return NotImplemented
+
+    @overload
+    def __mul__(self, other: Rate) -> Rate: ...
+
+    @overload
+    def __mul__(
+        self,
+        other: Money[C_inv] | Overdraft[C_inv] | SubunitFraction[C_inv],
+    ) -> SubunitFraction[C_inv]: ...
+
+    def __mul__(
+        self,
+        other: object,
+    ) -> Rate | SubunitFraction[Currency]:
+        if isinstance(other, Rate):
+            return Rate(
+                Fraction(
+                    self.numerator * other.numerator,
+                    self.denominator * other.denominator,
+                )
+            )
+        if isinstance(other, Money):
+            return SubunitFraction(
+                Fraction(other.subunits * self.numerator, self.denominator),
+                other.currency,
+            )
+        if isinstance(other, Overdraft):
+            return SubunitFraction(
+                Fraction(-other.subunits * self.numerator, self.denominator),
+                other.currency,
+            )
+        if isinstance(other, SubunitFraction):
+            return SubunitFraction(other.value * self.fraction, other.currency)
+        return NotImplemented
+
+    def __rmul__(
+        self,
+        other: Money[C_inv] | Overdraft[C_inv] | SubunitFraction[C_inv],
+    ) -> SubunitFraction[C_inv]:
+        return self.__mul__(other)
+
+    def apply(
+        self,
+        value: Money[C_inv] | Overdraft[C_inv],
+        rounding: Round,
+    ) -> Money[C_inv] | Overdraft[C_inv]:
+        """
+        Multiply a value by the rate, and round the product to a whole number of
+        subunits.
+        """
+        subunits = _signed_subunits(value)
+        return _dispatch_type(
+            _round_ratio(subunits * self.numerator, self.denominator, rounding),
+            value.currency,
+        )
+
+    def apply_many(
+        self,
+        values: Iterable[Money[C_inv] | Overdraft[C_inv]],
+        rounding: Round,
+    ) -> list[Money[C_inv] | Overdraft[C_inv]]:
+        """
+        Multiply values by the rate, rounding each product to a whole number of
+        subunits.
+
+        >>> from immoney.currencies import SEK
+        >>> Rate("0.5").apply_many([SEK("0.03"), SEK.overdraft("0.03")], Round.DOWN)
+        [Money('0.01', SEK), Overdraft('0.02', SEK)]
+        """
+        numerator = self.numerator
+        denominator = self.denominator
+        results = list[Money[C_inv] | Overdraft[C_inv]]()
+        append = results.append
+        for value in values:
+            subunits = _signed_subunits(value)
+            append(
+                _dispatch_type(
+                    _round_ratio(subunits * numerator, denominator, rounding),
+                    value.currency,
+                )
+            )
+        return results
@@ -0,0 +1,285 @@
+"""
+Aggregation of monetary values from asyncio streams, such as queue readers and file
+tailers.
+
+Values are added to a parallel.PartialSum as plain subunit totals per currency code,
+and are only resolved to monetary values once per result. Events are consumed in
+batches of `batch_size` before control is handed back to the event loop with
+asyncio.sleep(0), so that a source that never suspends, e.g. one reading from a buffer,
+doesn't starve other tasks, without suspending for every event.
+
+Sources are only read from as results are consumed, so a slow consumer of windowed
+totals slows down reading from the source instead of buffering events in memory.
+
+>>> import asyncio
+>>> from immoney.currencies import SEK
+>>> async def events():
+...     for value in (SEK(1), SEK(2), SEK.overdraft(5)):
+...         yield value
+>>> asyncio.run(async_sum(events()))
+{Currency(code=SEK, subunit=100): Overdraft('2.00', SEK)}
+>>> async def windows():
+...     return [window async for window in count_windows(events(), 2)]
+>>> asyncio.run(windows())
+[{Currency(code=SEK, subunit=100): Money('3.00', SEK)}, {Currency(code=SEK, subunit=100): Overdraft('5.00', SEK)}]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
+from typing import Final
+from typing import TypeVar
+from typing import overload
+
+from ._base import Currency
+from .currencies import registry as default_registry
+from .parallel import Monetary
+from .parallel import PartialSum
+from .parallel import _identity
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "async_sum",
+    "async_group_sum",
+    "count_windows",
+    "time_windows",
+)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+default_batch_size: Final = 1024
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive.")
+
+
+async def _reduce(
+    rows: AsyncIterable[T],
+    add: Callable[[T], None],
+    batch_size: int,
+) -> None:
+    _check_batch_size(batch_size)
+    pending = batch_size
+    async for row in rows:
+        add(row)
+        pending -= 1
+        if not pending:
+            pending = batch_size
+            await asyncio.sleep(0)
+
+
+@overload
+async def async_sum(
+    rows: AsyncIterable[Monetary],
+    parse: None = None,
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[Currency, Monetary]: ...
+
+
+@overload
+async def async_sum(
+    rows: AsyncIterable[T],
+    parse: Callable[[T], Monetary],
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[Currency, Monetary]: ...
+
+
+async def async_sum(
+    rows: AsyncIterable[Any],
+    parse: Callable[[Any], Monetary] | None = None,
+    *,
+    batch_size: int = default_batch_size,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> dict[Currency, Monetary]:
+    """
+    Sum rows per currency. By default rows are expected to be monetary values, passing
+    a `parse` function allows summing raw events.
+    """
+    partial = PartialSum[None]()
+    add = partial.add
+    parse = parse or _identity
+    await _reduce(rows, lambda row: add(None, parse(row)), batch_size)
+    return partial.resolve(registry).get(None, {})
+
+
+@overload
+async def async_group_sum(
+    rows: AsyncIterable[tuple[K, Monetary]],
+    parse: None = None,
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[K, dict[Currency, Monetary]]: ...
+
+
+@overload
+async def async_group_sum(
+    rows: AsyncIterable[T],
+    parse: Callable[[T], tuple[K, Monetary]],
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[K, dict[Currency, Monetary]]: ...
+
+
+async def async_group_sum(
+    rows: AsyncIterable[Any],
+    parse: Callable[[Any], tuple[Hashable, Monetary]] | None = None,
+    *,
+    batch_size: int = default_batch_size,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> dict[Any, dict[Currency, Monetary]]:
+    """
+    Sum rows per group and currency. By default rows are expected to be pairs of group
+    key and monetary value.
+    """
+    partial = PartialSum[Hashable]()
+    add = partial.add
+    parse = parse or _identity
+    await _reduce(rows, lambda row: add(*parse(row)), batch_size)
+    return partial.resolve(registry)
+
+
+@overload
+def count_windows(
+    rows: AsyncIterable[Monetary],
+    size: int,
+    parse: None = None,
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> AsyncIterator[dict[Currency, Monetary]]: ...
+
+
+@overload
+def count_windows(
+    rows: AsyncIterable[T],
+    size: int,
+    parse: Callable[[T], Monetary],
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> AsyncIterator[dict[Currency, Monetary]]: ...
+
+
+async def count_windows(
+    rows: AsyncIterable[Any],
+    size: int,
+    parse: Callable[[Any], Monetary] | None = None,
+    *,
+    batch_size: int = default_batch_size,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> AsyncIterator[dict[Currency, Monetary]]:
+    """
+    Yield the totals per currency of consecutive windows of `size` rows. The last
+    window holds the remaining rows, and is only yielded if it isn't empty.
+    """
+    if size < 1:
+        raise ValueError("Window size must be positive.")
+    _check_batch_size(batch_size)
+    parse = parse or _identity
+    partial = PartialSum[None]()
+    remaining = size
+    pending = batch_size
+    async for row in rows:
+        partial.add(None, parse(row))
+        remaining -= 1
+        if not remaining:
+            yield partial.resolve(registry).get(None, {})
+            partial = PartialSum[None]()
+            remaining = size
+        pending -= 1
+        if not pending:
+            pending = batch_size
+            await asyncio.sleep(0)
+    if remaining != size:
+        yield partial.resolve(registry).get(None, {})
+
+
+@overload
+def time_windows(
+    rows: AsyncIterable[tuple[float, Monetary]],
+    width: float,
+    parse: None = None,
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> AsyncIterator[tuple[float, dict[Currency, Monetary]]]: ...
+
+
+@overload
+def time_windows(
+    rows: AsyncIterable[T],
+    width: float,
+    parse: Callable[[T], tuple[float, Monetary]],
+    *,
+    batch_size: int = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> AsyncIterator[tuple[float, dict[Currency, Monetary]]]: ...
+
+
+async def time_windows(
+    rows: AsyncIterable[Any],
+    width: float,
+    parse: Callable[[Any], tuple[float, Monetary]] | None = None,
+    *,
+    batch_size: int = default_batch_size,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> AsyncIterator[tuple[float, dict[Currency, Monetary]]]:
+    """
+    Yield pairs of window start and totals per currency, of tumbling windows of
+    `width` seconds. Rows are pairs of timestamp and monetary value, and timestamps
+    must not decrease, so that a window is complete once a row of a later window
+    arrives. Windows without rows are skipped.
+
+    >>> import asyncio
+    >>> from immoney.currencies import SEK
+    >>> async def events():
+    ...     for timestamp, value in ((0.5, SEK(1)), (0.9, SEK(2)), (2.1, SEK(3))):
+    ...         yield timestamp, value
+    >>> async def windows():
+    ...     return [window async for window in time_windows(events(), 1.0)]
+    >>> asyncio.run(windows())
+    [(0.0, {Currency(code=SEK, subunit=100): Money('3.00', SEK)}), (2.0, {Currency(code=SEK, subunit=100): Money('3.00', SEK)})]
+    """
+    if width <= 0:
+        raise ValueError("Window width must be positive.")
+    _check_batch_size(batch_size)
+    parse = parse or _identity
+    partial = PartialSum[None]()
+    window: int | None = None
+    latest = -math.inf
+    pending = batch_size
+    async for row in rows:
+        timestamp, value = parse(row)
+        if timestamp < latest:
+            raise ValueError(
+                f"Timestamps must not decrease, got {timestamp} after {latest}."
+            )
+        latest = timestamp
+        index = math.floor(timestamp / width)
+        if index != window:
+            if window is not None:
+                yield window * width, partial.resolve(registry).get(None, {})
+                partial = PartialSum[None]()
+            window = index
+        partial.add(None, value)
+        pending -= 1
+        if not pending:
+            pending = batch_size
+            await asyncio.sleep(0)
+    if window is not None:
+        yield window * width, partial.resolve(registry).get(None, {})
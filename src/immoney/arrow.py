@@ -0,0 +1,175 @@
+"""
+Apache Arrow extension type for Money and Overdraft values.
+
+Values are stored as a struct of signed int64 subunits, where negative values are
+overdrafts, and a dictionary-encoded currency code.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+from typing import Final
+from typing import cast
+
+import numpy as np
+import pyarrow as pa
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from .currencies import registry as default_registry
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "MoneyType",
+    "MoneyScalar",
+    "storage_type",
+    "to_arrow",
+    "from_arrow",
+)
+
+extension_name: Final = "immoney.money"
+storage_type: Final = pa.struct(
+    [
+        pa.field("subunits", pa.int64(), nullable=False),
+        pa.field("currency", pa.dictionary(pa.int32(), pa.string())),
+    ]
+)
+
+
+class MoneyScalar(pa.ExtensionScalar):
+    def as_py(self, **kwargs: Any) -> Money[Currency] | Overdraft[Currency] | None:
+        if not self.is_valid:
+            return None
+        storage = cast(pa.StructScalar, self.value)
+        currency = default_registry[storage["currency"].as_py()]
+        return _dispatch_type(storage["subunits"].as_py(), currency)
+
+
+class MoneyType(pa.ExtensionType):
+    def __init__(self) -> None:
+        super().__init__(storage_type, extension_name)
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(
+        cls,
+        storage_type: pa.DataType,
+        serialized: bytes,
+    ) -> MoneyType:
+        return cls()
+
+    def __arrow_ext_scalar_class__(self) -> type[MoneyScalar]:
+        return MoneyScalar
+
+    def to_pandas_dtype(self) -> Any:
+        from .pandas import MoneyDtype
+
+        return MoneyDtype()
+
+
+# The stubs wrongly require the deprecated PyExtensionType here.
+pa.register_extension_type(MoneyType())  # type: ignore[arg-type]
+
+
+def to_arrow(
+    values: Iterable[Money[Currency] | Overdraft[Currency] | None],
+) -> pa.ExtensionArray[Any]:
+    """
+    Build an Arrow array of the money extension type, None values become nulls.
+    """
+    subunits = list[int]()
+    codes = list[int]()
+    valid = list[bool]()
+    code_indices = dict[str, int]()
+    for value in values:
+        if value is None:
+            subunits.append(0)
+            codes.append(0)
+            valid.append(False)
+            continue
+        subunits.append(_signed_subunits(value))
+        codes.append(code_indices.setdefault(value.currency.code, len(code_indices)))
+        valid.append(True)
+    return build_array(subunits, codes, list(code_indices), valid)
+
+
+def build_array(
+    subunits: Any,
+    codes: Any,
+    dictionary: list[str],
+    valid: Any,
+) -> pa.ExtensionArray[Any]:
+    """
+    Build an Arrow array of the money extension type from a sequence of signed
+    subunits, indices into a dictionary of currency codes, and a validity mask.
+    """
+    mask = np.logical_not(valid)
+    storage = pa.StructArray.from_arrays(
+        [
+            pa.array(subunits, type=pa.int64()),
+            pa.DictionaryArray.from_arrays(
+                # Indices of missing values are masked, as they may be out of range
+                # of the dictionary.
+                pa.array(codes, type=pa.int32(), mask=mask),
+                pa.array(dictionary, type=pa.string()),
+            ),
+        ],
+        fields=list(storage_type),
+        mask=pa.array(mask, type=pa.bool_()),
+    )
+    return pa.ExtensionArray.from_storage(MoneyType(), storage)
+
+
+def _columns(
+    array: pa.Array[Any],
+) -> tuple[pa.Int64Array, pa.Int32Array, list[str], pa.BooleanArray]:
+    """
+    Return the subunits, currency indices, currency codes and validity of an array of
+    the money extension type.
+    """
+    if isinstance(array, pa.ExtensionArray):
+        array = array.storage
+    if not isinstance(array, pa.StructArray) or array.type != storage_type:
+        raise TypeError(
+            f"Expected an array of the money extension type, got {array.type}."
+        )
+    currency = cast("pa.DictionaryArray[Any, Any]", array.field("currency"))
+    return (
+        cast(pa.Int64Array, array.field("subunits")),
+        cast(pa.Int32Array, currency.indices),
+        cast("list[str]", currency.dictionary.to_pylist()),
+        array.is_valid(),
+    )
+
+
+def from_arrow(
+    array: pa.Array[Any] | pa.ChunkedArray[Any],
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> list[Money[Currency] | Overdraft[Currency] | None]:
+    """
+    Convert an Arrow array of the money extension type into Money and Overdraft
+    instances, and None for nulls.
+    """
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    result = list[Money[Currency] | Overdraft[Currency] | None]()
+    for chunk in chunks:
+        subunits, indices, codes, valid = _columns(chunk)
+        currencies = [registry[code] for code in codes]
+        result.extend(
+            _dispatch_type(value, currencies[index])
+            if value is not None and index is not None and is_valid
+            else None
+            for value, index, is_valid in zip(
+                subunits.to_pylist(),
+                indices.to_pylist(),
+                valid.to_pylist(),
+                strict=True,
+            )
+        )
+    return result
@@ -0,0 +1,264 @@
+"""
+Compact binary encoding of Money and Overdraft values.
+
+Each value is encoded as a fixed-width record of a little-endian unsigned 16-bit
+currency id followed by signed 64-bit subunits, where negative values are overdrafts.
+Currency ids are resolved through a CurrencyIndex. By default, ids are derived from the
+three letters of currency codes, so they don't depend on the currencies of a registry,
+and data encoded with one version of immoney decodes to the same currencies with
+another. Indexes with explicit codes use positions in the given sequence instead, which
+must then be the same when encoding and decoding.
+
+Values that don't fit in 64 bits are escaped by setting the high bit of the currency
+id. The subunits field then holds the byte length of a signed little-endian integer
+that immediately follows the record. Buffers without escaped values are plain arrays of
+fixed-width records.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Final
+from typing import TypeAlias
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from ._base import int64_max
+from ._base import int64_min
+from .currencies import registry as default_registry
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "record",
+    "escape",
+    "code_id",
+    "CurrencyIndex",
+    "pack",
+    "pack_into",
+    "pack_many",
+    "packed_size",
+    "unpack",
+    "unpack_from",
+    "iter_unpack",
+)
+
+Buffer: TypeAlias = bytes | bytearray | memoryview
+
+record: Final = struct.Struct("<Hq")
+escape: Final = 0x8000
+max_currencies: Final = escape
+
+
+def code_id(code: str) -> int:
+    """
+    Return the stable id of a currency code of three ASCII uppercase letters, which is
+    the value of the letters as digits in base 26.
+
+    >>> code_id("AAA"), code_id("SEK")
+    (0, 12282)
+    """
+    if len(code) != 3 or not (code.isascii() and code.isalpha() and code.isupper()):
+        raise ValueError(
+            f"Cannot derive a stable id from currency code {code!r}, pass explicit "
+            f"codes to CurrencyIndex instead."
+        )
+    first, second, third = (ord(letter) - ord("A") for letter in code)
+    return (first * 26 + second) * 26 + third
+
+
+class CurrencyIndex:
+    """
+    Bidirectional mapping between currencies and integer ids. Unless codes are given
+    explicitly, the index holds all currencies of the registry, with stable ids derived
+    from their codes by code_id(). With explicit codes, ids are positions in the given
+    sequence, and `codes` must be persisted alongside encoded data to decode it, as
+    immoney.ledger does.
+
+    >>> from immoney.currencies import SEK
+    >>> CurrencyIndex().id_of(SEK)
+    12282
+    >>> index = CurrencyIndex(codes=["SEK", "NOK"])
+    >>> index.id_of(index[1])
+    1
+    """
+
+    __slots__ = ("codes", "_currencies", "_ids")
+
+    def __init__(
+        self,
+        registry: CurrencyRegistry[Currency] = default_registry,
+        codes: Sequence[str] | None = None,
+    ) -> None:
+        self.codes: Final = tuple(sorted(registry) if codes is None else codes)
+        if codes is None:
+            ids = [code_id(code) for code in self.codes]
+        elif len(self.codes) > max_currencies:
+            raise ValueError(
+                f"Cannot index more than {max_currencies} currencies, got "
+                f"{len(self.codes)}."
+            )
+        else:
+            ids = list(range(len(self.codes)))
+        self._currencies: Final = {
+            id_: registry[code] for id_, code in zip(ids, self.codes, strict=True)
+        }
+        self._ids: Final = {currency: id_ for id_, currency in self._currencies.items()}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, id_: int) -> Currency:
+        try:
+            return self._currencies[id_]
+        except KeyError:
+            raise ParseError(f"Unknown currency id {id_}.") from None
+
+    def id_of(self, currency: Currency) -> int:
+        try:
+            return self._ids[currency]
+        except KeyError:
+            raise KeyError(f"Currency {currency!s} is not in the index.") from None
+
+
+default_index: Final = CurrencyIndex()
+
+
+def _big_int_length(subunits: int) -> int:
+    # One extra bit for the sign.
+    return (subunits.bit_length() + 8) // 8
+
+
+def packed_size(value: Money[Currency] | Overdraft[Currency]) -> int:
+    """
+    Return the number of bytes needed to encode the given value.
+    """
+    subunits = _signed_subunits(value)
+    if int64_min <= subunits <= int64_max:
+        return record.size
+    return record.size + _big_int_length(subunits)
+
+
+def pack_into(
+    buffer: bytearray | memoryview,
+    offset: int,
+    value: Money[Currency] | Overdraft[Currency],
+    index: CurrencyIndex = default_index,
+) -> int:
+    """
+    Encode a value into a writable buffer at the given offset, and return the offset
+    following the written bytes.
+    """
+    id_ = index.id_of(value.currency)
+    subunits = _signed_subunits(value)
+    if int64_min <= subunits <= int64_max:
+        record.pack_into(buffer, offset, id_, subunits)
+        return offset + record.size
+    length = _big_int_length(subunits)
+    record.pack_into(buffer, offset, id_ | escape, length)
+    offset += record.size
+    buffer[offset : offset + length] = subunits.to_bytes(length, "little", signed=True)
+    return offset + length
+
+
+def pack(
+    value: Money[Currency] | Overdraft[Currency],
+    index: CurrencyIndex = default_index,
+) -> bytes:
+    """
+    Encode a single value.
+
+    >>> from immoney.currencies import SEK
+    >>> unpack(pack(SEK.overdraft("1.50")))
+    Overdraft('1.50', SEK)
+    """
+    buffer = bytearray(packed_size(value))
+    pack_into(buffer, 0, value, index)
+    return bytes(buffer)
+
+
+def pack_many(
+    values: Iterable[Money[Currency] | Overdraft[Currency]],
+    index: CurrencyIndex = default_index,
+) -> bytearray:
+    """
+    Encode values into a contiguous buffer of records.
+    """
+    buffer = bytearray()
+    pack_record = record.pack
+    id_of = index.id_of
+    for value in values:
+        subunits = _signed_subunits(value)
+        if int64_min <= subunits <= int64_max:
+            buffer += pack_record(id_of(value.currency), subunits)
+        else:
+            buffer += pack(value, index)
+    return buffer
+
+
+def unpack_from(
+    buffer: Buffer,
+    offset: int = 0,
+    index: CurrencyIndex = default_index,
+) -> tuple[Money[Currency] | Overdraft[Currency], int]:
+    """
+    Decode a value at the given offset of a buffer, and return it together with the
+    offset following its encoding. The buffer is never copied.
+    """
+    try:
+        id_, subunits = record.unpack_from(buffer, offset)
+    except struct.error as exception:
+        raise ParseError(f"Truncated record at offset {offset}.") from exception
+    offset += record.size
+    if id_ & escape:
+        end = offset + subunits
+        if subunits <= 0 or end > memoryview(buffer).nbytes:
+            raise ParseError(f"Truncated integer at offset {offset}.")
+        subunits = int.from_bytes(memoryview(buffer)[offset:end], "little", signed=True)
+        return _dispatch_type(subunits, index[id_ ^ escape]), end
+    return _dispatch_type(subunits, index[id_]), offset
+
+
+def unpack(
+    buffer: Buffer,
+    index: CurrencyIndex = default_index,
+) -> Money[Currency] | Overdraft[Currency]:
+    """
+    Decode a buffer holding exactly one encoded value.
+    """
+    value, end = unpack_from(buffer, 0, index)
+    if end != memoryview(buffer).nbytes:
+        raise ParseError(f"Unexpected trailing data after offset {end}.")
+    return value
+
+
+def iter_unpack(
+    buffer: Buffer,
+    index: CurrencyIndex = default_index,
+) -> Iterator[Money[Currency] | Overdraft[Currency]]:
+    """
+    Lazily decode all values of a buffer produced by pack_many(). The buffer is never
+    copied.
+    """
+    offset = 0
+    size = memoryview(buffer).nbytes
+    unpack_record = record.unpack_from
+    currency_of = index._currencies.get
+    while offset < size:
+        if size - offset < record.size:
+            raise ParseError(f"Truncated record at offset {offset}.")
+        id_, subunits = unpack_record(buffer, offset)
+        currency = currency_of(id_)
+        if currency is None:
+            # Escaped values and unknown ids are left to unpack_from().
+            value, offset = unpack_from(buffer, offset, index)
+            yield value
+            continue
+        offset += record.size
+        yield _dispatch_type(subunits, currency)
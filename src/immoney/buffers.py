@@ -0,0 +1,152 @@
+"""
+Parsing of monetary values from ASCII amounts in bytes, bytearray, and memoryview
+buffers.
+
+Amounts have the same format as when parsing from str, e.g. b"12.50". Plain amounts
+of ASCII digits with an optional fractional part are converted to subunits with integer
+arithmetic, without decoding to str or creating a Decimal. Any other amount is parsed
+exactly like the decoded str, so errors and precision-loss semantics are the same as
+for Money("12.50", SEK).
+
+>>> from immoney.currencies import SEK
+>>> parse_money(b"12.50", SEK)
+Money('12.50', SEK)
+>>> parse_money_many(memoryview(b"1.50;2;0.01"), SEK, delimiter=b";")
+[Money('1.50', SEK), Money('2.00', SEK), Money('0.01', SEK)]
+"""
+
+from __future__ import annotations
+
+from typing import Final
+from typing import TypeAlias
+
+from ._base import C_inv
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from .errors import ParseError
+
+__all__ = (
+    "BytesLike",
+    "parse_subunits",
+    "parse_money",
+    "parse_overdraft",
+    "parse_subunits_many",
+    "parse_money_many",
+    "parse_overdraft_many",
+)
+
+BytesLike: TypeAlias = bytes | bytearray | memoryview
+
+# Decimal arithmetic is rounded to 28 significant digits with the default context, so
+# longer amounts are left to the Decimal parser, which keeps results identical.
+_max_digits: Final = 28
+_powers_of_ten: Final[tuple[int, ...]] = tuple(
+    10**exponent for exponent in range(_max_digits + 1)
+)
+
+
+def _fast_subunits(data: bytes | bytearray, currency: Currency) -> int | None:
+    dot = data.find(b".")
+    if dot < 0:
+        digits, fraction_length = data, 0
+    else:
+        digits, fraction_length = data[:dot] + data[dot + 1 :], len(data) - dot - 1
+    width = currency.subunit_width
+    # isdigit() only accepts ASCII digits, and is false for empty amounts.
+    if not digits.isdigit() or len(digits) + width > _max_digits:
+        return None
+    value = int(digits)
+    if fraction_length <= width:
+        return value * _powers_of_ten[width - fraction_length]
+    subunits, remainder = divmod(value, _powers_of_ten[fraction_length - width])
+    # Inexact amounts are left to the Decimal parser to raise an error.
+    return None if remainder else subunits
+
+
+def _subunits(data: bytes | bytearray, currency: Currency) -> int:
+    subunits = _fast_subunits(data, currency)
+    if subunits is not None:
+        return subunits
+    try:
+        text = data.decode("ascii")
+    except UnicodeDecodeError as exception:
+        raise ParseError("Could not parse Money from the given bytes") from exception
+    return currency.normalize_to_subunits(text)
+
+
+def _bytes(data: BytesLike) -> bytes | bytearray:
+    return bytes(data) if isinstance(data, memoryview) else data
+
+
+def parse_subunits(data: BytesLike, currency: Currency) -> int:
+    """
+    Parse an amount of the main unit of the currency into subunits.
+
+    >>> from immoney.currencies import SEK
+    >>> parse_subunits(bytearray(b"1.5"), SEK)
+    150
+    """
+    return _subunits(_bytes(data), currency)
+
+
+def parse_money(data: BytesLike, currency: C_inv) -> Money[C_inv]:
+    return currency.from_subunit(_subunits(_bytes(data), currency))
+
+
+def parse_overdraft(data: BytesLike, currency: C_inv) -> Overdraft[C_inv]:
+    """
+    Parse the positive amount of an overdraft.
+    """
+    return currency.overdraft_from_subunit(_subunits(_bytes(data), currency))
+
+
+def parse_subunits_many(
+    buffer: BytesLike,
+    currency: Currency,
+    delimiter: bytes = b",",
+) -> list[int]:
+    """
+    Parse delimited amounts into subunits. The buffer is split into bytes fields,
+    which are only decoded to str for amounts outside of the integer fast path. An
+    empty buffer has no fields, otherwise every field must be a valid amount.
+
+    >>> from immoney.currencies import SEK
+    >>> parse_subunits_many(b"1.50,2", SEK)
+    [150, 200]
+    """
+    if not delimiter:
+        raise ValueError("Delimiter must not be empty.")
+    if not buffer:
+        return []
+    return [_subunits(field, currency) for field in _bytes(buffer).split(delimiter)]
+
+
+def parse_money_many(
+    buffer: BytesLike,
+    currency: C_inv,
+    delimiter: bytes = b",",
+) -> list[Money[C_inv]]:
+    """
+    Parse delimited amounts into Money. See parse_subunits_many().
+    """
+    from_subunit = currency.from_subunit
+    return [
+        from_subunit(subunits)
+        for subunits in parse_subunits_many(buffer, currency, delimiter)
+    ]
+
+
+def parse_overdraft_many(
+    buffer: BytesLike,
+    currency: C_inv,
+    delimiter: bytes = b",",
+) -> list[Overdraft[C_inv]]:
+    """
+    Parse delimited positive amounts into Overdraft. See parse_subunits_many().
+    """
+    from_subunit = currency.overdraft_from_subunit
+    return [
+        from_subunit(subunits)
+        for subunits in parse_subunits_many(buffer, currency, delimiter)
+    ]
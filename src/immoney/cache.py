@@ -0,0 +1,217 @@
+"""
+Warm-up, snapshots, and sizing of the instance cache.
+
+The instance cache shared by Money, Overdraft, and SubunitFraction starts out empty in
+every process, so commonly used values are instantiated again after a restart. This
+module records the keys of created instances, and exports those of recently created
+instances as entries of class name, currency code, and value. It populates the cache
+from such entries at startup, either from an iterable or from a snapshot file.
+Recording adds to the cost of every cache miss, and so is only done once enabled with
+record().
+
+Snapshot files are UTF-8 text with an entry per line, with fields separated by spaces,
+e.g. "Money SEK 150". Values are in subunits, and are fractions of subunits for
+SubunitFraction. Entries are ordered from least to most recently created, so warming
+from a snapshot restores the recency order of the cache as well.
+
+>>> from immoney.currencies import SEK
+>>> resize(16)
+>>> record(True)
+>>> _ = SEK("1.50"), SEK.overdraft(2), SEK.fraction(1, 3)
+>>> entries()
+[('Money', 'SEK', '150'), ('Overdraft', 'SEK', '200'), ('SubunitFraction', 'SEK', '1/3')]
+>>> record(False)
+>>> resize(16)
+>>> warm([("Money", "SEK", "150")])
+1
+>>> _ = SEK("1.50")
+>>> cache_info().hits
+1
+>>> resize(default_maxsize)
+
+Per-class and per-currency hit counts are available through immoney.instrumentation.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from collections.abc import Iterator
+from fractions import Fraction
+from typing import Final
+from typing import NamedTuple
+from typing import TypeAlias
+
+from . import _cache
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._cache import InstanceCache
+from ._cache import default_maxsize
+from ._cache import record
+from ._cache import resize
+from .currencies import registry as default_registry
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "Entry",
+    "CacheInfo",
+    "default_maxsize",
+    "resize",
+    "record",
+    "cache_info",
+    "hit_rate",
+    "entries",
+    "warm",
+    "dump",
+    "read",
+    "warm_from_file",
+)
+
+Entry: TypeAlias = tuple[str, str, str]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+_monetary_types: Final[dict[str, InstanceCache]] = {
+    Money.__qualname__: Money,
+    Overdraft.__qualname__: Overdraft,
+    SubunitFraction.__qualname__: SubunitFraction,
+}
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return the hits, misses, and size of the instance cache, see
+    functools.lru_cache(). Hits include Money instances returned from the preallocated
+    instances of currencies.
+    """
+    info = InstanceCache._instantiate.cache_info()
+    return CacheInfo(
+        hits=info.hits + _cache.preallocated_hits,
+        misses=info.misses,
+        maxsize=info.maxsize,
+        currsize=info.currsize,
+    )
+
+
+def hit_rate(since: CacheInfo | None = None) -> float:
+    """
+    Return the ratio of instantiations that were cache hits, counting only those after
+    the `since` cache info was taken, if given. Zero if there were no instantiations.
+    Resizing resets the counts, so `since` should be taken after the last resize. Counts
+    are clamped at zero otherwise, which makes the result meaningless but never negative.
+    """
+    info = cache_info()
+    hits, misses = info.hits, info.misses
+    if since is not None:
+        hits = max(hits - since.hits, 0)
+        misses = max(misses - since.misses, 0)
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+def entries() -> list[Entry]:
+    """
+    Return entries of recently created instances of monetary values, from least to
+    most recently created. Instances of other cached classes are left out. Raises
+    ValueError unless recording is enabled.
+    """
+    if _cache.recent is None:
+        raise ValueError("Created instances are not recorded, enable with record().")
+    result = dict[Entry, None]()
+    for cls, (value, currency) in _cache.recent:
+        if cls not in (Money, Overdraft, SubunitFraction):
+            continue
+        assert isinstance(currency, Currency)
+        entry = cls.__qualname__, currency.code, str(value)
+        # Moving repeated entries to the end keeps the most recent position.
+        result.pop(entry, None)
+        result[entry] = None
+    return list(result)
+
+
+def _instantiate(
+    entry: Entry | Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency],
+    registry: CurrencyRegistry[Currency],
+) -> None:
+    if isinstance(entry, Money | Overdraft):
+        type(entry)(subunits=entry.subunits, currency=entry.currency)
+        return
+    if isinstance(entry, SubunitFraction):
+        SubunitFraction(entry.value, entry.currency)
+        return
+    name, code, value = entry
+    try:
+        cls = _monetary_types[name]
+        currency = registry[code]
+        if cls is SubunitFraction:
+            SubunitFraction(Fraction(value), currency)
+        else:
+            cls(subunits=int(value), currency=currency)
+    except (KeyError, ValueError, ZeroDivisionError) as exception:
+        raise ParseError(f"Invalid cache entry: {entry!r}") from exception
+
+
+def warm(
+    values: Iterable[
+        Entry | Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]
+    ],
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> int:
+    """
+    Instantiate entries, or monetary values, through the instance cache, and return
+    their number. Values are instantiated in order, so the last values are the last
+    to be evicted. Raises ParseError for invalid entries.
+    """
+    count = 0
+    for value in values:
+        _instantiate(value, registry)
+        count += 1
+    return count
+
+
+def dump(path: str | os.PathLike[str], values: Iterable[Entry] | None = None) -> int:
+    """
+    Write entries, by default those of recently created instances, to a snapshot file
+    and return their number.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for entry in entries() if values is None else values:
+            file.write(" ".join(entry) + "\n")
+            count += 1
+    return count
+
+
+def read(path: str | os.PathLike[str]) -> Iterator[Entry]:
+    """
+    Lazily read the entries of a snapshot file. Empty lines are skipped.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            fields = line.split()
+            if not fields:
+                continue
+            if len(fields) != 3:
+                raise ParseError(f"Invalid cache entry: {line!r}")
+            name, code, value = fields
+            yield name, code, value
+
+
+def warm_from_file(
+    path: str | os.PathLike[str],
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> int:
+    """
+    Instantiate the entries of a snapshot file through the instance cache, and return
+    their number.
+    """
+    return warm(read(path), registry)
@@ -14,3 +14,9 @@ class InvalidSubunit(ImmoneyError, ValueError): ...
 
 
 class DivisionByZero(ImmoneyError, ZeroDivisionError): ...
+
+
+class CurrencyMismatch(ImmoneyError, ValueError): ...
+
+
+class UnbalancedEntry(ImmoneyError, ValueError): ...
@@ -0,0 +1,372 @@
+"""
+Lazily evaluated arithmetic over monetary values, rounded once at the end.
+
+Arithmetic on Variable and other expressions builds an expression tree instead of
+computing intermediate values. Evaluation works on plain numerator and denominator
+integers, without creating an instance of SubunitFraction, or normalizing, for every
+step. Monetary values of the same currency can be added and subtracted, and multiplied
+or divided by scalars: int, Fraction, Decimal, and Rate.
+
+>>> from decimal import Decimal
+>>> from immoney import Round
+>>> from immoney.currencies import SEK
+>>> price = Variable("price")
+>>> quantity = Variable("quantity")
+>>> total = (price * quantity - SEK(5)) * Decimal("1.25")
+>>> total.evaluate(price=SEK("9.99"), quantity=3)
+SubunitFraction('12485/4', SEK)
+>>> total.round(Round.HALF_UP, price=SEK("9.99"), quantity=3)
+Money('31.21', SEK)
+
+Expressions can be compiled once and evaluated against many rows of values.
+
+>>> compiled = total.compile()
+>>> compiled.round_many(
+...     [{"price": SEK(10), "quantity": 1}, {"price": SEK(1), "quantity": 1}],
+...     Round.DOWN,
+... )
+[Money('6.25', SEK), Overdraft('5.00', SEK)]
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from decimal import Decimal
+from fractions import Fraction
+from typing import Final
+from typing import TypeAlias
+from typing import final
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import Round
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _round_ratio
+from ._base import _signed_subunits
+from ._frozen import Frozen
+from ._rate import Rate
+from .errors import CurrencyMismatch
+from .errors import DivisionByZero
+
+__all__ = (
+    "Value",
+    "Operand",
+    "Expression",
+    "Variable",
+    "Constant",
+    "CompiledExpression",
+)
+
+Value: TypeAlias = (
+    Money[Currency]
+    | Overdraft[Currency]
+    | SubunitFraction[Currency]
+    | Rate
+    | int
+    | Fraction
+    | Decimal
+)
+Operand: TypeAlias = "Expression | Value"
+
+# Intermediate results are a numerator, a positive denominator, and the currency of
+# monetary values, or None for scalars. Monetary values are counted in subunits.
+_Exact: TypeAlias = tuple[int, int, Currency | None]
+_Evaluator: TypeAlias = Callable[[Mapping[str, Value]], _Exact]
+
+
+def _exact(value: Value) -> _Exact:
+    if isinstance(value, Money | Overdraft):
+        return _signed_subunits(value), 1, value.currency
+    if isinstance(value, SubunitFraction):
+        return value.value.numerator, value.value.denominator, value.currency
+    if isinstance(value, Rate):
+        return value.numerator, value.denominator, None
+    if isinstance(value, int):
+        return value, 1, None
+    if isinstance(value, Fraction | Decimal):
+        numerator, denominator = value.as_integer_ratio()
+        return numerator, denominator, None
+    raise TypeError(f"Cannot use value of type {type(value).__qualname__!r}.")
+
+
+def _add(a: _Exact, b: _Exact) -> _Exact:
+    a_numerator, a_denominator, currency = a
+    b_numerator, b_denominator, b_currency = b
+    if currency is not b_currency:
+        if currency is None or b_currency is None:
+            raise TypeError("Cannot add monetary values and scalars.")
+        raise CurrencyMismatch("Cannot add values of different currencies.")
+    # Sums of values with a common denominator, such as whole subunits or decimals
+    # with the same exponent, are folded without growing the denominator.
+    if a_denominator == b_denominator:
+        return a_numerator + b_numerator, a_denominator, currency
+    return (
+        a_numerator * b_denominator + b_numerator * a_denominator,
+        a_denominator * b_denominator,
+        currency,
+    )
+
+
+def _subtract(a: _Exact, b: _Exact) -> _Exact:
+    return _add(a, (-b[0], b[1], b[2]))
+
+
+def _multiply(a: _Exact, b: _Exact) -> _Exact:
+    a_numerator, a_denominator, currency = a
+    b_numerator, b_denominator, b_currency = b
+    if currency is not None and b_currency is not None:
+        raise TypeError("Cannot multiply monetary values with each other.")
+    return (
+        a_numerator * b_numerator,
+        a_denominator * b_denominator,
+        b_currency if currency is None else currency,
+    )
+
+
+def _divide(a: _Exact, b: _Exact) -> _Exact:
+    a_numerator, a_denominator, currency = a
+    b_numerator, b_denominator, b_currency = b
+    if b_currency is not None:
+        raise TypeError("Cannot divide by a monetary value.")
+    if b_numerator == 0:
+        raise DivisionByZero
+    if b_numerator < 0:
+        return -a_numerator * b_denominator, a_denominator * -b_numerator, currency
+    return a_numerator * b_denominator, a_denominator * b_numerator, currency
+
+
+_operations: Final[Mapping[str, Callable[[_Exact, _Exact], _Exact]]] = {
+    "+": _add,
+    "-": _subtract,
+    "*": _multiply,
+    "/": _divide,
+}
+
+
+def _result(exact: _Exact) -> SubunitFraction[Currency] | Fraction:
+    numerator, denominator, currency = exact
+    fraction = Fraction(numerator, denominator)
+    return fraction if currency is None else SubunitFraction(fraction, currency)
+
+
+def _round(exact: _Exact, rounding: Round) -> Money[Currency] | Overdraft[Currency]:
+    numerator, denominator, currency = exact
+    if currency is None:
+        raise TypeError("Cannot round a scalar result to a monetary value.")
+    return _dispatch_type(_round_ratio(numerator, denominator, rounding), currency)
+
+
+def _wrap(operand: Operand) -> Expression:
+    return operand if isinstance(operand, Expression) else Constant(operand)
+
+
+class Expression(Frozen, abc.ABC):
+    """
+    Base class of expression nodes. Expressions are immutable, and are combined with
+    the operators +, -, * and /.
+    """
+
+    __slots__ = ("_compiled",)
+
+    _compiled: CompiledExpression
+
+    @abc.abstractmethod
+    def _evaluator(self) -> _Evaluator: ...
+
+    @property
+    @abc.abstractmethod
+    def variables(self) -> frozenset[str]:
+        """The names of all variables in the expression."""
+
+    def compile(self) -> CompiledExpression:
+        """
+        Compile the expression into nested closures that can be evaluated repeatedly.
+        The result is cached on the expression.
+        """
+        try:
+            return self._compiled
+        except AttributeError:
+            compiled = CompiledExpression(self)
+            object.__setattr__(self, "_compiled", compiled)
+            return compiled
+
+    def evaluate(self, **values: Value) -> SubunitFraction[Currency] | Fraction:
+        """
+        Evaluate the expression exactly. Returns a SubunitFraction for monetary
+        expressions, and a Fraction for scalar expressions.
+        """
+        return self.compile().evaluate(values)
+
+    def round(
+        self,
+        rounding: Round,
+        **values: Value,
+    ) -> Money[Currency] | Overdraft[Currency]:
+        """
+        Evaluate the expression exactly, and round the result once.
+        """
+        return self.compile().round(values, rounding)
+
+    def __add__(self, other: Operand) -> Expression:
+        return _Operation("+", self, _wrap(other))
+
+    def __radd__(self, other: Value) -> Expression:
+        return _Operation("+", Constant(other), self)
+
+    def __sub__(self, other: Operand) -> Expression:
+        return _Operation("-", self, _wrap(other))
+
+    def __rsub__(self, other: Value) -> Expression:
+        return _Operation("-", Constant(other), self)
+
+    def __mul__(self, other: Operand) -> Expression:
+        return _Operation("*", self, _wrap(other))
+
+    def __rmul__(self, other: Value) -> Expression:
+        return _Operation("*", Constant(other), self)
+
+    def __truediv__(self, other: Operand) -> Expression:
+        return _Operation("/", self, _wrap(other))
+
+    def __rtruediv__(self, other: Value) -> Expression:
+        return _Operation("/", Constant(other), self)
+
+    def __neg__(self) -> Expression:
+        return _Operation("*", Constant(-1), self)
+
+    def __pos__(self) -> Expression:
+        return self
+
+
+@final
+class Variable(Expression):
+    """
+    A named placeholder, bound to a value on evaluation.
+    """
+
+    __slots__ = ("name",)
+
+    name: str
+
+    def __init__(self, name: str) -> None:
+        object.__setattr__(self, "name", name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({self.name!r})"
+
+    @property
+    def variables(self) -> frozenset[str]:
+        return frozenset((self.name,))
+
+    def _evaluator(self) -> _Evaluator:
+        name = self.name
+        return lambda values: _exact(values[name])
+
+
+@final
+class Constant(Expression):
+    """
+    A fixed value. Values used as operands of expressions are wrapped in Constant
+    automatically.
+    """
+
+    __slots__ = ("value", "_exact")
+
+    value: Value
+    _exact: _Exact
+
+    def __init__(self, value: Value) -> None:
+        # Converting eagerly makes invalid values fail when building the expression.
+        object.__setattr__(self, "_exact", _exact(value))
+        object.__setattr__(self, "value", value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({self.value!r})"
+
+    @property
+    def variables(self) -> frozenset[str]:
+        return frozenset()
+
+    def _evaluator(self) -> _Evaluator:
+        exact = self._exact
+        return lambda values: exact
+
+
+@final
+class _Operation(Expression):
+    __slots__ = ("operator", "left", "right")
+
+    operator: str
+    left: Expression
+    right: Expression
+
+    def __init__(self, operator: str, left: Expression, right: Expression) -> None:
+        object.__setattr__(self, "operator", operator)
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.operator} {self.right!r})"
+
+    @property
+    def variables(self) -> frozenset[str]:
+        return self.left.variables | self.right.variables
+
+    def _evaluator(self) -> _Evaluator:
+        operation = _operations[self.operator]
+        if isinstance(self.left, Constant) and isinstance(self.right, Constant):
+            exact = operation(self.left._exact, self.right._exact)
+            return lambda values: exact
+        left = self.left._evaluator()
+        right = self.right._evaluator()
+        return lambda values: operation(left(values), right(values))
+
+
+@final
+class CompiledExpression:
+    """
+    An expression prepared for repeated evaluation. Values are passed as mappings
+    from variable names, such as rows of csv.DictReader.
+    """
+
+    __slots__ = ("expression", "variables", "_evaluate")
+
+    def __init__(self, expression: Expression) -> None:
+        self.expression: Final = expression
+        self.variables: Final = expression.variables
+        self._evaluate: Final = expression._evaluator()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({self.expression!r})"
+
+    def evaluate(
+        self, values: Mapping[str, Value]
+    ) -> SubunitFraction[Currency] | Fraction:
+        return _result(self._evaluate(values))
+
+    def round(
+        self,
+        values: Mapping[str, Value],
+        rounding: Round,
+    ) -> Money[Currency] | Overdraft[Currency]:
+        return _round(self._evaluate(values), rounding)
+
+    def evaluate_many(
+        self,
+        rows: Iterable[Mapping[str, Value]],
+    ) -> list[SubunitFraction[Currency] | Fraction]:
+        evaluate = self._evaluate
+        return [_result(evaluate(values)) for values in rows]
+
+    def round_many(
+        self,
+        rows: Iterable[Mapping[str, Value]],
+        rounding: Round,
+    ) -> list[Money[Currency] | Overdraft[Currency]]:
+        evaluate = self._evaluate
+        return [_round(evaluate(values), rounding) for values in rows]
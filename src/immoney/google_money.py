@@ -0,0 +1,253 @@
+"""
+Conversion between monetary values and the google.type.Money message layout.
+
+A google.type.Money message holds a currency code, whole units, and nanos, which are
+billionths of a unit in the range [-999_999_999, 999_999_999] with the same sign as
+units. Conversions only use integer arithmetic, and never round: values that cannot be
+represented exactly raise an error instead.
+
+Message objects are read through the attributes `currency_code`, `units`, and `nanos`,
+so generated protobuf classes can be passed directly.
+
+>>> from immoney.currencies import SEK
+>>> from_google(UnitsNanos("SEK", -1, -500_000_000))
+Overdraft('1.50', SEK)
+>>> to_google(SEK("1.50"))
+UnitsNanos(currency_code='SEK', units=1, nanos=500000000)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from fractions import Fraction
+from typing import Final
+from typing import NamedTuple
+from typing import Protocol
+
+from typing_extensions import assert_never
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from .currencies import registry as default_registry
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "GoogleMoney",
+    "UnitsNanos",
+    "nanos_per_unit",
+    "from_units_nanos",
+    "fraction_from_units_nanos",
+    "to_units_nanos",
+    "from_google",
+    "fraction_from_google",
+    "to_google",
+    "from_google_many",
+    "to_google_many",
+)
+
+nanos_per_unit: Final = 1_000_000_000
+max_nanos: Final = nanos_per_unit - 1
+
+
+class GoogleMoney(Protocol):
+    @property
+    def currency_code(self) -> str: ...
+
+    @property
+    def units(self) -> int: ...
+
+    @property
+    def nanos(self) -> int: ...
+
+
+class UnitsNanos(NamedTuple):
+    currency_code: str
+    units: int
+    nanos: int
+
+
+def _total_nanos(units: int, nanos: int) -> int:
+    if not -max_nanos <= nanos <= max_nanos:
+        raise ParseError(f"Nanos must be within ±{max_nanos}, got {nanos}.")
+    if (units > 0 and nanos < 0) or (units < 0 and nanos > 0):
+        raise ParseError("Units and nanos must have the same sign.")
+    return units * nanos_per_unit + nanos
+
+
+def _precision_error(currency: Currency) -> ParseError:
+    return ParseError(
+        f"Cannot interpret value as Money of currency {currency.code!r} without "
+        f"loss of precision. Consider using fraction_from_units_nanos()."
+    )
+
+
+def _subunits(total_nanos: int, currency: Currency) -> int:
+    subunits, remainder = divmod(total_nanos * currency.subunit, nanos_per_unit)
+    if remainder:
+        raise _precision_error(currency)
+    return subunits
+
+
+def _split_nanos(total_nanos: int) -> tuple[int, int]:
+    # Truncate towards zero, so that units and nanos get the same sign.
+    units, nanos = divmod(abs(total_nanos), nanos_per_unit)
+    return (-units, -nanos) if total_nanos < 0 else (units, nanos)
+
+
+def from_units_nanos(
+    units: int,
+    nanos: int,
+    currency: Currency,
+) -> Money[Currency] | Overdraft[Currency]:
+    """
+    Convert units and nanos into Money, or Overdraft for negative amounts. Raises
+    ParseError for invalid nanos, and for amounts that are not a whole number of
+    subunits of the currency.
+    """
+    return _dispatch_type(_subunits(_total_nanos(units, nanos), currency), currency)
+
+
+def fraction_from_units_nanos(
+    units: int,
+    nanos: int,
+    currency: Currency,
+) -> SubunitFraction[Currency]:
+    """
+    Convert units and nanos into an exact SubunitFraction. Raises ParseError for
+    invalid nanos.
+
+    >>> from immoney.currencies import SEK
+    >>> fraction_from_units_nanos(0, 1, SEK)
+    SubunitFraction('1/10000000', SEK)
+    """
+    return SubunitFraction(
+        Fraction(_total_nanos(units, nanos) * currency.subunit, nanos_per_unit),
+        currency,
+    )
+
+
+def _signed_nanos(
+    value: Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency],
+) -> int:
+    if isinstance(value, Money | Overdraft):
+        numerator, denominator = _signed_subunits(value) * nanos_per_unit, 1
+    elif isinstance(value, SubunitFraction):
+        numerator = value.value.numerator * nanos_per_unit
+        denominator = value.value.denominator
+    else:
+        assert_never(value)
+    total_nanos, remainder = divmod(numerator, denominator * value.currency.subunit)
+    if remainder:
+        raise ValueError(f"Cannot represent {value!r} exactly in nanos.")
+    return total_nanos
+
+
+def to_units_nanos(
+    value: Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency],
+) -> tuple[int, int]:
+    """
+    Convert a value into units and nanos. Raises ValueError for values that are not a
+    whole number of nanos.
+
+    >>> from immoney.currencies import SEK
+    >>> to_units_nanos(SEK.overdraft("1.50"))
+    (-1, -500000000)
+    """
+    return _split_nanos(_signed_nanos(value))
+
+
+def _currency(code: str, registry: CurrencyRegistry[Currency]) -> Currency:
+    try:
+        return registry[code]
+    except KeyError:
+        raise ParseError(f"Unknown currency code: {code!r}.") from None
+
+
+def from_google(
+    message: GoogleMoney,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Money[Currency] | Overdraft[Currency]:
+    """
+    Convert a google.type.Money message into Money or Overdraft, resolving its
+    currency code through the given registry.
+    """
+    return from_units_nanos(
+        message.units,
+        message.nanos,
+        _currency(message.currency_code, registry),
+    )
+
+
+def fraction_from_google(
+    message: GoogleMoney,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> SubunitFraction[Currency]:
+    """
+    Convert a google.type.Money message into an exact SubunitFraction, resolving its
+    currency code through the given registry.
+    """
+    return fraction_from_units_nanos(
+        message.units,
+        message.nanos,
+        _currency(message.currency_code, registry),
+    )
+
+
+def to_google(
+    value: Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency],
+) -> UnitsNanos:
+    """
+    Convert a value into the fields of a google.type.Money message.
+    """
+    return UnitsNanos(value.currency.code, *to_units_nanos(value))
+
+
+def from_google_many(
+    messages: Iterable[GoogleMoney],
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> list[Money[Currency] | Overdraft[Currency]]:
+    """
+    Convert google.type.Money messages, such as a repeated protobuf field, into Money
+    and Overdraft values. Currency lookups and conversion factors are resolved once
+    per currency code.
+    """
+    # Maps currency codes to their currency and the number of nanos in a subunit, or
+    # None when a subunit isn't a whole number of nanos.
+    factors = dict[str, tuple[Currency, int | None]]()
+    values = list[Money[Currency] | Overdraft[Currency]]()
+    append = values.append
+    for message in messages:
+        code = message.currency_code
+        try:
+            currency, step = factors[code]
+        except KeyError:
+            currency = _currency(code, registry)
+            quotient, remainder = divmod(nanos_per_unit, currency.subunit)
+            step = None if remainder else quotient
+            factors[code] = currency, step
+        total_nanos = _total_nanos(message.units, message.nanos)
+        if step is None:
+            subunits = _subunits(total_nanos, currency)
+        else:
+            subunits, remainder = divmod(total_nanos, step)
+            if remainder:
+                raise _precision_error(currency)
+        append(_dispatch_type(subunits, currency))
+    return values
+
+
+def to_google_many(
+    values: Iterable[Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]],
+) -> list[UnitsNanos]:
+    """
+    Convert values into the fields of google.type.Money messages.
+    """
+    return [
+        UnitsNanos(value.currency.code, *_split_nanos(_signed_nanos(value)))
+        for value in values
+    ]
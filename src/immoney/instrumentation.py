@@ -0,0 +1,231 @@
+"""
+Opt-in counters for the internal events of immoney that matter for performance.
+
+Instrumentation is disabled by default. While disabled, no instrumentation code is
+executed at all: enabling it swaps in counting variants of the relevant methods, and
+disabling it restores the originals.
+"""
+
+from __future__ import annotations
+
+import enum
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from typing import Final
+from typing import TypeAlias
+
+from . import _cache
+from ._base import Currency
+from ._base import Money
+from ._base import Round
+from ._base import SubunitFraction
+from ._base import _PreallocatedCache
+from ._cache import InstanceCache
+from ._parsers import Nat
+
+__all__ = (
+    "Event",
+    "EventKey",
+    "Hook",
+    "enable",
+    "disable",
+    "is_enabled",
+    "instrumented",
+    "snapshot",
+    "reset",
+    "add_hook",
+    "remove_hook",
+)
+
+
+class Event(enum.Enum):
+    # A new instance was constructed, because it wasn't found in the instance cache.
+    INSTANTIATION = "instantiation"
+    # An existing instance was returned from the instance cache.
+    CACHE_HIT = "cache_hit"
+    # A main unit value was parsed through Decimal, rather than from an int.
+    DECIMAL_PARSE = "decimal_parse"
+    # A SubunitFraction was rounded to a whole number of subunits.
+    ROUND = "round"
+    # A Money instance was returned from the preallocated instances of its currency.
+    PREALLOCATED_HIT = "preallocated_hit"
+
+
+# Counts are keyed by event, the qualified name of the class the event occurred for,
+# and currency code.
+EventKey: TypeAlias = tuple[Event, str, str]
+Hook: TypeAlias = Callable[[Event, str, str], None]
+
+_counts: Final = Counter[EventKey]()
+_hooks: Final = list[Hook]()
+
+
+def _record(event: Event, type_name: str, currency_code: str) -> None:
+    _counts[event, type_name, currency_code] += 1
+    for hook in _hooks:
+        hook(event, type_name, currency_code)
+
+
+def _instantiate(cls: InstanceCache, normalized: tuple[object, ...]) -> Any:
+    instantiate = cls._instantiate
+    # Note that attributing hits like this is not thread-safe, concurrent
+    # instantiations might be counted towards the wrong event.
+    hits_before = instantiate.cache_info().hits
+    instance = instantiate(*normalized)
+    # Instances of classes without a currency, such as Rate, are counted with an
+    # empty currency code.
+    currency = normalized[-1]
+    _record(
+        (
+            Event.CACHE_HIT
+            if instantiate.cache_info().hits > hits_before
+            else Event.INSTANTIATION
+        ),
+        cls.__qualname__,
+        currency.code if isinstance(currency, Currency) else "",
+    )
+    return instance
+
+
+def _instrumented_call(cls: InstanceCache, *args: object, **kwargs: object) -> Any:
+    return _instantiate(cls, cls._normalize(*args, **kwargs))
+
+
+def _instrumented_preallocated_call(
+    cls: _PreallocatedCache,
+    *args: object,
+    **kwargs: object,
+) -> Any:
+    subunits, currency = cls._normalize(*args, **kwargs)
+    if _is_preallocated(subunits, currency):
+        _record(Event.PREALLOCATED_HIT, cls.__qualname__, currency.code)
+        _cache.preallocated_hits += 1
+        return currency._preallocated[subunits]
+    return _instantiate(cls, (subunits, currency))
+
+
+_normalize_to_subunits: Final = Currency.normalize_to_subunits
+
+
+def _instrumented_normalize_to_subunits(self: Currency, main_unit: object) -> Nat:
+    if not isinstance(main_unit, int):
+        _record(Event.DECIMAL_PARSE, Currency.__qualname__, self.code)
+    return _normalize_to_subunits(self, main_unit)
+
+
+_round_subunit: Final = SubunitFraction._round_subunit
+
+
+def _instrumented_round_subunit(
+    self: SubunitFraction[Currency],
+    rounding: Round,
+) -> int:
+    _record(Event.ROUND, SubunitFraction.__qualname__, self.currency.code)
+    return _round_subunit(self, rounding)
+
+
+def _is_preallocated(value: object, currency: Currency) -> bool:
+    return type(value) is int and 0 <= value < len(currency._preallocated)
+
+
+_currency_from_subunit: Final = Currency.from_subunit
+
+
+def _instrumented_currency_from_subunit(self: Currency, value: int) -> Money[Currency]:
+    if _is_preallocated(value, self):
+        _record(Event.PREALLOCATED_HIT, Money.__qualname__, self.code)
+    return _currency_from_subunit(self, value)
+
+
+_money_from_subunit: Final = vars(Money)["from_subunit"].__func__
+
+
+def _instrumented_money_from_subunit(
+    cls: type[Money[Currency]],
+    value: int,
+    currency: Currency,
+) -> Money[Currency]:
+    if isinstance(currency, Currency) and _is_preallocated(value, currency):
+        _record(Event.PREALLOCATED_HIT, cls.__qualname__, currency.code)
+    return _money_from_subunit(cls, value, currency)  # type: ignore[no-any-return]
+
+
+_patches: Final[tuple[tuple[type, str, object], ...]] = (
+    (InstanceCache, "__call__", _instrumented_call),
+    (_PreallocatedCache, "__call__", _instrumented_preallocated_call),
+    (Currency, "normalize_to_subunits", _instrumented_normalize_to_subunits),
+    (SubunitFraction, "_round_subunit", _instrumented_round_subunit),
+    (Currency, "from_subunit", _instrumented_currency_from_subunit),
+    (Money, "from_subunit", classmethod(_instrumented_money_from_subunit)),
+)
+_originals: Final = tuple(
+    (owner, name, vars(owner)[name]) for owner, name, _ in _patches
+)
+
+
+def is_enabled() -> bool:
+    return vars(InstanceCache)["__call__"] is _instrumented_call
+
+
+def enable() -> None:
+    """
+    Start counting events. Counts collected so far are kept, use reset() to clear them.
+    """
+    for owner, name, instrumented_function in _patches:
+        setattr(owner, name, instrumented_function)
+
+
+def disable() -> None:
+    """
+    Stop counting events, restoring the uninstrumented implementations.
+    """
+    for owner, name, original in _originals:
+        setattr(owner, name, original)
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """
+    Enable instrumentation for the duration of the context, restoring the previous
+    state on exit.
+    """
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> dict[EventKey, int]:
+    """
+    Return a copy of the counts collected so far.
+
+    >>> from immoney.currencies import SEK
+    >>> reset()
+    >>> with instrumented():
+    ...     _ = SEK("1.50")
+    >>> snapshot()[Event.DECIMAL_PARSE, "Currency", "SEK"]
+    1
+    """
+    return dict(_counts)
+
+
+def reset() -> None:
+    _counts.clear()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a callback that is invoked with the event, class name and currency code
+    of every recorded event, e.g. to forward counts into an external metrics system.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    _hooks.remove(hook)
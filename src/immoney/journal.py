@@ -0,0 +1,262 @@
+"""
+An in-memory, double-entry journal of postings of monetary values to named accounts.
+
+Entries consist of one or more postings, whose signed amounts must sum to zero per
+currency, with Money for debits and Overdraft for credits. Entries are validated before
+any posting is recorded, so an entry is either recorded as a whole or not at all.
+
+Postings are stored as columns of plain values, numbered by a sequence number in the
+order they were recorded. Balances per account and currency are kept as signed subunit
+integers, updated as entries are recorded, so reading the current balance of an
+account doesn't depend on the number of postings.
+
+>>> from immoney.currencies import SEK
+>>> journal = Journal()
+>>> journal.transfer("equity", "cash", SEK(100))
+0
+>>> journal.post([("groceries", SEK(30)), ("cash", SEK.overdraft(30))])
+1
+>>> journal.balance("cash", SEK)
+Money('70.00', SEK)
+>>> journal.balance("equity", SEK)
+Overdraft('100.00', SEK)
+>>> [posting.account for posting in journal.postings(start=2)]
+['groceries', 'cash']
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Final
+from typing import NamedTuple
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from .errors import UnbalancedEntry
+
+__all__ = (
+    "Posting",
+    "Journal",
+)
+
+
+class Posting(NamedTuple):
+    sequence: int
+    entry: int
+    account: str
+    amount: Money[Currency] | Overdraft[Currency]
+
+
+class Journal:
+    """
+    A double-entry journal, see the module documentation.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_accounts",
+        "_currencies",
+        "_subunits",
+        "_entry_starts",
+        "_balances",
+    )
+
+    def __init__(self) -> None:
+        # Postings, as columns indexed by sequence number.
+        self._entries: Final = list[int]()
+        self._accounts: Final = list[str]()
+        self._currencies: Final = list[Currency]()
+        self._subunits: Final = list[int]()
+        # The sequence number of the first posting of each entry.
+        self._entry_starts: Final = list[int]()
+        self._balances: Final = dict[str, dict[Currency, int]]()
+
+    def __len__(self) -> int:
+        return len(self._subunits)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entry_starts)
+
+    @property
+    def accounts(self) -> frozenset[str]:
+        return frozenset(self._balances)
+
+    def post(
+        self,
+        postings: Iterable[tuple[str, Money[Currency] | Overdraft[Currency]]],
+    ) -> int:
+        """
+        Record an entry of (account, amount) postings, and return its entry number.
+        Raises UnbalancedEntry, without recording any posting, if the amounts don't sum
+        to zero for every currency, and ValueError for entries without postings.
+        """
+        legs = list[tuple[str, Currency, int]]()
+        totals = dict[Currency, int]()
+        for account, amount in postings:
+            subunits = _signed_subunits(amount)
+            currency = amount.currency
+            legs.append((account, currency, subunits))
+            totals[currency] = totals.get(currency, 0) + subunits
+        if not legs:
+            raise ValueError("Entries must have at least one posting.")
+        unbalanced = {
+            currency: total for currency, total in totals.items() if total != 0
+        }
+        if unbalanced:
+            raise UnbalancedEntry(
+                "Entry does not balance, off by "
+                + ", ".join(
+                    repr(_dispatch_type(total, currency))
+                    for currency, total in unbalanced.items()
+                )
+                + "."
+            )
+
+        entry = len(self._entry_starts)
+        self._entry_starts.append(len(self._subunits))
+        balances = self._balances
+        for account, currency, posted in legs:
+            self._entries.append(entry)
+            self._accounts.append(account)
+            self._currencies.append(currency)
+            self._subunits.append(posted)
+            try:
+                account_balances = balances[account]
+            except KeyError:
+                account_balances = balances[account] = {}
+            account_balances[currency] = account_balances.get(currency, 0) + posted
+        return entry
+
+    def transfer(
+        self,
+        source: str,
+        destination: str,
+        amount: Money[Currency],
+    ) -> int:
+        """
+        Record an entry moving an amount from the source account to the destination
+        account, and return its entry number.
+        """
+        return self.post([(destination, amount), (source, -amount)])
+
+    def _posting(self, sequence: int) -> Posting:
+        currency = self._currencies[sequence]
+        return Posting(
+            sequence,
+            self._entries[sequence],
+            self._accounts[sequence],
+            _dispatch_type(self._subunits[sequence], currency),
+        )
+
+    def _check_range(self, start: int, stop: int | None) -> tuple[int, int]:
+        length = len(self._subunits)
+        stop = length if stop is None else stop
+        if not 0 <= start <= stop <= length:
+            raise IndexError(
+                f"Invalid range [{start}, {stop}) for journal of length {length}."
+            )
+        return start, stop
+
+    def __getitem__(self, sequence: int) -> Posting:
+        if sequence < 0:
+            sequence += len(self._subunits)
+        if not 0 <= sequence < len(self._subunits):
+            raise IndexError("Journal index out of range.")
+        return self._posting(sequence)
+
+    def __iter__(self) -> Iterator[Posting]:
+        return self.postings()
+
+    def postings(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+        account: str | None = None,
+    ) -> Iterator[Posting]:
+        """
+        Lazily yield the postings with sequence numbers in the range [start, stop),
+        optionally only those of a single account.
+        """
+        start, stop = self._check_range(start, stop)
+        accounts = self._accounts
+        for sequence in range(start, stop):
+            if account is None or accounts[sequence] == account:
+                yield self._posting(sequence)
+
+    def entry(self, number: int) -> list[Posting]:
+        """
+        Return the postings of an entry.
+        """
+        if not 0 <= number < len(self._entry_starts):
+            raise IndexError("Entry number out of range.")
+        start = self._entry_starts[number]
+        stop = (
+            self._entry_starts[number + 1]
+            if number + 1 < len(self._entry_starts)
+            else len(self._subunits)
+        )
+        return [self._posting(sequence) for sequence in range(start, stop)]
+
+    def _sum(self, account: str, currency: Currency, start: int, stop: int) -> int:
+        accounts = self._accounts
+        currencies = self._currencies
+        subunits = self._subunits
+        return sum(
+            subunits[sequence]
+            for sequence in range(start, stop)
+            if accounts[sequence] == account and currencies[sequence] == currency
+        )
+
+    def balance(
+        self,
+        account: str,
+        currency: Currency,
+        stop: int | None = None,
+    ) -> Money[Currency] | Overdraft[Currency]:
+        """
+        Return the balance of an account in a currency, from the postings before
+        sequence number `stop`. The current balance, the default, is read from the
+        balance index, and otherwise the shorter range of postings on either side of
+        `stop` is scanned.
+        """
+        _, stop = self._check_range(0, stop)
+        current = self._balances.get(account, {}).get(currency, 0)
+        length = len(self._subunits)
+        if stop == length:
+            total = current
+        elif stop <= length - stop:
+            total = self._sum(account, currency, 0, stop)
+        else:
+            total = current - self._sum(account, currency, stop, length)
+        return _dispatch_type(total, currency)
+
+    def balances(
+        self,
+        account: str,
+    ) -> dict[Currency, Money[Currency] | Overdraft[Currency]]:
+        """
+        Return the current balances of an account, per currency it has postings in.
+        """
+        return {
+            currency: _dispatch_type(subunits, currency)
+            for currency, subunits in self._balances.get(account, {}).items()
+        }
+
+    def movement(
+        self,
+        account: str,
+        currency: Currency,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Money[Currency] | Overdraft[Currency]:
+        """
+        Return the sum of the postings of an account in a currency with sequence
+        numbers in the range [start, stop).
+        """
+        start, stop = self._check_range(start, stop)
+        return _dispatch_type(self._sum(account, currency, start, stop), currency)
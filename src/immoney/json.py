@@ -0,0 +1,208 @@
+"""
+Encoding and decoding of monetary values with the json module and compatible libraries
+such as orjson.
+
+Values are encoded as the same objects used by the Pydantic integration:
+
+- Money as {"subunits": <int>, "currency": <code>}
+- Overdraft as {"overdraft_subunits": <int>, "currency": <code>}
+- SubunitFraction as {"numerator": <int>, "denominator": <int>, "currency": <code>}
+
+Pass default() to json.dumps() or orjson.dumps(), and object_hook to json.loads(). For
+libraries without an object hook, decode() converts already parsed data. Alternatively,
+compact_default() encodes values as strings in the compact form "<code>:<signed
+subunits>" or "<code>:<numerator>/<denominator>", which are read back with
+parse_compact().
+
+>>> import json
+>>> from immoney.currencies import SEK
+>>> data = json.dumps({"total": SEK("1.50")}, default=default)
+>>> data
+'{"total": {"subunits": 150, "currency": "SEK"}}'
+>>> json.loads(data, object_hook=object_hook)
+{'total': Money('1.50', SEK)}
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from fractions import Fraction
+from typing import Any
+from typing import Final
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._compact import format_compact
+from ._compact import parse_compact as _parse_compact
+from ._dicts import MoneyDict
+from ._dicts import OverdraftDict
+from ._dicts import SubunitFractionDict
+from .currencies import registry as default_registry
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "default",
+    "compact_default",
+    "object_hook",
+    "make_object_hook",
+    "decode",
+    "parse_compact",
+)
+
+
+def _encode_money(value: Money[Currency]) -> MoneyDict:
+    return {"subunits": value.subunits, "currency": value.currency.code}
+
+
+def _encode_overdraft(value: Overdraft[Currency]) -> OverdraftDict:
+    return {"overdraft_subunits": value.subunits, "currency": value.currency.code}
+
+
+def _encode_fraction(value: SubunitFraction[Currency]) -> SubunitFractionDict:
+    fraction = value.value
+    return {
+        "numerator": fraction.numerator,
+        "denominator": fraction.denominator,
+        "currency": value.currency.code,
+    }
+
+
+# The monetary types are final, so encoders can be looked up by exact type instead of
+# going through a chain of isinstance() checks.
+_encoders: Final[dict[type, Callable[[Any], object]]] = {
+    Money: _encode_money,
+    Overdraft: _encode_overdraft,
+    SubunitFraction: _encode_fraction,
+}
+
+
+def default(
+    value: object,
+) -> MoneyDict | OverdraftDict | SubunitFractionDict:
+    """
+    Encode a monetary value as a dictionary. Raises TypeError for any other object, as
+    required by the default hooks of json.dumps() and orjson.dumps().
+    """
+    try:
+        encode = _encoders[type(value)]
+    except KeyError:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        ) from None
+    return encode(value)  # type: ignore[return-value]
+
+
+def compact_default(value: object) -> str:
+    """
+    Encode a monetary value in compact string form. Raises TypeError for any other
+    object.
+
+    >>> import json
+    >>> from immoney.currencies import SEK
+    >>> json.dumps([SEK.overdraft("1.50"), SEK.fraction(1, 3)], default=compact_default)
+    '["SEK:-150", "SEK:1/3"]'
+    """
+    if type(value) not in _encoders:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return format_compact(value)  # type: ignore[arg-type]
+
+
+def _subunits(data: dict[str, Any], key: str) -> int:
+    value = data[key]
+    # Rejects booleans, which are integers.
+    if type(value) is not int:
+        raise ParseError(f"Expected integer {key}, got {value!r}.")
+    return value
+
+
+def make_object_hook(
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Callable[[dict[str, Any]], Any]:
+    """
+    Create an object hook for json.loads() that decodes objects with exactly the keys
+    of one of the monetary value representations, resolving currencies through the
+    given registry. Other objects are returned unchanged. Raises ParseError for
+    objects with matching keys that hold invalid values.
+    """
+
+    def currency_of(data: dict[str, Any]) -> Currency:
+        code = data["currency"]
+        try:
+            return registry[code]
+        except (KeyError, TypeError):
+            raise ParseError(f"Unknown currency code: {code!r}.") from None
+
+    def hook(data: dict[str, Any]) -> Any:
+        size = len(data)
+        if size == 2 and "currency" in data:
+            if "subunits" in data:
+                return Money.from_subunit(
+                    _subunits(data, "subunits"), currency_of(data)
+                )
+            if "overdraft_subunits" in data:
+                return Overdraft.from_subunit(
+                    _subunits(data, "overdraft_subunits"),
+                    currency_of(data),
+                )
+        elif (
+            size == 3
+            and "currency" in data
+            and "numerator" in data
+            and "denominator" in data
+        ):
+            denominator = _subunits(data, "denominator")
+            if denominator == 0:
+                raise ParseError("Subunit fraction denominator cannot be zero.")
+            return SubunitFraction(
+                Fraction(_subunits(data, "numerator"), denominator),
+                currency_of(data),
+            )
+        return data
+
+    return hook
+
+
+object_hook: Final = make_object_hook()
+
+
+def decode(
+    data: object,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Any:
+    """
+    Recursively decode monetary values in already parsed JSON data, as produced by
+    orjson.loads(), which doesn't support object hooks. Lists are copied, and objects
+    are decoded as by make_object_hook().
+
+    >>> from immoney.currencies import SEK
+    >>> decode([{"overdraft_subunits": 150, "currency": "SEK"}])
+    [Overdraft('1.50', SEK)]
+    """
+    hook = object_hook if registry is default_registry else make_object_hook(registry)
+
+    def walk(value: object) -> object:
+        if isinstance(value, dict):
+            return hook({key: walk(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    return walk(data)
+
+
+def parse_compact(
+    text: str,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]:
+    """
+    Parse a value encoded by compact_default(). Raises ParseError for invalid input.
+
+    >>> parse_compact("SEK:-150")
+    Overdraft('1.50', SEK)
+    """
+    return _parse_compact(text, registry)
@@ -0,0 +1,289 @@
+"""
+Append-only ledger files of Money and Overdraft values.
+
+A ledger file starts with a header listing the currency codes of its CurrencyIndex,
+followed by fixed-width records in the format of immoney.binary. Because records never
+use the big integer escape, the position of any record can be computed from its
+sequence number, and reads go through a memory map, so files may be much larger than
+available memory.
+
+Cumulative per-currency totals are kept in memory at every `checkpoint_interval`
+records, which bounds the number of records read to compute a balance at any sequence
+number. Checkpoints are rebuilt with a single sequential scan when a file is opened.
+
+A ledger must only be written to by a single Ledger instance at a time.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from collections.abc import Iterator
+from types import TracebackType
+from typing import BinaryIO
+from typing import Final
+
+from typing_extensions import Self
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from ._base import int64_max
+from ._base import int64_min
+from .binary import CurrencyIndex
+from .binary import record
+from .currencies import registry as default_registry
+from .errors import ParseError
+from .registry import CurrencyRegistry
+
+__all__ = ("Ledger",)
+
+magic: Final = b"IMLEDGR\x01"
+header: Final = struct.Struct("<8sI")
+default_checkpoint_interval: Final = 4096
+# Number of records decoded per memoryview when iterating.
+read_batch_size: Final = 4096
+
+
+def _encode_codes(codes: Iterable[str]) -> bytes:
+    return "\n".join(codes).encode()
+
+
+def _decode_codes(data: bytes) -> list[str]:
+    return data.decode().split("\n") if data else []
+
+
+class Ledger:
+    """
+    An append-only ledger file, see the module documentation for its format.
+
+    >>> import tempfile, pathlib
+    >>> from immoney.currencies import SEK
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     with Ledger(pathlib.Path(directory) / "ledger") as ledger:
+    ...         ledger.extend([SEK(10), SEK.overdraft(3), SEK(1)])
+    ...         ledger.balance(SEK, stop=2)
+    Money('7.00', SEK)
+    """
+
+    __slots__ = (
+        "_file",
+        "_index",
+        "_data_start",
+        "_length",
+        "_map",
+        "_mapped_length",
+        "_totals",
+        "_checkpoints",
+        "_checkpoint_interval",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        registry: CurrencyRegistry[Currency] = default_registry,
+        checkpoint_interval: int = default_checkpoint_interval,
+    ) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be positive.")
+        self._checkpoint_interval: Final = checkpoint_interval
+        try:
+            self._file: BinaryIO = open(path, "r+b")  # noqa: SIM115
+        except FileNotFoundError:
+            self._file = open(path, "x+b")  # noqa: SIM115
+            codes = _encode_codes(sorted(registry))
+            self._file.write(header.pack(magic, len(codes)) + codes)
+            self._file.flush()
+        self._index, self._data_start = self._read_header(registry)
+
+        size = os.fstat(self._file.fileno()).st_size
+        self._length = (size - self._data_start) // record.size
+        end = self._data_start + self._length * record.size
+        if end != size:
+            # Discard a partially written record of an interrupted append.
+            self._file.truncate(end)
+        self._file.seek(end)
+
+        self._map: mmap.mmap | None = None
+        self._mapped_length = 0
+        self._totals = dict[int, int]()
+        self._checkpoints = [dict[int, int]()]
+        self._build_checkpoints()
+
+    def _read_header(
+        self,
+        registry: CurrencyRegistry[Currency],
+    ) -> tuple[CurrencyIndex, int]:
+        self._file.seek(0)
+        data = self._file.read(header.size)
+        try:
+            file_magic, codes_size = header.unpack(data)
+        except struct.error as exception:
+            raise ParseError("Truncated ledger header.") from exception
+        if file_magic != magic:
+            raise ParseError("File is not an immoney ledger.")
+        codes = self._file.read(codes_size)
+        if len(codes) != codes_size:
+            raise ParseError("Truncated ledger header.")
+        index = CurrencyIndex(registry, codes=_decode_codes(codes))
+        return index, header.size + codes_size
+
+    def _build_checkpoints(self) -> None:
+        totals = self._totals
+        interval = self._checkpoint_interval
+        for start in range(0, self._length, interval):
+            stop = min(start + interval, self._length)
+            for id_, subunits in self._records(start, stop):
+                totals[id_] = totals.get(id_, 0) + subunits
+            if stop - start == interval:
+                self._checkpoints.append(dict(totals))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def index(self) -> CurrencyIndex:
+        return self._index
+
+    def append(self, value: Money[Currency] | Overdraft[Currency]) -> int:
+        """
+        Append a value and return its sequence number. Raises OverflowError for values
+        that don't fit in a fixed-width record.
+        """
+        id_ = self._index.id_of(value.currency)
+        subunits = _signed_subunits(value)
+        if not int64_min <= subunits <= int64_max:
+            raise OverflowError(f"Value does not fit in a ledger record: {value!r}")
+        self._file.write(record.pack(id_, subunits))
+        sequence = self._length
+        self._length += 1
+        self._totals[id_] = self._totals.get(id_, 0) + subunits
+        if self._length % self._checkpoint_interval == 0:
+            self._checkpoints.append(dict(self._totals))
+        return sequence
+
+    def extend(self, values: Iterable[Money[Currency] | Overdraft[Currency]]) -> None:
+        for value in values:
+            self.append(value)
+
+    def _mapped(self, stop: int) -> mmap.mmap:
+        """
+        Return a memory map covering at least the first `stop` records.
+        """
+        if self._map is None or self._mapped_length < stop:
+            self._file.flush()
+            # Running iterators may still reference the previous map, so it's left to
+            # be closed on garbage collection.
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_length = self._length
+        return self._map
+
+    def _records(self, start: int, stop: int) -> Iterator[tuple[int, int]]:
+        """
+        Lazily read (currency id, signed subunits) pairs of a range of records.
+        """
+        for batch_start in range(start, stop, read_batch_size):
+            batch_stop = min(batch_start + read_batch_size, stop)
+            mapped = self._mapped(batch_stop)
+            offset = self._data_start + batch_start * record.size
+            end = self._data_start + batch_stop * record.size
+            with memoryview(mapped) as view, view[offset:end] as batch:
+                records = list(record.iter_unpack(batch))
+            yield from records
+
+    def _check_range(self, start: int, stop: int | None) -> tuple[int, int]:
+        stop = self._length if stop is None else stop
+        if not 0 <= start <= stop <= self._length:
+            raise IndexError(
+                f"Invalid range [{start}, {stop}) for ledger of length {self._length}."
+            )
+        return start, stop
+
+    def __getitem__(self, sequence: int) -> Money[Currency] | Overdraft[Currency]:
+        if sequence < 0:
+            sequence += self._length
+        if not 0 <= sequence < self._length:
+            raise IndexError("Ledger index out of range.")
+        id_, subunits = record.unpack_from(
+            self._mapped(sequence + 1),
+            self._data_start + sequence * record.size,
+        )
+        return _dispatch_type(subunits, self._index[id_])
+
+    def __iter__(self) -> Iterator[Money[Currency] | Overdraft[Currency]]:
+        return self.iter()
+
+    def iter(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Money[Currency] | Overdraft[Currency]]:
+        """
+        Lazily yield the values of records in the range [start, stop).
+        """
+        start, stop = self._check_range(start, stop)
+        currencies = self._index
+        for id_, subunits in self._records(start, stop):
+            yield _dispatch_type(subunits, currencies[id_])
+
+    def _totals_at(self, stop: int) -> dict[int, int]:
+        if stop == self._length:
+            return self._totals
+        checkpoint = stop // self._checkpoint_interval
+        totals = dict(self._checkpoints[checkpoint])
+        for id_, subunits in self._records(
+            checkpoint * self._checkpoint_interval, stop
+        ):
+            totals[id_] = totals.get(id_, 0) + subunits
+        return totals
+
+    def balance(
+        self,
+        currency: Currency,
+        stop: int | None = None,
+    ) -> Money[Currency] | Overdraft[Currency]:
+        """
+        Return the sum of all records of the given currency before sequence number
+        `stop`, by default of the whole ledger.
+        """
+        _, stop = self._check_range(0, stop)
+        id_ = self._index.id_of(currency)
+        return _dispatch_type(self._totals_at(stop).get(id_, 0), currency)
+
+    def balances(
+        self,
+        stop: int | None = None,
+    ) -> dict[Currency, Money[Currency] | Overdraft[Currency]]:
+        """
+        Return the sums of records per currency before sequence number `stop`, by
+        default of the whole ledger.
+        """
+        _, stop = self._check_range(0, stop)
+        return {
+            self._index[id_]: _dispatch_type(subunits, self._index[id_])
+            for id_, subunits in self._totals_at(stop).items()
+        }
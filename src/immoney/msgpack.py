@@ -0,0 +1,206 @@
+"""
+Encoding of monetary values as msgpack extension types.
+
+Money and Overdraft are encoded as the extension type `money_code`, holding the
+currency id in a CurrencyIndex followed by the signed subunits, where negative values
+are overdrafts. SubunitFraction is encoded as the extension type
+`subunit_fraction_code`, holding the currency id followed by the signed numerator and
+the denominator. Currency ids and denominators are unsigned LEB128 varints, and signed
+integers are zigzag encoded varints, so that common values fit in a few bytes and
+integers of any size are supported.
+
+Currency ids default to the stable ids of immoney.binary, derived from currency codes,
+so data can be decoded with a different version of immoney. As with immoney.binary, an
+index with explicit codes must be the same when encoding and decoding.
+
+>>> from immoney.currencies import SEK
+>>> data = packb([SEK("1.50"), SEK.overdraft(1), SEK.fraction(1, 3)])
+>>> len(data)
+19
+>>> unpackb(data)
+[Money('1.50', SEK), Overdraft('1.00', SEK), SubunitFraction('1/3', SEK)]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from fractions import Fraction
+from typing import Any
+from typing import Final
+
+import msgpack
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from .binary import CurrencyIndex
+from .binary import default_index
+from .errors import ParseError
+
+__all__ = (
+    "money_code",
+    "subunit_fraction_code",
+    "make_default",
+    "make_ext_hook",
+    "default",
+    "ext_hook",
+    "packer",
+    "unpacker",
+    "packb",
+    "unpackb",
+)
+
+money_code: Final = 77
+subunit_fraction_code: Final = 78
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_signed(buffer: bytearray, value: int) -> None:
+    _write_varint(buffer, value << 1 if value >= 0 else (~value << 1) | 1)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+    except IndexError:
+        raise ParseError("Truncated varint.") from None
+
+
+def _read_signed(data: bytes, offset: int) -> tuple[int, int]:
+    value, offset = _read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def make_default(index: CurrencyIndex = default_index) -> Callable[[object], Any]:
+    """
+    Create a default hook for msgpack.packb() and msgpack.Packer, encoding monetary
+    values with currency ids of the given index. Raises TypeError for any other object.
+    """
+    id_of = index.id_of
+
+    def encode(value: object) -> msgpack.ExtType:
+        buffer = bytearray()
+        # The monetary types are final, so exact type checks suffice.
+        if type(value) is Money or type(value) is Overdraft:
+            _write_varint(buffer, id_of(value.currency))
+            _write_signed(buffer, _signed_subunits(value))
+            return msgpack.ExtType(money_code, bytes(buffer))
+        if type(value) is SubunitFraction:
+            _write_varint(buffer, id_of(value.currency))
+            _write_signed(buffer, value.value.numerator)
+            _write_varint(buffer, value.value.denominator)
+            return msgpack.ExtType(subunit_fraction_code, bytes(buffer))
+        raise TypeError(f"Cannot serialize {value!r}.")
+
+    return encode
+
+
+def make_ext_hook(index: CurrencyIndex = default_index) -> Callable[[int, bytes], Any]:
+    """
+    Create an ext_hook for msgpack.unpackb() and msgpack.Unpacker, decoding monetary
+    values with currency ids of the given index. Other extension types are returned as
+    msgpack.ExtType. Raises ParseError for invalid data.
+    """
+
+    def decode(code: int, data: bytes) -> object:
+        if code == money_code:
+            id_, offset = _read_varint(data, 0)
+            subunits, offset = _read_signed(data, offset)
+            value: Money[Currency] | Overdraft[Currency] | SubunitFraction[Currency]
+            value = _dispatch_type(subunits, index[id_])
+        elif code == subunit_fraction_code:
+            id_, offset = _read_varint(data, 0)
+            numerator, offset = _read_signed(data, offset)
+            denominator, offset = _read_varint(data, offset)
+            if denominator == 0:
+                raise ParseError("Subunit fraction denominator cannot be zero.")
+            value = SubunitFraction(Fraction(numerator, denominator), index[id_])
+        else:
+            return msgpack.ExtType(code, data)
+        if offset != len(data):
+            raise ParseError(f"Unexpected trailing data after offset {offset}.")
+        return value
+
+    return decode
+
+
+default: Final = make_default()
+ext_hook: Final = make_ext_hook()
+
+
+def packer(index: CurrencyIndex = default_index, **kwargs: Any) -> msgpack.Packer:
+    """
+    Create a msgpack.Packer that encodes monetary values. Keyword arguments are passed
+    on to msgpack.Packer.
+    """
+    return msgpack.Packer(
+        default=default if index is default_index else make_default(index),
+        **kwargs,
+    )
+
+
+def unpacker(
+    file_like: Any = None,
+    index: CurrencyIndex = default_index,
+    **kwargs: Any,
+) -> msgpack.Unpacker:
+    """
+    Create a streaming msgpack.Unpacker that decodes monetary values. Read messages
+    from the given file-like object, or feed it data with Unpacker.feed(), and iterate
+    it to decode messages as they become available. Keyword arguments are passed on to
+    msgpack.Unpacker.
+
+    >>> from immoney.currencies import SEK
+    >>> stream = unpacker()
+    >>> stream.feed(packb(SEK(1)) + packb(SEK(2))[:2])
+    >>> list(stream)
+    [Money('1.00', SEK)]
+    >>> stream.feed(packb(SEK(2))[2:])
+    >>> list(stream)
+    [Money('2.00', SEK)]
+    """
+    return msgpack.Unpacker(
+        file_like,
+        ext_hook=ext_hook if index is default_index else make_ext_hook(index),
+        **kwargs,
+    )
+
+
+def packb(value: object, index: CurrencyIndex = default_index, **kwargs: Any) -> bytes:
+    """
+    Encode an object with msgpack, including any monetary values.
+    """
+    encoded: bytes = msgpack.packb(
+        value,
+        default=default if index is default_index else make_default(index),
+        **kwargs,
+    )
+    return encoded
+
+
+def unpackb(data: bytes, index: CurrencyIndex = default_index, **kwargs: Any) -> Any:
+    """
+    Decode a single msgpack message, including any monetary values.
+    """
+    return msgpack.unpackb(
+        data,
+        ext_hook=ext_hook if index is default_index else make_ext_hook(index),
+        **kwargs,
+    )
@@ -0,0 +1,258 @@
+"""
+Conversion between immoney value types and NumPy arrays.
+
+Values are represented in arrays as signed integer subunits, where negative values
+correspond to Overdraft. Arrays are of dtype int64 when all values fit, otherwise they
+fall back to object arrays holding Python ints, so that no precision is ever lost.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import TypeAlias
+from typing import TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import assert_never
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import Round
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from ._base import int64_max
+from ._base import int64_min
+from .currencies import registry as default_registry
+from .errors import CurrencyMismatch
+from .errors import DivisionByZero
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "IntArray",
+    "to_numpy",
+    "from_numpy",
+    "fractions_to_numpy",
+    "round_subunits",
+    "to_structured",
+    "from_structured",
+)
+
+C = TypeVar("C", bound=Currency)
+
+# Arrays are either int64, or object arrays of Python ints when values exceed int64.
+IntArray: TypeAlias = npt.NDArray[np.int64] | npt.NDArray[np.object_]
+
+
+def _int_array(values: Sequence[int]) -> IntArray:
+    if not values or (int64_min <= min(values) and max(values) <= int64_max):
+        return np.array(values, dtype=np.int64)
+    return np.array(values, dtype=object)
+
+
+def _resolve_currency(currency: C | None, found: C | None) -> C:
+    if found is not None:
+        return found
+    if currency is None:
+        raise ValueError("Currency must be given when converting empty input.")
+    return currency
+
+
+def _check_currency(value_currency: C, expected: C | None) -> C:
+    if expected is not None and value_currency is not expected:
+        raise CurrencyMismatch(
+            f"Expected all values to be of currency {expected!s}, got "
+            f"{value_currency!s}."
+        )
+    return value_currency
+
+
+def to_numpy(
+    values: Iterable[Money[C] | Overdraft[C]],
+    currency: C | None = None,
+) -> tuple[IntArray, C]:
+    """
+    Convert values of a single currency into an array of signed subunits.
+
+    >>> from immoney.currencies import SEK
+    >>> to_numpy([SEK("1.50"), SEK.overdraft("0.25")])
+    (array([150, -25]), Currency(code=SEK, subunit=100))
+    """
+    subunits = list[int]()
+    append = subunits.append
+    found = currency
+    for value in values:
+        found = _check_currency(value.currency, found)
+        append(_signed_subunits(value))
+    return _int_array(subunits), _resolve_currency(currency, found)
+
+
+def _check_integer_array(array: npt.NDArray[np.generic]) -> None:
+    if array.dtype.kind not in "iuO":
+        raise TypeError(
+            f"Expected an integer or object array of subunits, got dtype {array.dtype}."
+        )
+
+
+def _index(value: object) -> int:
+    # Elements of object arrays may be of any type, and int() would truncate floats
+    # and Decimals, so only values that are integers are accepted.
+    try:
+        return operator.index(value)  # type: ignore[arg-type]
+    except TypeError:
+        raise TypeError(
+            f"Expected integer elements, got element of type {type(value)!r}."
+        ) from None
+
+
+def _check_object_elements(array: npt.NDArray[np.generic]) -> None:
+    if array.dtype.kind == "O":
+        for value in array.flat:
+            _index(value)
+
+
+def from_numpy(
+    array: npt.NDArray[np.generic],
+    currency: C,
+) -> list[Money[C] | Overdraft[C]]:
+    """
+    Convert an array of signed subunits into Money and Overdraft instances.
+
+    >>> from immoney.currencies import SEK
+    >>> from_numpy(np.array([150, -25]), SEK)
+    [Money('1.50', SEK), Overdraft('0.25', SEK)]
+    """
+    _check_integer_array(array)
+    # tolist() converts elements of integer arrays to Python ints in a single pass.
+    return [_dispatch_type(_index(value), currency) for value in array.tolist()]
+
+
+def fractions_to_numpy(
+    values: Iterable[SubunitFraction[C]],
+    currency: C | None = None,
+) -> tuple[IntArray, IntArray, C]:
+    """
+    Convert SubunitFraction values into arrays of numerators and denominators.
+    Denominators are always positive.
+    """
+    numerators = list[int]()
+    denominators = list[int]()
+    found = currency
+    for value in values:
+        found = _check_currency(value.currency, found)
+        numerators.append(value.value.numerator)
+        denominators.append(value.value.denominator)
+    return (
+        _int_array(numerators),
+        _int_array(denominators),
+        _resolve_currency(currency, found),
+    )
+
+
+def _as_int_arrays(
+    numerators: npt.ArrayLike,
+    denominators: npt.ArrayLike,
+) -> tuple[IntArray, IntArray]:
+    n = np.asarray(numerators)
+    d = np.asarray(denominators)
+    _check_integer_array(n)
+    _check_integer_array(d)
+    _check_object_elements(n)
+    _check_object_elements(d)
+    # Unsigned values above int64 max would wrap when cast to int64, so unsigned
+    # arrays are converted through Python ints, like object arrays.
+    if n.dtype.kind == "u":
+        n = n.astype(object)
+    if d.dtype.kind == "u":
+        d = d.astype(object)
+    if np.any(d == 0):
+        raise DivisionByZero
+    if np.any(d < 0):
+        # Negating int64 min overflows, so normalize signs with Python ints.
+        n = np.where(d < 0, -n.astype(object), n.astype(object))
+        d = np.abs(d.astype(object))
+    if n.dtype == object or d.dtype == object:
+        n, d = _int_array(n.tolist()), _int_array(d.tolist())
+        if n.dtype == object or d.dtype == object:
+            return n.astype(object), d.astype(object)
+    return n.astype(np.int64), d.astype(np.int64)
+
+
+def round_subunits(
+    numerators: npt.ArrayLike,
+    denominators: npt.ArrayLike,
+    rounding: Round,
+) -> IntArray:
+    """
+    Round fractions of subunits given as numerator and denominator arrays, with the
+    exact semantics of SubunitFraction rounding.
+
+    >>> round_subunits([1, 3, 5, -5], [2, 2, 2, 2], Round.HALF_EVEN)
+    array([ 0,  2,  2, -2])
+    """
+    n, d = _as_int_arrays(numerators, denominators)
+    # Floor division, leaving a remainder in the range [0, d).
+    quotient = n // d
+    remainder = n % d
+    # Comparing against d - r instead of 2 * r avoids overflow.
+    complement = d - remainder
+
+    match rounding:
+        case Round.DOWN:
+            round_up = np.zeros(quotient.shape, dtype=bool)
+        case Round.UP:
+            round_up = remainder != 0
+        case Round.HALF_UP:
+            round_up = remainder >= complement
+        case Round.HALF_EVEN:
+            round_up = (remainder > complement) | (
+                (remainder == complement) & (quotient % 2 == 1)
+            )
+        case Round.HALF_DOWN:
+            round_up = remainder > complement
+        case no_match:
+            assert_never(no_match)
+
+    result: IntArray = quotient + np.asarray(round_up).astype(quotient.dtype)
+    return result
+
+
+def to_structured(
+    values: Iterable[Money[Currency] | Overdraft[Currency]],
+) -> npt.NDArray[np.void]:
+    """
+    Convert values of any currencies into a structured array with the fields
+    "subunits" (int64) and "currency" (currency code). Raises OverflowError for values
+    that don't fit in int64.
+    """
+    rows = list[tuple[int, str]]()
+    for value in values:
+        subunits = _signed_subunits(value)
+        if not int64_min <= subunits <= int64_max:
+            raise OverflowError(f"Value does not fit in a structured array: {value!r}")
+        rows.append((subunits, value.currency.code))
+    code_width = max((len(code) for _, code in rows), default=1)
+    dtype = np.dtype([("subunits", np.int64), ("currency", f"U{code_width}")])
+    return np.array(rows, dtype=dtype)
+
+
+def from_structured(
+    array: npt.NDArray[np.void],
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> list[Money[Currency] | Overdraft[Currency]]:
+    """
+    Convert a structured array with the fields "subunits" and "currency" into Money
+    and Overdraft instances, resolving currency codes through the given registry.
+    """
+    return [
+        _dispatch_type(subunits, registry[code])
+        for subunits, code in zip(
+            array["subunits"].tolist(),
+            array["currency"].tolist(),
+            strict=True,
+        )
+    ]
@@ -0,0 +1,473 @@
+"""
+Pandas extension dtype and array for Money and Overdraft values.
+
+Values are stored as an int64 array of signed subunits, where negative values are
+overdrafts, and an int32 array of codes indexing into a tuple of currencies, with -1
+marking missing values. Arithmetic, reductions and groupby sums operate directly on
+the integer arrays, and raise OverflowError rather than silently wrapping around.
+"""
+
+from __future__ import annotations
+
+import builtins
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pyarrow as pa
+from pandas.api.extensions import ExtensionArray
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.extensions import register_extension_dtype
+from pandas.api.extensions import take
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from ._base import _ValueCurrencyPair
+from ._base import int64_max
+from ._base import int64_min
+from .arrow import _columns
+from .arrow import build_array
+from .currencies import registry as default_registry
+from .errors import CurrencyMismatch
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "MoneyDtype",
+    "MoneyArray",
+)
+
+missing: Final = -1
+
+
+def _is_missing(value: object) -> bool:
+    return (
+        value is None
+        or value is pd.NA
+        or (isinstance(value, float) and np.isnan(value))
+    )
+
+
+def _check_int64(subunits: int) -> int:
+    if not int64_min <= subunits <= int64_max:
+        raise OverflowError(f"Value does not fit in int64 subunits: {subunits}")
+    return subunits
+
+
+@register_extension_dtype
+class MoneyDtype(ExtensionDtype):
+    """
+    Extension dtype for columns of Money and Overdraft values of any currencies.
+    """
+
+    name = "money"
+    type = _ValueCurrencyPair
+    kind = "O"
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type[MoneyArray]:
+        return MoneyArray
+
+    def __from_arrow__(self, array: pa.Array[Any] | pa.ChunkedArray[Any]) -> MoneyArray:
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        return MoneyArray._concat_same_type(
+            [MoneyArray.from_arrow(chunk) for chunk in chunks]
+        )
+
+
+class MoneyArray(ExtensionArray):
+    """
+    Array of Money and Overdraft values, see the module documentation for the storage
+    layout.
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(
+        self,
+        subunits: npt.NDArray[np.int64],
+        codes: npt.NDArray[np.int32],
+        currencies: Sequence[Currency],
+    ) -> None:
+        if subunits.shape != codes.shape or subunits.ndim != 1:
+            raise ValueError("Subunits and codes must be one-dimensional and aligned.")
+        self._subunits = subunits.astype(np.int64, copy=False)
+        self._codes = codes.astype(np.int32, copy=False)
+        self._currencies = tuple(currencies)
+
+    @classmethod
+    def from_subunits(
+        cls,
+        subunits: npt.ArrayLike,
+        currency: Currency,
+    ) -> MoneyArray:
+        """
+        Create an array of a single currency from signed subunits.
+
+        >>> from immoney.currencies import SEK
+        >>> MoneyArray.from_subunits([150, -25], SEK)
+        <MoneyArray>
+        [Money('1.50', SEK), Overdraft('0.25', SEK)]
+        Length: 2, dtype: money
+        """
+        array = np.asarray(subunits)
+        if array.size == 0:
+            array = array.astype(np.int64)
+        if array.dtype.kind not in "iu":
+            raise TypeError(f"Expected an integer array, got dtype {array.dtype}.")
+        return cls(
+            array.astype(np.int64),
+            np.zeros(array.shape, dtype=np.int32),
+            (currency,),
+        )
+
+    @classmethod
+    def from_arrow(
+        cls,
+        array: pa.Array[Any],
+        registry: CurrencyRegistry[Currency] = default_registry,
+    ) -> MoneyArray:
+        """
+        Create an array from an Arrow array of the money extension type, resolving
+        currency codes through the given registry.
+        """
+        subunits, indices, codes, valid = _columns(array)
+        mask = valid.to_numpy(zero_copy_only=False)
+        return cls(
+            np.where(mask, subunits.fill_null(0).to_numpy(), 0).astype(np.int64),
+            np.where(mask, indices.fill_null(0).to_numpy(), missing).astype(np.int32),
+            [registry[code] for code in codes],
+        )
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Iterable[object],
+        *,
+        dtype: object = None,
+        copy: bool = False,
+    ) -> MoneyArray:
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        subunits = list[int]()
+        codes = list[int]()
+        indices = dict[Currency, int]()
+        for value in scalars:
+            if _is_missing(value):
+                subunits.append(0)
+                codes.append(missing)
+                continue
+            subunits.append(_check_int64(_signed_subunits(value)))
+            assert isinstance(value, Money | Overdraft)
+            codes.append(indices.setdefault(value.currency, len(indices)))
+        return cls(
+            np.array(subunits, dtype=np.int64),
+            np.array(codes, dtype=np.int32),
+            tuple(indices),
+        )
+
+    @classmethod
+    def _from_factorized(
+        cls,
+        values: npt.NDArray[np.object_],
+        original: MoneyArray,
+    ) -> MoneyArray:
+        return cls._from_sequence(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[MoneyArray]) -> MoneyArray:
+        if not to_concat:
+            return cls._from_sequence([])
+        currencies = dict[Currency, int]()
+        codes = list[npt.NDArray[np.int32]]()
+        for array in to_concat:
+            remap = np.array(
+                [currencies.setdefault(c, len(currencies)) for c in array._currencies]
+                + [missing],
+                dtype=np.int32,
+            )
+            # Missing codes index the trailing element of the remap array.
+            codes.append(remap[array._codes])
+        return cls(
+            np.concatenate([array._subunits for array in to_concat]),
+            np.concatenate(codes),
+            tuple(currencies),
+        )
+
+    @property
+    def dtype(self) -> MoneyDtype:
+        return MoneyDtype()
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._subunits.nbytes + self._codes.nbytes)
+
+    @property
+    def subunits(self) -> npt.NDArray[np.int64]:
+        """Read-only view of the signed subunits, missing values are zero."""
+        view: npt.NDArray[np.int64] = self._subunits.view()
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return len(self._subunits)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, int | np.integer):
+            code = int(self._codes[item])
+            if code == missing:
+                return pd.NA
+            return _dispatch_type(int(self._subunits[item]), self._currencies[code])
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._subunits[item], self._codes[item], self._currencies)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if _is_missing(value) or isinstance(value, Money | Overdraft):
+            other = self._align(self._from_sequence([value]))
+            self._subunits[key] = other._subunits[0]
+            self._codes[key] = other._codes[0]
+            return
+        other = self._align(self._from_sequence(value))
+        self._subunits[key] = other._subunits
+        self._codes[key] = other._codes
+
+    def __iter__(self) -> Any:
+        currencies = self._currencies
+        for subunits, code in zip(
+            self._subunits.tolist(), self._codes.tolist(), strict=True
+        ):
+            yield (
+                pd.NA if code == missing else _dispatch_type(subunits, currencies[code])
+            )
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> npt.NDArray[Any]:
+        result = np.empty(len(self), dtype=object)
+        result[:] = list(self)
+        return result
+
+    def __arrow_array__(self, type: Any = None) -> pa.ExtensionArray[Any]:  # noqa: A002
+        valid = self._codes != missing
+        return build_array(
+            self._subunits,
+            np.where(valid, self._codes, 0),
+            [currency.code for currency in self._currencies],
+            valid,
+        )
+
+    def isna(self) -> npt.NDArray[np.bool_]:
+        result: npt.NDArray[np.bool_] = self._codes == missing
+        return result
+
+    def copy(self) -> MoneyArray:
+        return type(self)(self._subunits.copy(), self._codes.copy(), self._currencies)
+
+    def take(
+        self,
+        indices: Sequence[int | np.integer[Any]]
+        | npt.NDArray[np.integer[Any] | np.bool_],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> MoneyArray:
+        fill_subunits, fill_code = 0, missing
+        if allow_fill and not _is_missing(fill_value):
+            fill = self._align(self._from_sequence([fill_value]))
+            fill_subunits, fill_code = int(fill._subunits[0]), int(fill._codes[0])
+        subunits = take(
+            self._subunits,
+            indices,
+            allow_fill=allow_fill,
+            fill_value=fill_subunits,
+        )
+        codes = take(self._codes, indices, allow_fill=allow_fill, fill_value=fill_code)
+        return type(self)(np.asarray(subunits), np.asarray(codes), self._currencies)
+
+    def _align(self, other: MoneyArray) -> MoneyArray:
+        """
+        Return other with its codes translated into the currencies of self, extending
+        the currencies of self with any that are missing.
+        """
+        currencies = {currency: i for i, currency in enumerate(self._currencies)}
+        remap = np.array(
+            [currencies.setdefault(c, len(currencies)) for c in other._currencies]
+            + [missing],
+            dtype=np.int32,
+        )
+        self._currencies = tuple(currencies)
+        return type(self)(other._subunits, remap[other._codes], self._currencies)
+
+    def _operand(self, other: object) -> MoneyArray | None:
+        if isinstance(other, MoneyArray):
+            if len(other) != len(self):
+                raise ValueError("Lengths must match.")
+            return other
+        if isinstance(other, Money | Overdraft):
+            subunits = _check_int64(_signed_subunits(other))
+            return type(self)(
+                np.full(len(self), subunits, dtype=np.int64),
+                np.zeros(len(self), dtype=np.int32),
+                (other.currency,),
+            )
+        return None
+
+    def _binary_codes(self, other: MoneyArray) -> npt.NDArray[np.int32]:
+        aligned = self._align(other)
+        a_missing = self._codes == missing
+        b_missing = aligned._codes == missing
+        if np.any((self._codes != aligned._codes) & ~a_missing & ~b_missing):
+            raise CurrencyMismatch("Cannot combine values of different currencies.")
+        codes: npt.NDArray[np.int32] = np.where(
+            a_missing | b_missing, missing, self._codes
+        ).astype(np.int32)
+        return codes
+
+    def __add__(self, other: object) -> MoneyArray:
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        codes = self._binary_codes(operand)
+        a, b = self._subunits, operand._subunits
+        result = a + b
+        # Overflow occurred where both operands have a sign that differs from the
+        # sign of the result.
+        if np.any(((a ^ result) & (b ^ result)) < 0):
+            raise OverflowError("Result does not fit in int64 subunits.")
+        return type(self)(result, codes, self._currencies)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: object) -> MoneyArray:
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return self + -operand
+
+    def __rsub__(self, other: object) -> MoneyArray:
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return operand + -self
+
+    def __neg__(self) -> MoneyArray:
+        if np.any(self._subunits == int64_min):
+            raise OverflowError("Result does not fit in int64 subunits.")
+        return type(self)(-self._subunits, self._codes, self._currencies)
+
+    def __mul__(self, other: object) -> MoneyArray:
+        if isinstance(other, bool) or not isinstance(other, int | np.integer):
+            return NotImplemented
+        factor = int(other)
+        limit = int64_max // abs(factor) if factor else int64_max
+        if np.any(self._subunits > limit) or np.any(self._subunits < -limit):
+            raise OverflowError("Result does not fit in int64 subunits.")
+        if abs(factor) > int64_max:
+            return type(self)(
+                np.zeros(len(self), dtype=np.int64), self._codes, self._currencies
+            )
+        return type(self)(self._subunits * factor, self._codes, self._currencies)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore[override]
+        operand = self._operand(other)
+        if operand is None:
+            return np.zeros(len(self), dtype=bool)
+        aligned = self._align(operand)
+        result: npt.NDArray[np.bool_] = (
+            (self._codes == aligned._codes)
+            & (self._subunits == aligned._subunits)
+            & (self._codes != missing)
+        )
+        return result
+
+    def _single_currency(self, codes: npt.NDArray[np.int32]) -> Currency | None:
+        unique = np.unique(codes)
+        if len(unique) > 1:
+            raise CurrencyMismatch("Cannot reduce values of different currencies.")
+        return self._currencies[unique[0]] if len(unique) else None
+
+    def _reduce(
+        self,
+        name: str,
+        *,
+        skipna: bool = True,
+        keepdims: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        if name not in ("sum", "min", "max"):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        valid = self._codes != missing
+        if not skipna and not np.all(valid):
+            result: Any = pd.NA
+        else:
+            currency = self._single_currency(self._codes[valid])
+            subunits = self._subunits[valid]
+            if currency is None:
+                result = pd.NA
+            elif name == "sum":
+                # Summing Python ints is exact, and fast enough to not warrant
+                # detecting overflow of a vectorized sum.
+                result = _dispatch_type(sum(subunits.tolist()), currency)
+            else:
+                reduced = subunits.min() if name == "min" else subunits.max()
+                result = _dispatch_type(int(reduced), currency)
+        if keepdims:
+            return self._from_sequence([result])
+        return result
+
+    def _groupby_op(
+        self,
+        *,
+        how: str,
+        has_dropped_na: bool,
+        min_count: int,
+        ngroups: int,
+        ids: npt.NDArray[np.intp],
+        **kwargs: Any,
+    ) -> Any:
+        if how != "sum":
+            return super()._groupby_op(  # type: ignore[misc]
+                how=how,
+                has_dropped_na=has_dropped_na,
+                min_count=min_count,
+                ngroups=ngroups,
+                ids=ids,
+                **kwargs,
+            )
+        valid = (self._codes != missing) & (ids >= 0)
+        group_ids = ids[valid]
+        codes = self._codes[valid]
+        subunits = self._subunits[valid]
+
+        counts = np.bincount(group_ids, minlength=ngroups)
+        lowest = np.full(ngroups, np.iinfo(np.int32).max, dtype=np.int32)
+        highest = np.full(ngroups, missing, dtype=np.int32)
+        np.minimum.at(lowest, group_ids, codes)
+        np.maximum.at(highest, group_ids, codes)
+        if np.any((counts > 0) & (lowest != highest)):
+            raise CurrencyMismatch("Cannot sum values of different currencies.")
+
+        # Accumulate in int64 only when no partial sum can overflow.
+        bound = int(np.abs(subunits.astype(object)).max()) if len(subunits) else 0
+        dtype: type[Any] = (
+            np.int64 if bound * int(counts.max(initial=0)) <= int64_max else object
+        )
+        totals = np.zeros(ngroups, dtype=dtype)
+        np.add.at(totals, group_ids, subunits.astype(dtype))
+        for total in totals.tolist():
+            _check_int64(total)
+
+        empty = counts < max(min_count, 1)
+        return type(self)(
+            totals.astype(np.int64),
+            np.where(empty, missing, highest).astype(np.int32),
+            self._currencies,
+        )
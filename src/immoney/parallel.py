@@ -0,0 +1,316 @@
+"""
+Process-parallel summation of large collections of monetary values.
+
+Input is split into chunks that are reduced in worker processes to picklable partial
+sums, holding plain integer (or Fraction) subunit totals per currency code. Partial sums
+are merged in chunk order, and because integer and rational addition is exact, the
+result is always equal to summing the values sequentially.
+
+Functions passed as `parse` are called in worker processes, and so must be picklable,
+e.g. be defined at module level.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from itertools import islice
+from typing import Any
+from typing import Final
+from typing import Generic
+from typing import TypeVar
+from typing import overload
+
+from ._base import Currency
+from ._base import Monetary
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from .currencies import registry as default_registry
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "Monetary",
+    "PartialSum",
+    "parse_csv_line",
+    "parallel_sum",
+    "parallel_group_sum",
+    "parallel_sum_file",
+)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+R = TypeVar("R")
+
+default_chunk_size: Final = 100_000
+default_file_chunk_size: Final = 16 * 1024 * 1024
+
+
+class PartialSum(Generic[K]):
+    """
+    Mergeable totals per group and currency code. Totals are kept as signed subunit
+    integers, and become Fractions once a SubunitFraction is added, mirroring how the
+    sum of Money and SubunitFraction is a SubunitFraction.
+    """
+
+    __slots__ = ("totals",)
+
+    def __init__(self) -> None:
+        self.totals: dict[tuple[K, str], int | Fraction] = {}
+
+    def add(self, group: K, value: Monetary) -> None:
+        subunits = (
+            value.value if type(value) is SubunitFraction else _signed_subunits(value)
+        )
+        self.add_subunits(group, value.currency.code, subunits)
+
+    def add_subunits(self, group: K, code: str, subunits: int | Fraction) -> None:
+        key = group, code
+        self.totals[key] = self.totals.get(key, 0) + subunits
+
+    def merge(self, other: PartialSum[K]) -> None:
+        for (group, code), subunits in other.totals.items():
+            self.add_subunits(group, code, subunits)
+
+    def resolve(
+        self,
+        registry: CurrencyRegistry[Currency] = default_registry,
+    ) -> dict[K, dict[Currency, Monetary]]:
+        result = dict[K, dict[Currency, Monetary]]()
+        for (group, code), subunits in self.totals.items():
+            currency = registry[code]
+            result.setdefault(group, {})[currency] = (
+                SubunitFraction(subunits, currency)
+                if isinstance(subunits, Fraction)
+                else _dispatch_type(subunits, currency)
+            )
+        return result
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _reduce_values(
+    rows: list[T],
+    parse: Callable[[T], Monetary],
+) -> PartialSum[None]:
+    partial = PartialSum[None]()
+    add = partial.add
+    for row in rows:
+        add(None, parse(row))
+    return partial
+
+
+def _reduce_groups(
+    rows: list[T],
+    parse: Callable[[T], tuple[K, Monetary]],
+) -> PartialSum[K]:
+    partial = PartialSum[K]()
+    add = partial.add
+    for row in rows:
+        add(*parse(row))
+    return partial
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+
+
+def _chunks(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _ordered_results(
+    executor: Executor,
+    function: Callable[..., R],
+    arguments: Iterable[tuple[object, ...]],
+    window: int,
+) -> Iterator[R]:
+    # Unlike Executor.map(), this only submits a bounded number of tasks ahead of the
+    # consumed results, so that input doesn't need to be materialized in memory.
+    pending = deque[Future[R]]()
+    for args in arguments:
+        pending.append(executor.submit(function, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _run(
+    function: Callable[..., PartialSum[K]],
+    arguments: Iterable[tuple[object, ...]],
+    max_workers: int | None,
+) -> PartialSum[K]:
+    workers = max_workers or os.cpu_count() or 1
+    total = PartialSum[K]()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in _ordered_results(executor, function, arguments, 2 * workers):
+            total.merge(partial)
+    return total
+
+
+@overload
+def parallel_sum(
+    rows: Iterable[Monetary],
+    parse: None = None,
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[Currency, Monetary]: ...
+
+
+@overload
+def parallel_sum(
+    rows: Iterable[T],
+    parse: Callable[[T], Monetary],
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[Currency, Monetary]: ...
+
+
+def parallel_sum(
+    rows: Iterable[object],
+    parse: Callable[[Any], Monetary] | None = None,
+    *,
+    chunk_size: int = default_chunk_size,
+    max_workers: int | None = None,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> dict[Currency, Monetary]:
+    """
+    Sum rows per currency in worker processes. By default rows are expected to be
+    monetary values, passing a `parse` function allows moving parsing of raw rows into
+    the workers as well.
+    """
+    _check_chunk_size(chunk_size)
+    total = _run(
+        _reduce_values,
+        ((chunk, parse or _identity) for chunk in _chunks(rows, chunk_size)),
+        max_workers,
+    )
+    return total.resolve(registry).get(None, {})
+
+
+@overload
+def parallel_group_sum(
+    rows: Iterable[tuple[K, Monetary]],
+    parse: None = None,
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[K, dict[Currency, Monetary]]: ...
+
+
+@overload
+def parallel_group_sum(
+    rows: Iterable[T],
+    parse: Callable[[T], tuple[K, Monetary]],
+    *,
+    chunk_size: int = ...,
+    max_workers: int | None = ...,
+    registry: CurrencyRegistry[Currency] = ...,
+) -> dict[K, dict[Currency, Monetary]]: ...
+
+
+def parallel_group_sum(
+    rows: Iterable[object],
+    parse: Callable[[Any], tuple[Hashable, Monetary]] | None = None,
+    *,
+    chunk_size: int = default_chunk_size,
+    max_workers: int | None = None,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> dict[Any, dict[Currency, Monetary]]:
+    """
+    Sum rows per group and currency in worker processes. By default rows are expected
+    to be pairs of group key and monetary value.
+    """
+    _check_chunk_size(chunk_size)
+    total = _run(
+        _reduce_groups,
+        ((chunk, parse or _identity) for chunk in _chunks(rows, chunk_size)),
+        max_workers,
+    )
+    return total.resolve(registry)
+
+
+def parse_csv_line(line: str) -> Monetary:
+    """
+    Parse a line of the form "<currency code>,<amount>", where a negative amount is
+    interpreted as an overdraft.
+
+    >>> parse_csv_line("SEK,-12.50")
+    Overdraft('12.50', SEK)
+    """
+    code, amount = line.split(",")
+    value = Decimal(amount)
+    currency = default_registry[code]
+    return currency.overdraft(-value) if value < 0 else currency(value)
+
+
+def _file_ranges(
+    path: str | os.PathLike[str], chunk_size: int
+) -> list[tuple[int, int]]:
+    # Split the file into byte ranges of roughly chunk_size, aligned to line ends.
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as file:
+        while boundaries[-1] < size:
+            file.seek(boundaries[-1] + chunk_size)
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    return list(zip(boundaries, boundaries[1:], strict=False))
+
+
+def _reduce_file_range(
+    path: str | os.PathLike[str],
+    start: int,
+    end: int,
+    parse: Callable[[str], Monetary],
+) -> PartialSum[None]:
+    partial = PartialSum[None]()
+    add = partial.add
+    with open(path, "rb") as file:
+        file.seek(start)
+        for line in file.read(end - start).decode().splitlines():
+            if line:
+                add(None, parse(line))
+    return partial
+
+
+def parallel_sum_file(
+    path: str | os.PathLike[str],
+    parse: Callable[[str], Monetary] = parse_csv_line,
+    *,
+    chunk_size: int = default_file_chunk_size,
+    max_workers: int | None = None,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> dict[Currency, Monetary]:
+    """
+    Sum the values of a line-oriented text file per currency. The file is split into
+    byte ranges that are read and parsed by the worker processes, so that no values
+    need to be sent between processes. Empty lines are skipped.
+    """
+    _check_chunk_size(chunk_size)
+    total = _run(
+        _reduce_file_range,
+        ((path, start, end, parse) for start, end in _file_ranges(path, chunk_size)),
+        max_workers,
+    )
+    return total.resolve(registry).get(None, {})
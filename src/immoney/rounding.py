@@ -0,0 +1,199 @@
+"""
+Rounding of many fractions of subunits in one call.
+
+Values are given as SubunitFraction instances, or as pairs of a numerator and a positive
+denominator counted in subunits. Rounding is done with integer arithmetic in a single
+loop per rounding mode.
+
+>>> from immoney import Round
+>>> from immoney.currencies import SEK
+>>> round_subunits([SEK.fraction(5, 2), (-5, 2), (7, 3)], Round.HALF_EVEN)
+[2, -2, 2]
+>>> round_many([SEK.fraction(1, 2), SEK.fraction(-3, 2)], Round.UP)
+[Money('0.01', SEK), Overdraft('0.01', SEK)]
+
+When the rounded values must add up to the rounded total of the exact values, such as
+the lines of an invoice, use round_to_total().
+
+>>> shares = [SEK.fraction(100, 3)] * 3
+>>> round_many(shares, Round.HALF_UP)
+[Money('0.33', SEK), Money('0.33', SEK), Money('0.33', SEK)]
+>>> round_to_total(shares, Round.HALF_UP)
+[Money('0.34', SEK), Money('0.33', SEK), Money('0.33', SEK)]
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable
+from collections.abc import Sequence
+from fractions import Fraction
+from typing import TypeAlias
+
+from typing_extensions import assert_never
+
+from ._base import C_inv
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import Round
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _round_ratio
+from .errors import CurrencyMismatch
+
+__all__ = (
+    "Ratio",
+    "round_subunits",
+    "round_many",
+    "round_subunits_to_total",
+    "round_to_total",
+)
+
+Ratio: TypeAlias = tuple[int, int]
+
+
+def _ratios(values: Iterable[SubunitFraction[Currency] | Ratio]) -> list[Ratio]:
+    ratios = list[Ratio]()
+    append = ratios.append
+    for value in values:
+        if isinstance(value, SubunitFraction):
+            append((value.value.numerator, value.value.denominator))
+            continue
+        numerator, denominator = value
+        if denominator <= 0:
+            raise ValueError(f"Denominator must be positive, got {denominator}.")
+        append((numerator, denominator))
+    return ratios
+
+
+def _round_ratios(ratios: list[Ratio], rounding: Round) -> list[int]:
+    match rounding:
+        case Round.DOWN:
+            return [numerator // denominator for numerator, denominator in ratios]
+        case Round.UP:
+            return [-(-numerator // denominator) for numerator, denominator in ratios]
+        case Round.HALF_UP:
+            # floor(x + 1/2)
+            return [
+                (2 * numerator + denominator) // (2 * denominator)
+                for numerator, denominator in ratios
+            ]
+        case Round.HALF_DOWN:
+            # ceil(x - 1/2)
+            return [
+                -((denominator - 2 * numerator) // (2 * denominator))
+                for numerator, denominator in ratios
+            ]
+        case Round.HALF_EVEN:
+            results = list[int]()
+            append = results.append
+            for numerator, denominator in ratios:
+                quotient, remainder = divmod(numerator, denominator)
+                doubled = 2 * remainder
+                append(
+                    quotient
+                    + (
+                        doubled > denominator
+                        or (doubled == denominator and quotient & 1)
+                    )
+                )
+            return results
+        case no_match:
+            assert_never(no_match)
+
+
+def round_subunits(
+    values: Iterable[SubunitFraction[Currency] | Ratio],
+    rounding: Round,
+) -> list[int]:
+    """
+    Round values to signed integer subunits. Each value is rounded like
+    SubunitFraction.round_either().
+    """
+    return _round_ratios(_ratios(values), rounding)
+
+
+def round_many(
+    values: Iterable[SubunitFraction[C_inv]],
+    rounding: Round,
+) -> list[Money[C_inv] | Overdraft[C_inv]]:
+    """
+    Round values to Money, or Overdraft for negative results. Equivalent to calling
+    round_either() on each value.
+    """
+    values = list(values)
+    subunits = _round_ratios(_ratios(values), rounding)
+    return [
+        _dispatch_type(rounded, value.currency)
+        for rounded, value in zip(subunits, values, strict=True)
+    ]
+
+
+def _round_ratios_to_total(ratios: list[Ratio], rounding: Round) -> list[int]:
+    floors = list[int]()
+    remainders = list[Ratio]()
+    # The exact total is accumulated over the least common denominator.
+    total_numerator, total_denominator = 0, 1
+    for numerator, denominator in ratios:
+        quotient, remainder = divmod(numerator, denominator)
+        floors.append(quotient)
+        remainders.append((remainder, denominator))
+        if denominator == total_denominator:
+            total_numerator += numerator
+        else:
+            common = math.lcm(total_denominator, denominator)
+            total_numerator = total_numerator * (
+                common // total_denominator
+            ) + numerator * (common // denominator)
+            total_denominator = common
+    # The rounded total is at least the sum of the floors, and less than that plus
+    # the number of values, so each value is rounded up at most once.
+    shortfall = _round_ratio(total_numerator, total_denominator, rounding) - sum(floors)
+    # Values with the largest remainders are rounded up, and ties are broken by
+    # position, because nlargest() is stable.
+    for index in heapq.nlargest(
+        shortfall,
+        range(len(floors)),
+        key=lambda position: Fraction(*remainders[position]),
+    ):
+        floors[index] += 1
+    return floors
+
+
+def round_subunits_to_total(
+    values: Iterable[SubunitFraction[Currency] | Ratio],
+    rounding: Round,
+) -> list[int]:
+    """
+    Round values to signed integer subunits such that their sum equals the sum of
+    the exact values, rounded with the given mode. Values are rounded down, and the
+    remaining subunits are given to the values with the largest remainders.
+
+    >>> round_subunits_to_total([(1, 3), (1, 3), (1, 3)], Round.DOWN)
+    [1, 0, 0]
+    """
+    return _round_ratios_to_total(_ratios(values), rounding)
+
+
+def round_to_total(
+    values: Sequence[SubunitFraction[C_inv]],
+    rounding: Round,
+) -> list[Money[C_inv] | Overdraft[C_inv]]:
+    """
+    Round values of a single currency to Money, or Overdraft for negative results,
+    such that their sum equals the sum of the exact values rounded with the given
+    mode. Raises CurrencyMismatch for values of differing currencies.
+    """
+    if not values:
+        return []
+    currency = values[0].currency
+    if any(value.currency != currency for value in values):
+        raise CurrencyMismatch(
+            "Cannot round values of different currencies to a total."
+        )
+    return [
+        _dispatch_type(subunits, currency)
+        for subunits in _round_ratios_to_total(_ratios(values), rounding)
+    ]
@@ -0,0 +1,115 @@
+"""
+Sorting and selection of monetary values on plain numbers.
+
+Comparing monetary values with each other goes through Python-level comparison methods,
+which check the types and currencies of both operands for every comparison. The
+helpers in this module check currencies once per value instead, and sort on signed
+subunits, so that comparisons are made between ints, or Fractions for SubunitFraction.
+
+>>> from immoney.currencies import NOK, SEK
+>>> sorted_values([SEK(2), SEK.overdraft(1), SEK.fraction(1, 2)])
+[Overdraft('1.00', SEK), SubunitFraction('1/2', SEK), Money('2.00', SEK)]
+>>> nlargest(1, [SEK(2), SEK(3)])
+[Money('3.00', SEK)]
+>>> sorted_values([SEK(2), NOK(1), SEK(1)], by_currency=True)
+[Money('1.00', NOK), Money('1.00', SEK), Money('2.00', SEK)]
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from collections.abc import Sequence
+from fractions import Fraction
+from typing import TypeVar
+
+from ._base import Monetary
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _signed_subunits
+from .errors import CurrencyMismatch
+
+__all__ = (
+    "Monetary",
+    "sort_key",
+    "currency_sort_key",
+    "sorted_values",
+    "nlargest",
+    "nsmallest",
+)
+
+M = TypeVar("M", bound=Monetary)
+
+
+def sort_key(value: Monetary) -> int | Fraction:
+    """
+    Map a value to its signed subunits. Currencies are not taken into account, so this
+    is only a valid sort key for values of a single currency.
+
+    >>> from immoney.currencies import SEK
+    >>> sort_key(SEK.overdraft("1.50"))
+    -150
+    """
+    if type(value) is SubunitFraction:
+        return value.value
+    if type(value) is Money or type(value) is Overdraft:
+        return _signed_subunits(value)
+    raise TypeError(f"Cannot sort value of type {type(value).__qualname__!r}.")
+
+
+def currency_sort_key(value: Monetary) -> tuple[str, int | Fraction]:
+    """
+    Map a value to its currency code and signed subunits, ordering values by currency
+    first.
+    """
+    return value.currency.code, sort_key(value)
+
+
+def _check_currency(values: Sequence[Monetary]) -> None:
+    if not values:
+        return
+    currency = values[0].currency
+    for value in values:
+        if value.currency != currency:
+            raise CurrencyMismatch("Cannot order values of different currencies.")
+
+
+def sorted_values(
+    values: Iterable[M],
+    *,
+    reverse: bool = False,
+    by_currency: bool = False,
+) -> list[M]:
+    """
+    Return a sorted list of values. All values must be of the same currency, or
+    CurrencyMismatch is raised. With by_currency, values of any currencies are ordered
+    by currency code first, and then by amount.
+    """
+    result = list(values)
+    if by_currency:
+        result.sort(key=currency_sort_key, reverse=reverse)
+    else:
+        _check_currency(result)
+        result.sort(key=sort_key, reverse=reverse)
+    return result
+
+
+def nlargest(n: int, values: Iterable[M]) -> list[M]:
+    """
+    Return the n largest values, in descending order. All values must be of the same
+    currency, or CurrencyMismatch is raised.
+    """
+    result = list(values)
+    _check_currency(result)
+    return heapq.nlargest(n, result, key=sort_key)
+
+
+def nsmallest(n: int, values: Iterable[M]) -> list[M]:
+    """
+    Return the n smallest values, in ascending order. All values must be of the same
+    currency, or CurrencyMismatch is raised.
+    """
+    result = list(values)
+    _check_currency(result)
+    return heapq.nsmallest(n, result, key=sort_key)
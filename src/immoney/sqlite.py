@@ -0,0 +1,162 @@
+"""
+Storage of monetary values in SQLite through the sqlite3 module.
+
+Values that need to be aggregated or sorted inside SQLite are stored in two columns,
+signed integer subunits, where negative values are overdrafts, and a currency code.
+Use expand() or executemany() to split values into such column pairs, and
+typed_rows() or row_factory() to combine them when reading.
+
+register() additionally installs sqlite3 adapters and converters that store a value in
+a single column, in the compact form "<code>:<signed subunits>" or
+"<code>:<numerator>/<denominator>", and convert columns declared with the types
+MONEY and SUBUNIT_FRACTION when connecting with detect_types=PARSE_DECLTYPES.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Final
+from typing import TypeAlias
+
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+from ._compact import format_compact
+from ._compact import parse_compact_fraction
+from ._compact import parse_compact_money
+from .currencies import registry as default_registry
+from .registry import CurrencyRegistry
+
+__all__ = (
+    "money_type",
+    "subunit_fraction_type",
+    "register",
+    "expand",
+    "executemany",
+    "row_factory",
+    "typed_rows",
+)
+
+money_type: Final = "MONEY"
+subunit_fraction_type: Final = "SUBUNIT_FRACTION"
+
+ColumnPair: TypeAlias = tuple[int, int]
+default_columns: Final = ((0, 1),)
+
+
+def register(registry: CurrencyRegistry[Currency] = default_registry) -> None:
+    """
+    Register sqlite3 adapters for all monetary types, and converters for the declared
+    column types MONEY and SUBUNIT_FRACTION, resolving currencies through the given
+    registry. Adapters and converters are global to the sqlite3 module.
+    """
+    sqlite3.register_adapter(Money, format_compact)
+    sqlite3.register_adapter(Overdraft, format_compact)
+    sqlite3.register_adapter(SubunitFraction, format_compact)
+    sqlite3.register_converter(
+        money_type,
+        lambda data: parse_compact_money(data.decode(), registry),
+    )
+    sqlite3.register_converter(
+        subunit_fraction_type,
+        lambda data: parse_compact_fraction(data.decode(), registry),
+    )
+
+
+def expand(parameters: Iterable[object]) -> tuple[object, ...]:
+    """
+    Replace each Money and Overdraft parameter with its signed subunits followed by its
+    currency code.
+
+    >>> from immoney.currencies import SEK
+    >>> expand([1, SEK.overdraft("1.50")])
+    (1, -150, 'SEK')
+    """
+    expanded = list[object]()
+    for parameter in parameters:
+        if isinstance(parameter, Money | Overdraft):
+            expanded += _signed_subunits(parameter), parameter.currency.code
+        else:
+            expanded.append(parameter)
+    return tuple(expanded)
+
+
+def executemany(
+    target: sqlite3.Connection | sqlite3.Cursor,
+    sql: str,
+    rows: Iterable[Iterable[object]],
+) -> sqlite3.Cursor:
+    """
+    Execute a statement for each row of parameters, expanding monetary parameters into
+    subunits and currency code. Rows are consumed lazily.
+    """
+    return target.executemany(sql, map(expand, rows))
+
+
+def _combiner(
+    columns: tuple[ColumnPair, ...],
+    registry: CurrencyRegistry[Currency],
+) -> Callable[[tuple[object, ...]], tuple[object, ...]]:
+    values = dict(columns)
+    dropped = frozenset(values.values())
+    if len(dropped) != len(columns) or dropped & values.keys():
+        raise ValueError("Column pairs must not overlap.")
+
+    def combine(row: tuple[object, ...]) -> tuple[object, ...]:
+        result = list[object]()
+        for position, column in enumerate(row):
+            if position in dropped:
+                continue
+            if position in values and column is not None:
+                if not isinstance(column, int):
+                    raise TypeError(f"Expected integer subunits, got {column!r}.")
+                code = row[values[position]]
+                if not isinstance(code, str):
+                    raise TypeError(f"Expected a currency code, got {code!r}.")
+                column = _dispatch_type(column, registry[code])
+            result.append(column)
+        return tuple(result)
+
+    return combine
+
+
+def row_factory(
+    *columns: ColumnPair,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Callable[[sqlite3.Cursor, tuple[object, ...]], tuple[object, ...]]:
+    """
+    Create a row factory that combines each given pair of (subunits, currency code)
+    column positions into a single Money or Overdraft value, placed at the position of
+    the subunits column, and removes the currency code column. Null subunits become
+    None. Defaults to combining the first two columns.
+    """
+    combine = _combiner(columns or default_columns, registry)
+    return lambda cursor, row: combine(row)
+
+
+def typed_rows(
+    cursor: sqlite3.Cursor,
+    *columns: ColumnPair,
+    registry: CurrencyRegistry[Currency] = default_registry,
+) -> Iterator[tuple[object, ...]]:
+    """
+    Lazily yield the rows of an executed cursor with column pairs combined as described
+    for row_factory().
+
+    >>> from immoney.currencies import SEK
+    >>> connection = sqlite3.connect(":memory:")
+    >>> _ = connection.execute("CREATE TABLE t (amount INTEGER, currency TEXT)")
+    >>> _ = executemany(connection, "INSERT INTO t VALUES (?, ?)", [[SEK(2)], [SEK(3)]])
+    >>> cursor = connection.execute("SELECT SUM(amount), currency FROM t GROUP BY 2")
+    >>> list(typed_rows(cursor))
+    [(Money('5.00', SEK),)]
+    """
+    combine = _combiner(columns or default_columns, registry)
+    for row in cursor:
+        yield combine(row)
@@ -0,0 +1,300 @@
+"""
+Streaming statistics over monetary values, per currency.
+
+StreamStats consumes Money and Overdraft values, or raw signed subunits, and keeps an
+exact count, sum, minimum, and maximum for each currency, from which an exact mean is
+derived. Quantiles are approximated with a QuantileSketch, a sketch in the style of
+DDSketch with a bounded number of buckets, whose estimates have a bounded relative
+error. All state is plain integers keyed by currency code, so partial states are
+picklable and can be merged across workers, like parallel.PartialSum.
+
+>>> from immoney.currencies import SEK
+>>> stats = StreamStats()
+>>> stats.update([SEK(1), SEK(2), SEK.overdraft(3), SEK(10)])
+>>> stats.count(SEK)
+4
+>>> stats.total(SEK)
+Money('10.00', SEK)
+>>> stats.minimum(SEK), stats.maximum(SEK)
+(Overdraft('3.00', SEK), Money('10.00', SEK))
+>>> stats.mean(SEK)
+SubunitFraction('250', SEK)
+>>> stats.quantile(SEK, 0.5)
+Money('1.00', SEK)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from fractions import Fraction
+from typing import Final
+
+from ._base import C_inv
+from ._base import Currency
+from ._base import Money
+from ._base import Overdraft
+from ._base import SubunitFraction
+from ._base import _dispatch_type
+from ._base import _signed_subunits
+
+__all__ = (
+    "QuantileSketch",
+    "CurrencySummary",
+    "StreamStats",
+)
+
+default_relative_accuracy: Final = 0.01
+default_max_buckets: Final = 2048
+
+
+def _collapse(buckets: dict[int, int], max_buckets: int) -> None:
+    # The buckets of the smallest magnitudes are merged, which keeps estimates of
+    # large magnitudes accurate.
+    excess = len(buckets) - max_buckets
+    if excess <= 0:
+        return
+    indices = sorted(buckets)
+    merged = sum(buckets.pop(index) for index in indices[:excess])
+    buckets[indices[excess]] += merged
+
+
+class QuantileSketch:
+    """
+    A mergeable sketch of a distribution of signed integers, estimating quantiles
+    with a relative error of at most relative_accuracy, as long as the number of
+    buckets doesn't exceed max_buckets per sign. Beyond that, buckets of the smallest
+    magnitudes are merged, and only estimates of those lose accuracy.
+
+    >>> sketch = QuantileSketch()
+    >>> for value in range(1, 1001):
+    ...     sketch.add(value)
+    >>> round(sketch.quantile(0.9))
+    907
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "count",
+        "zero_count",
+        "positive",
+        "negative",
+        "_log_gamma",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = default_relative_accuracy,
+        max_buckets: int = default_max_buckets,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1.")
+        if max_buckets < 1:
+            raise ValueError("Sketches must have at least one bucket.")
+        self.relative_accuracy: Final = relative_accuracy
+        self.max_buckets: Final = max_buckets
+        self.count = 0
+        self.zero_count = 0
+        # Bucket counts of positive and negative values, keyed by the index of the
+        # logarithmic bucket of their magnitude.
+        self.positive: Final = dict[int, int]()
+        self.negative: Final = dict[int, int]()
+        self._log_gamma: Final = math.log(
+            (1 + relative_accuracy) / (1 - relative_accuracy)
+        )
+
+    def _index(self, magnitude: int) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _estimate(self, index: int) -> float:
+        gamma = math.exp(self._log_gamma)
+        return 2 * math.exp(index * self._log_gamma) / (gamma + 1)
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        if value > 0:
+            buckets = self.positive
+            index = self._index(value)
+        elif value < 0:
+            buckets = self.negative
+            index = self._index(-value)
+        else:
+            self.zero_count += 1
+            return
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            _collapse(buckets, self.max_buckets)
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different relative accuracy.")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for buckets, other_buckets in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+            _collapse(buckets, self.max_buckets)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile, for q between 0 and 1. Raises ValueError for empty
+        sketches.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        if self.count == 0:
+            raise ValueError("Cannot estimate quantiles of an empty sketch.")
+        rank = q * (self.count - 1)
+        cumulative = 0
+        for index in sorted(self.negative, reverse=True):
+            cumulative += self.negative[index]
+            if cumulative > rank:
+                return -self._estimate(index)
+        cumulative += self.zero_count
+        if cumulative > rank:
+            return 0.0
+        index = 0
+        for index in sorted(self.positive):
+            cumulative += self.positive[index]
+            if cumulative > rank:
+                break
+        return self._estimate(index)
+
+
+class CurrencySummary:
+    """
+    Exact statistics, and a quantile sketch, of the signed subunits of the values of
+    a single currency.
+    """
+
+    __slots__ = ("count", "total", "minimum", "maximum", "sketch")
+
+    def __init__(
+        self,
+        relative_accuracy: float = default_relative_accuracy,
+        max_buckets: int = default_max_buckets,
+    ) -> None:
+        self.count = 0
+        self.total = 0
+        self.minimum: int | None = None
+        self.maximum: int | None = None
+        self.sketch: Final = QuantileSketch(relative_accuracy, max_buckets)
+
+    def add(self, subunits: int) -> None:
+        self.count += 1
+        self.total += subunits
+        if self.minimum is None or subunits < self.minimum:
+            self.minimum = subunits
+        if self.maximum is None or subunits > self.maximum:
+            self.maximum = subunits
+        self.sketch.add(subunits)
+
+    def merge(self, other: CurrencySummary) -> None:
+        # The sketch raises for incompatible sketches before changing any state, so
+        # it's merged first to leave the summary unchanged in that case.
+        self.sketch.merge(other.sketch)
+        if other.minimum is None or other.maximum is None:
+            return
+        self.count += other.count
+        self.total += other.total
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+
+    def quantile(self, q: float) -> int:
+        """
+        Estimate the q-quantile in subunits, clamped to the exact minimum and maximum.
+        """
+        estimate = round(self.sketch.quantile(q))
+        assert self.minimum is not None and self.maximum is not None
+        return min(max(estimate, self.minimum), self.maximum)
+
+
+class StreamStats:
+    """
+    Statistics of a stream of values, per currency. Reading statistics of a currency
+    without any values raises KeyError, except for count().
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "summaries")
+
+    def __init__(
+        self,
+        relative_accuracy: float = default_relative_accuracy,
+        max_buckets: int = default_max_buckets,
+    ) -> None:
+        self.relative_accuracy: Final = relative_accuracy
+        self.max_buckets: Final = max_buckets
+        self.summaries: Final = dict[str, CurrencySummary]()
+
+    def _summary(self, code: str) -> CurrencySummary:
+        try:
+            return self.summaries[code]
+        except KeyError:
+            summary = self.summaries[code] = CurrencySummary(
+                self.relative_accuracy,
+                self.max_buckets,
+            )
+            return summary
+
+    def add_subunits(self, currency: Currency, subunits: int) -> None:
+        self._summary(currency.code).add(subunits)
+
+    def add(self, value: Money[Currency] | Overdraft[Currency]) -> None:
+        self._summary(value.currency.code).add(_signed_subunits(value))
+
+    def update(self, values: Iterable[Money[Currency] | Overdraft[Currency]]) -> None:
+        # Summaries are looked up once per run of values of the same currency.
+        code = None
+        add = None
+        for value in values:
+            if value.currency.code != code:
+                code = value.currency.code
+                add = self._summary(code).add
+            assert add is not None
+            add(_signed_subunits(value))
+
+    def merge(self, other: StreamStats) -> None:
+        """
+        Merge the statistics of another stream. Raises ValueError, leaving the
+        statistics unchanged, if the streams have different relative accuracy.
+        """
+        if any(
+            summary.sketch.relative_accuracy != self.relative_accuracy
+            for summary in other.summaries.values()
+        ):
+            raise ValueError("Cannot merge statistics of different relative accuracy.")
+        for code, summary in other.summaries.items():
+            self._summary(code).merge(summary)
+
+    def count(self, currency: Currency) -> int:
+        summary = self.summaries.get(currency.code)
+        return 0 if summary is None else summary.count
+
+    def total(self, currency: C_inv) -> Money[C_inv] | Overdraft[C_inv]:
+        return _dispatch_type(self.summaries[currency.code].total, currency)
+
+    def minimum(self, currency: C_inv) -> Money[C_inv] | Overdraft[C_inv]:
+        minimum = self.summaries[currency.code].minimum
+        assert minimum is not None
+        return _dispatch_type(minimum, currency)
+
+    def maximum(self, currency: C_inv) -> Money[C_inv] | Overdraft[C_inv]:
+        maximum = self.summaries[currency.code].maximum
+        assert maximum is not None
+        return _dispatch_type(maximum, currency)
+
+    def mean(self, currency: C_inv) -> SubunitFraction[C_inv]:
+        summary = self.summaries[currency.code]
+        return SubunitFraction(Fraction(summary.total, summary.count), currency)
+
+    def quantile(self, currency: C_inv, q: float) -> Money[C_inv] | Overdraft[C_inv]:
+        """
+        Estimate the q-quantile of the values of the currency, for q between 0 and 1.
+        """
+        return _dispatch_type(self.summaries[currency.code].quantile(q), currency)
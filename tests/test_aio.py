@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from typing import TypeVar
+
+import pytest
+
+from immoney.aio import async_group_sum
+from immoney.aio import async_sum
+from immoney.aio import count_windows
+from immoney.aio import time_windows
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.parallel import Monetary
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+from .test_parallel import parse_group_row
+from .test_parallel import parse_row
+from .test_parallel import random_values
+from .test_parallel import sequential_sum
+
+T = TypeVar("T")
+
+
+async def stream(rows: Iterable[T]) -> AsyncIterator[T]:
+    for row in rows:
+        yield row
+
+
+async def collect(iterator: AsyncIterator[T]) -> list[T]:
+    return [item async for item in iterator]
+
+
+class TestAsyncSum:
+    @pytest.mark.parametrize("batch_size", [1, 7, 1_000])
+    def test_equals_sequential_sum(self, batch_size: int) -> None:
+        values = random_values(seed=batch_size, count=300)
+        result = asyncio.run(async_sum(stream(values), batch_size=batch_size))
+        assert result == sequential_sum(values)
+
+    def test_sum_of_empty_input_is_empty(self) -> None:
+        assert asyncio.run(async_sum(stream([]))) == {}
+
+    def test_can_parse_rows(self) -> None:
+        rows = [("SEK", 100), ("NOK", 5), ("SEK", 250)]
+        result = asyncio.run(async_sum(stream(rows), parse_row))
+        assert result == {SEK: SEK("3.50"), NOK: NOK("0.05")}
+
+    def test_resolves_currencies_with_registry(self) -> None:
+        result = asyncio.run(
+            async_sum(stream([JCN(1), JCN(2)]), registry=custom_registry)
+        )
+        assert result == {JCN: JCN(3)}
+
+    def test_yields_to_event_loop_once_per_batch(self) -> None:
+        async def run() -> int:
+            ticks = 0
+
+            async def ticker() -> None:
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            ticks = 0
+            await async_sum(stream([SEK(1)] * 100), batch_size=10)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) == 10
+
+    def test_raises_value_error_for_invalid_batch_size(self) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(async_sum(stream([SEK(1)]), batch_size=0))
+
+
+class TestAsyncGroupSum:
+    def test_sums_per_group_and_currency(self) -> None:
+        rows: list[tuple[str, Monetary]] = [
+            ("a", SEK(1)),
+            ("b", SEK(2)),
+            ("a", NOK(3)),
+            ("a", SEK.overdraft(4)),
+        ]
+        result = asyncio.run(async_group_sum(stream(rows), batch_size=2))
+        assert result == {
+            "a": {SEK: SEK.overdraft(3), NOK: NOK(3)},
+            "b": {SEK: SEK(2)},
+        }
+
+    def test_can_parse_rows(self) -> None:
+        rows = [("a", "SEK", 1), ("a", "SEK", 2), ("b", "NOK", 3)]
+        result = asyncio.run(async_group_sum(stream(rows), parse_group_row))
+        assert result == {
+            "a": {SEK: SEK.from_subunit(3)},
+            "b": {NOK: NOK.from_subunit(3)},
+        }
+
+
+class TestCountWindows:
+    @pytest.mark.parametrize("size", [1, 3, 10, 400])
+    def test_windows_equal_sequential_sums_of_chunks(self, size: int) -> None:
+        values = random_values(seed=size, count=100)
+        windows = asyncio.run(collect(count_windows(stream(values), size)))
+        assert windows == [
+            sequential_sum(values[start : start + size])
+            for start in range(0, len(values), size)
+        ]
+
+    def test_reads_source_as_windows_are_consumed(self) -> None:
+        consumed = 0
+
+        async def source() -> AsyncIterator[Monetary]:
+            nonlocal consumed
+            for _ in range(10):
+                consumed += 1
+                yield SEK(1)
+
+        async def run() -> None:
+            windows = count_windows(source(), 2)
+            assert await anext(windows) == {SEK: SEK(2)}
+            assert consumed == 2
+            await windows.aclose()  # type: ignore[attr-defined]
+
+        asyncio.run(run())
+
+    def test_raises_value_error_for_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(collect(count_windows(stream([SEK(1)]), 0)))
+
+
+class TestTimeWindows:
+    def test_yields_non_empty_tumbling_windows(self) -> None:
+        rows: list[tuple[float, Monetary]] = [
+            (10.0, SEK(1)),
+            (14.9, NOK(2)),
+            (15.0, SEK(3)),
+            (31.0, SEK.overdraft(4)),
+            (31.5, SEK(1)),
+        ]
+        windows = asyncio.run(collect(time_windows(stream(rows), 5, batch_size=2)))
+        assert windows == [
+            (10.0, {SEK: SEK(1), NOK: NOK(2)}),
+            (15.0, {SEK: SEK(3)}),
+            (30.0, {SEK: SEK.overdraft(3)}),
+        ]
+
+    def test_can_parse_rows(self) -> None:
+        rows = [(0, "SEK", 100), (1, "SEK", 50), (60, "NOK", 5)]
+        windows = asyncio.run(
+            collect(
+                time_windows(
+                    stream(rows),
+                    60,
+                    lambda row: (row[0], parse_row(row[1:])),
+                )
+            )
+        )
+        assert windows == [(0, {SEK: SEK("1.50")}), (60, {NOK: NOK("0.05")})]
+
+    def test_raises_value_error_for_decreasing_timestamps(self) -> None:
+        rows: list[tuple[float, Monetary]] = [(2.0, SEK(1)), (1.0, SEK(1))]
+        with pytest.raises(ValueError, match="must not decrease"):
+            asyncio.run(collect(time_windows(stream(rows), 5)))
+
+    def test_raises_value_error_for_invalid_width(self) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(collect(time_windows(stream([(0.0, SEK(1))]), 0)))
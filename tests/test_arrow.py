@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import none
+from hypothesis.strategies import one_of
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney._base import _dispatch_type
+from immoney.arrow import MoneyType
+from immoney.arrow import from_arrow
+from immoney.arrow import to_arrow
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+
+class TestToArrow:
+    @given(lists(one_of(none(), integers(min_value=-(2**63), max_value=2**63 - 1))))
+    def test_roundtrips_values(self, subunits: list[int | None]) -> None:
+        values = [
+            None if value is None else _dispatch_type(value, SEK) for value in subunits
+        ]
+        array = to_arrow(values)
+        assert array.type == MoneyType()
+        assert from_arrow(array) == values
+
+    def test_roundtrips_mixed_currencies(self) -> None:
+        values: list[Money[Currency] | Overdraft[Currency] | None] = [
+            SEK("1.50"),
+            NOK.overdraft("0.01"),
+            None,
+            SEK(0),
+        ]
+        array = to_arrow(values)
+        assert array.storage.field("subunits").to_pylist() == [150, -1, 0, 0]
+        assert array.storage.field("currency").dictionary.to_pylist() == [
+            "SEK",
+            "NOK",
+        ]
+        assert array.to_pylist() == values  # type: ignore[misc]
+
+    def test_uses_given_registry(self) -> None:
+        array = to_arrow([JCN("1.23")])
+        assert from_arrow(array, custom_registry) == [JCN("1.23")]
+
+    def test_raises_overflow_error_for_large_values(self) -> None:
+        with pytest.raises(OverflowError):
+            to_arrow([SEK.from_subunit(2**63)])
+
+    def test_raises_type_error_for_subunit_fraction(self) -> None:
+        with pytest.raises(TypeError):
+            to_arrow([SEK.fraction(1, 3)])  # type: ignore[list-item]
+
+
+class TestParquet:
+    def test_roundtrips_through_parquet(self, tmp_path: Path) -> None:
+        values: list[Money[Currency] | Overdraft[Currency] | None] = [
+            SEK("1.50"),
+            None,
+            NOK.overdraft("2.00"),
+        ]
+        path = tmp_path / "values.parquet"
+        pq.write_table(pa.table({"value": to_arrow(values)}), path)
+        column = pq.read_table(path).column("value")
+        assert column.type == MoneyType()
+        assert from_arrow(column) == values
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney._base import _dispatch_type
+from immoney.binary import CurrencyIndex
+from immoney.binary import code_id
+from immoney.binary import escape
+from immoney.binary import iter_unpack
+from immoney.binary import pack
+from immoney.binary import pack_into
+from immoney.binary import pack_many
+from immoney.binary import packed_size
+from immoney.binary import record
+from immoney.binary import unpack
+from immoney.binary import unpack_from
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.currencies import registry
+from immoney.errors import ParseError
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+values = tuples(
+    integers() | integers(min_value=-(2**63), max_value=2**63 - 1),
+    sampled_from(tuple(registry.values())),
+).map(lambda pair: _dispatch_type(*pair))
+
+
+class TestCurrencyIndex:
+    def test_default_ids_are_derived_from_codes(self) -> None:
+        index = CurrencyIndex()
+        assert list(index.codes) == sorted(registry)
+        assert index.id_of(SEK) == code_id("SEK") == (18 * 26 + 4) * 26 + 10
+        assert index[index.id_of(SEK)] is SEK
+        assert len({index.id_of(registry[code]) for code in registry}) == len(registry)
+
+    def test_default_ids_do_not_depend_on_registry_contents(self) -> None:
+        # Ids of a registry without some currencies, such as that of an older or
+        # newer version, are unchanged.
+        assert CurrencyIndex(custom_registry).id_of(JCN) == code_id("JCN")
+        data = pack_many([SEK(1), NOK.overdraft(2)])
+        assert data == record.pack(code_id("SEK"), 100) + record.pack(
+            code_id("NOK"), -200
+        )
+
+    @pytest.mark.parametrize("code", ["SE", "SEKK", "sek", "SE1", "ÅÄÖ"])
+    def test_code_id_raises_value_error_for_invalid_code(self, code: str) -> None:
+        with pytest.raises(ValueError):
+            code_id(code)
+
+    def test_can_use_explicit_codes(self) -> None:
+        index = CurrencyIndex(custom_registry, codes=["MCN", "JCN"])
+        assert index.id_of(JCN) == 1
+        assert len(index) == 2
+
+    def test_raises_key_error_for_unknown_currency(self) -> None:
+        with pytest.raises(KeyError):
+            CurrencyIndex(codes=["SEK"]).id_of(NOK)
+
+    def test_raises_parse_error_for_unknown_id(self) -> None:
+        with pytest.raises(ParseError):
+            CurrencyIndex(codes=["SEK"])[1]
+
+
+class TestPack:
+    @given(values)
+    def test_roundtrips_value(
+        self, value: Money[Currency] | Overdraft[Currency]
+    ) -> None:
+        data = pack(value)
+        assert len(data) == packed_size(value)
+        assert unpack(data) is value
+        assert unpack(memoryview(data)) is value
+
+    def test_encodes_int64_values_as_fixed_width_record(self) -> None:
+        index = CurrencyIndex(codes=["NOK", "SEK"])
+        assert pack(SEK.overdraft("1.50"), index) == record.pack(1, -150)
+        assert pack(SEK.from_subunit(2**63 - 1), index) == record.pack(1, 2**63 - 1)
+
+    def test_escapes_big_ints(self) -> None:
+        index = CurrencyIndex(codes=["SEK"])
+        data = pack(SEK.from_subunit(2**63), index)
+        assert record.unpack_from(data) == (escape, 9)
+        assert int.from_bytes(data[record.size :], "little", signed=True) == 2**63
+        assert unpack(data, index) == SEK.from_subunit(2**63)
+
+    def test_pack_into_returns_next_offset(self) -> None:
+        buffer = bytearray(2 * record.size)
+        offset = pack_into(buffer, 0, SEK(1))
+        assert pack_into(buffer, offset, NOK(2)) == len(buffer)
+        assert unpack_from(buffer, offset) == (NOK(2), len(buffer))
+
+    def test_raises_parse_error_for_truncated_input(self) -> None:
+        data = pack(SEK.from_subunit(2**70))
+        with pytest.raises(ParseError):
+            unpack(data[:5])
+        with pytest.raises(ParseError):
+            unpack(data[:-1])
+
+    def test_raises_parse_error_for_trailing_data(self) -> None:
+        with pytest.raises(ParseError):
+            unpack(pack(SEK(1)) + b"\0")
+
+
+class TestPackMany:
+    @given(lists(values))
+    def test_roundtrips_values(
+        self,
+        items: list[Money[Currency] | Overdraft[Currency]],
+    ) -> None:
+        buffer = pack_many(items)
+        assert len(buffer) == sum(packed_size(value) for value in items)
+        assert list(iter_unpack(memoryview(buffer))) == items
+
+    def test_buffer_without_escapes_is_array_of_records(self) -> None:
+        index = CurrencyIndex(codes=["SEK", "NOK"])
+        buffer = pack_many([SEK(1), NOK.overdraft(2)], index)
+        assert list(record.iter_unpack(buffer)) == [(0, 100), (1, -200)]
+
+    def test_iter_unpack_raises_parse_error_for_truncated_buffer(self) -> None:
+        buffer = pack_many([SEK(1), SEK(2)])
+        with pytest.raises(ParseError):
+            list(iter_unpack(buffer[:-1]))
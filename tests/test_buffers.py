@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from hypothesis import example
+from hypothesis import given
+from hypothesis.strategies import decimals
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import text
+
+from immoney import Currency
+from immoney.buffers import parse_money
+from immoney.buffers import parse_money_many
+from immoney.buffers import parse_overdraft
+from immoney.buffers import parse_overdraft_many
+from immoney.buffers import parse_subunits
+from immoney.buffers import parse_subunits_many
+from immoney.currencies import BHD
+from immoney.currencies import JPY
+from immoney.currencies import SEK
+from immoney.currencies import registry
+from immoney.errors import InvalidOverdraftValue
+from immoney.errors import ParseError
+
+currencies = sampled_from(tuple(registry.values()))
+ascii_amounts = text(alphabet="0123456789.-+_ ", max_size=12)
+buffer_types = sampled_from([bytes, bytearray, memoryview])
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        ("data", "currency", "expected"),
+        [
+            (b"0", SEK, 0),
+            (b"12.50", SEK, 1250),
+            (b"12.5", SEK, 1250),
+            (b"12.500000", SEK, 1250),
+            (b".5", SEK, 50),
+            (b"1e2", SEK, 10_000),
+            (b" 1.25 ", SEK, 125),
+            (b"12", JPY, 12),
+            (b"0.001", BHD, 1),
+        ],
+    )
+    def test_parses_amounts(
+        self,
+        data: bytes,
+        currency: Currency,
+        expected: int,
+    ) -> None:
+        for buffer in (data, bytearray(data), memoryview(data)):
+            assert parse_subunits(buffer, currency) == expected
+            assert parse_money(buffer, currency) == currency.from_subunit(expected)
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"1.001", b"-1", b"abc", b"1..0", b"NaN", b"Infinity", b"\xff"],
+    )
+    def test_raises_parse_error(self, data: bytes) -> None:
+        with pytest.raises(ParseError):
+            parse_money(memoryview(data), SEK)
+
+    @given(ascii_amounts, currencies)
+    @example("1.001", SEK)
+    @example("1e2", SEK)
+    @example("1" * 30, SEK)
+    @example("1" * 20 + ".50", SEK)
+    def test_agrees_with_parsing_str(self, amount: str, currency: Currency) -> None:
+        try:
+            expected = currency(amount)
+        except ParseError as exception:
+            with pytest.raises(type(exception)):
+                parse_money(amount.encode(), currency)
+        else:
+            assert parse_money(amount.encode(), currency) == expected
+
+    @given(decimals(min_value=0, allow_nan=False, allow_infinity=False), currencies)
+    def test_agrees_with_parsing_decimal(
+        self,
+        amount: Decimal,
+        currency: Currency,
+    ) -> None:
+        data = str(amount).encode()
+        try:
+            expected = currency(amount)
+        except ParseError:
+            with pytest.raises(ParseError):
+                parse_money(data, currency)
+        else:
+            assert parse_money(data, currency) == expected
+
+    def test_parses_overdraft(self) -> None:
+        assert parse_overdraft(b"1.50", SEK) == SEK.overdraft("1.50")
+        with pytest.raises(InvalidOverdraftValue):
+            parse_overdraft(b"0.00", SEK)
+
+
+class TestParseMany:
+    @given(
+        lists(integers(min_value=0, max_value=10**12)),
+        buffer_types,
+        sampled_from([b",", b";", b"\r\n"]),
+    )
+    def test_roundtrips_formatted_amounts(
+        self,
+        subunits: list[int],
+        buffer_type: type[bytes | bytearray | memoryview],
+        delimiter: bytes,
+    ) -> None:
+        values = [SEK.from_subunit(value) for value in subunits]
+        buffer = buffer_type(
+            delimiter.join(str(value.decimal).encode() for value in values)
+        )
+        assert parse_subunits_many(buffer, SEK, delimiter) == subunits
+        assert parse_money_many(buffer, SEK, delimiter) == values
+
+    def test_parses_overdrafts(self) -> None:
+        assert parse_overdraft_many(b"1,0.5", SEK) == [
+            SEK.overdraft(1),
+            SEK.overdraft("0.5"),
+        ]
+
+    @pytest.mark.parametrize("buffer", [b"1,", b",1", b"1,,2", b"1,x"])
+    def test_raises_parse_error_for_invalid_fields(self, buffer: bytes) -> None:
+        with pytest.raises(ParseError):
+            parse_money_many(buffer, SEK)
+
+    def test_raises_value_error_for_empty_delimiter(self) -> None:
+        with pytest.raises(ValueError):
+            parse_money_many(b"1", SEK, delimiter=b"")
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from immoney import Money
+from immoney import Rate
+from immoney.cache import CacheInfo
+from immoney.cache import cache_info
+from immoney.cache import default_maxsize
+from immoney.cache import dump
+from immoney.cache import entries
+from immoney.cache import hit_rate
+from immoney.cache import read
+from immoney.cache import record
+from immoney.cache import resize
+from immoney.cache import warm
+from immoney.cache import warm_from_file
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import ParseError
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> Iterator[None]:
+    resize(default_maxsize)
+    record(True)
+    yield
+    record(False)
+    resize(default_maxsize)
+
+
+def test_entries_of_recently_created_instances() -> None:
+    SEK("1.50")
+    NOK.overdraft("0.01")
+    Rate("0.25")
+    SEK.fraction(-1, 3)
+    SEK("1.50")
+    assert entries() == [
+        ("Money", "SEK", "150"),
+        ("Overdraft", "NOK", "1"),
+        ("SubunitFraction", "SEK", "-1/3"),
+    ]
+
+
+def test_entries_keep_most_recent_position_of_recreated_instances() -> None:
+    resize(1)
+    SEK(1)
+    SEK(2)
+    SEK(1)
+    resize(3)
+    SEK(1)
+    SEK(2)
+    SEK(1)
+    assert entries() == [("Money", "SEK", "100"), ("Money", "SEK", "200")]
+
+
+def test_resize_bounds_cache() -> None:
+    resize(2)
+    for value in range(5):
+        SEK(value)
+    assert cache_info().maxsize == 2
+    assert cache_info().currsize == 2
+    assert entries() == [("Money", "SEK", "300"), ("Money", "SEK", "400")]
+
+
+def test_entries_raise_value_error_unless_recording() -> None:
+    record(False)
+    SEK("1.50")
+    with pytest.raises(ValueError):
+        entries()
+    record(True)
+    assert entries() == []
+    SEK("2.50")
+    assert entries() == [("Money", "SEK", "250")]
+
+
+def test_resize_raises_value_error_for_negative_size() -> None:
+    with pytest.raises(ValueError):
+        resize(-1)
+
+
+def test_warm_from_snapshot_file(tmp_path: Path) -> None:
+    SEK("1.50")
+    SEK.overdraft(2)
+    SEK.fraction(1, 3)
+    path = tmp_path / "snapshot"
+    assert dump(path) == 3
+    assert (
+        path.read_text()
+        == "Money SEK 150\nOverdraft SEK 200\nSubunitFraction SEK 1/3\n"
+    )
+
+    resize(default_maxsize)
+    assert warm_from_file(path) == 3
+    baseline = cache_info()
+    SEK("1.50")
+    SEK.overdraft(2)
+    SEK.fraction(1, 3)
+    assert hit_rate(baseline) == 1.0
+    SEK("2.50")
+    assert hit_rate(baseline) == 0.75
+
+
+def test_warm_from_values_and_custom_registry() -> None:
+    assert warm([SEK("0.10"), SEK.overdraft(1), SEK.fraction(1, 7)]) == 3
+    assert warm([("Money", "JCN", "5")], custom_registry) == 1
+    baseline = cache_info()
+    JCN("0.05")
+    SEK.fraction(1, 7)
+    assert hit_rate(baseline) == 1.0
+
+
+def test_hit_rate_counts_preallocated_instances() -> None:
+    SEK.preallocate(100)
+    try:
+        SEK("0.50")
+        SEK.from_subunit(60)
+        Money.from_subunit(70, SEK)
+        SEK("1.50")
+    finally:
+        SEK.preallocate(0)
+    assert cache_info().hits == 3
+    assert hit_rate() == 0.75
+    resize(default_maxsize)
+    assert hit_rate() == 0.0
+
+
+def test_hit_rate_is_not_negative_after_resize() -> None:
+    SEK.preallocate(10)
+    try:
+        SEK.from_subunit(1)
+        SEK(1)
+        SEK(1)
+    finally:
+        SEK.preallocate(0)
+    baseline = cache_info()
+    assert isinstance(baseline, CacheInfo)
+    resize(default_maxsize)
+    SEK(2)
+    assert hit_rate(baseline) == 0.0
+    SEK(2)
+    assert 0.0 <= hit_rate(baseline) <= 1.0
+
+
+def test_hit_rate_is_zero_without_instantiations() -> None:
+    assert hit_rate() == 0.0
+    assert hit_rate(cache_info()) == 0.0
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        ("Rate", "SEK", "1"),
+        ("Money", "ABC", "1"),
+        ("Money", "SEK", "1.5"),
+        ("Overdraft", "SEK", "0"),
+        ("SubunitFraction", "SEK", "1/0"),
+    ],
+)
+def test_warm_raises_parse_error_for_invalid_entry(entry: tuple[str, str, str]) -> None:
+    with pytest.raises(ParseError):
+        warm([entry])
+
+
+def test_read_skips_empty_lines_and_rejects_invalid_lines(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    path.write_text("\nMoney SEK 1\n\n")
+    assert list(read(path)) == [("Money", "SEK", "1")]
+    path.write_text("Money SEK\n")
+    with pytest.raises(ParseError):
+        list(read(path))
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import pickle
+from collections.abc import Iterator
 from decimal import Decimal
 from fractions import Fraction
 from typing import Final
@@ -15,13 +18,16 @@ from hypothesis.strategies import text
 from immoney import Currency
 from immoney import Money
 from immoney import Overdraft
+from immoney import Round
 from immoney._base import SubunitFraction
+from immoney._base import _dispatch_type
 from immoney._base import valid_subunit
 from immoney.currencies import SEK
 from immoney.errors import FrozenInstanceError
 from immoney.errors import InvalidSubunit
 from immoney.errors import ParseError
 
+from .custom_currency import JCN
 from .strategies import valid_money_subunits
 from .strategies import valid_sek_decimals
 
@@ -60,6 +66,7 @@ def test_call_instantiates_money(value: int) -> None:
 @given(name=text(), value=valid_money_subunits | text())
 @example(name="code", value="USD")
 @example(name="subunit", value=1)
+@example(name="_hash", value=1)
 def test_raises_on_assignment(name: str, value: object) -> None:
     initial = getattr(SEK, name, None)
 
@@ -71,6 +78,12 @@ def test_raises_on_assignment(name: str, value: object) -> None:
     assert initial == getattr(SEK, name, None)
 
 
+def test_hash_is_computed_once_per_class() -> None:
+    assert hash(SEK) == type(SEK)._hash
+    assert hash(SEK) != hash(JCN)
+    assert {SEK: "a", JCN: "b"}[SEK] == "a"
+
+
 @pytest.mark.parametrize("subunit_value", valid_subunit)
 def test_decimal_exponent_is_width_of_subunit(subunit_value: int) -> None:
     class Subclass(Currency):
@@ -167,3 +180,111 @@ class TestFraction:
         value = SEK.fraction(subunit_value)
         assert value.value == expected_fraction
         assert value.currency is SEK
+
+
+@pytest.mark.parametrize("currency", [SEK, JCN])
+def test_pickle_roundtrip_returns_singleton(currency: Currency) -> None:
+    assert pickle.loads(pickle.dumps(currency)) is currency
+
+
+class UnboundType(Currency):
+    code = "UNB"
+    subunit = 100
+
+
+unbound = UnboundType()
+
+
+def test_pickle_copies_currency_not_bound_to_module_level_code() -> None:
+    restored = pickle.loads(pickle.dumps(unbound))
+    assert type(restored) is UnboundType
+    assert restored.code == "UNB"
+    money, overdraft = pickle.loads(
+        pickle.dumps([unbound("1.50"), unbound.overdraft(2)])
+    )
+    assert money.currency is overdraft.currency
+    assert money == money.currency("1.50")
+    assert overdraft == money.currency.overdraft(2)
+
+
+def test_values_pickle_with_stable_reconstructor() -> None:
+    assert b"_restore_signed_subunits" in pickle.dumps(SEK(1))
+    assert b"_restore_signed_subunits" in pickle.dumps(SEK.overdraft(1))
+
+
+def test_copy_returns_self() -> None:
+    assert copy.copy(SEK) is SEK
+    assert copy.deepcopy({"currency": SEK})["currency"] is SEK
+
+
+class TestPreallocation:
+    @pytest.fixture(autouse=True)
+    def _release(self) -> Iterator[None]:
+        yield
+        SEK.preallocate(0)
+
+    def test_is_disabled_by_default(self) -> None:
+        assert SEK.preallocated_subunits == 0
+        assert SEK._preallocated == ()
+
+    def test_returns_preallocated_instances(self) -> None:
+        SEK.preallocate(1_000)
+        preallocated = SEK._preallocated
+        assert len(preallocated) == 1_000
+        assert SEK.from_subunit(999) is preallocated[999]
+        assert Money.from_subunit(0, SEK) is preallocated[0]
+        assert SEK(3) + SEK(2) is preallocated[500]
+        assert SEK.fraction(7, 2).round_money(Round.DOWN) is preallocated[3]
+        assert (SEK.overdraft(1) + SEK(2)) is preallocated[100]
+        assert SEK.from_subunit(1_000) == Money(10, SEK)
+
+    def test_every_construction_returns_preallocated_instance(self) -> None:
+        SEK.preallocate(1_000)
+        value = SEK.from_subunit(200)
+        assert value is SEK._preallocated[200]
+        assert SEK("2.00") is value
+        assert Money(2, SEK) is value
+        assert Money(subunits=200, currency=SEK) is value
+        assert pickle.loads(pickle.dumps(SEK("2.00"))) is value
+        assert copy.deepcopy(value) is value
+
+    def test_only_serves_non_negative_integers(self) -> None:
+        SEK.preallocate(10)
+        assert _dispatch_type(-1, SEK) == SEK.overdraft_from_subunit(1)
+        assert all(SEK.from_subunit(True) is not value for value in SEK._preallocated)
+        assert all(
+            Money(subunits=True, currency=SEK) is not value
+            for value in SEK._preallocated
+        )
+
+    def test_keeps_invalid_arguments_raising(self) -> None:
+        SEK.preallocate(10)
+        with pytest.raises(TypeError):
+            SEK.from_subunit(1.5)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            Money.from_subunit(1, "SEK")  # type: ignore[type-var]
+        with pytest.raises(ParseError):
+            SEK.from_subunit(-1)
+
+    def test_preallocate_replaces_and_releases_table(self) -> None:
+        SEK.preallocate(10)
+        first = SEK.from_subunit(5)
+        SEK.preallocate(20)
+        assert SEK.from_subunit(5) is not first
+        assert SEK.from_subunit(5) == first
+        SEK.preallocate(0)
+        assert SEK._preallocated == ()
+
+    def test_raises_value_error_for_negative_stop(self) -> None:
+        with pytest.raises(ValueError):
+            SEK.preallocate(-1)
+
+    def test_class_variable_configures_table(self) -> None:
+        class PreallocatedType(Currency):
+            code = "PRE"
+            subunit = 100
+            preallocated_subunits = 100
+
+        currency = PreallocatedType()
+        assert currency.from_subunit(99) is currency.from_subunit(99)
+        assert currency.from_subunit(99) is currency._preallocated[99]
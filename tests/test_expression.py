@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import decimals
+from hypothesis.strategies import fractions
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Money
+from immoney import Overdraft
+from immoney import Rate
+from immoney import Round
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import CurrencyMismatch
+from immoney.errors import DivisionByZero
+from immoney.expression import CompiledExpression
+from immoney.expression import Constant
+from immoney.expression import Value
+from immoney.expression import Variable
+
+from .strategies import SEKMonetary
+from .strategies import monies
+from .strategies import sek_monetaries
+
+scalars = (
+    integers() | fractions() | decimals(allow_nan=False, allow_infinity=False, places=4)
+)
+
+a = Variable("a")
+b = Variable("b")
+x = Variable("x")
+
+
+def _signed(value: SEKMonetary) -> Fraction:
+    if isinstance(value, Money):
+        return Fraction(value.subunits)
+    if isinstance(value, Overdraft):
+        return Fraction(-value.subunits)
+    return value.value
+
+
+class TestEvaluate:
+    @given(sek_monetaries, sek_monetaries, scalars, sampled_from(Round))
+    def test_agrees_with_eager_arithmetic(
+        self,
+        first: SEKMonetary,
+        second: SEKMonetary,
+        factor: int | Fraction | Decimal,
+        rounding: Round,
+    ) -> None:
+        expression = (a - b) * x + b
+        expected = SEK.fraction(
+            (_signed(first) - _signed(second)) * Fraction(factor) + _signed(second)
+        )
+        assert expression.evaluate(a=first, b=second, x=factor) == expected
+        assert expression.round(rounding, a=first, b=second, x=factor) == (
+            expected.round_either(rounding)
+        )
+
+    def test_divides_by_scalars(self) -> None:
+        assert (a / 3).evaluate(a=SEK(1)) == SEK.fraction(100, 3)
+        assert (a / Decimal("-0.5")).evaluate(a=SEK(1)) == SEK.fraction(-200)
+        assert (1 / x).evaluate(x=Fraction(2, 3)) == Fraction(3, 2)
+        assert (a / x).round(Round.HALF_EVEN, a=SEK(1), x=8) == SEK("0.12")
+
+    def test_evaluates_scalar_expressions(self) -> None:
+        expression = x * Rate("0.25") - Decimal("0.5")
+        assert expression.evaluate(x=4) == Fraction(1, 2)
+
+    def test_supports_reflected_and_unary_operators(self) -> None:
+        assert (SEK(10) - a).evaluate(a=SEK(1)) == SEK.fraction(900)
+        assert (SEK(10) + a).evaluate(a=SEK(1)) == SEK.fraction(1100)
+        assert (2 * a).evaluate(a=SEK(1)) == SEK.fraction(200)
+        assert (-a).evaluate(a=SEK(1)) == SEK.fraction(-100)
+        assert (+a) is a
+
+    def test_folds_constant_operations(self) -> None:
+        expression = Constant(SEK(1)) + Constant(SEK(2))
+        assert expression.evaluate() == SEK.fraction(300)
+        assert expression.variables == frozenset()
+
+
+class TestErrors:
+    def test_raises_type_error_for_invalid_operands(self) -> None:
+        with pytest.raises(TypeError):
+            a + 1.0  # type: ignore[operator]
+        with pytest.raises(TypeError):
+            a.evaluate(a="1")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        ("expression", "values"),
+        [
+            (a + b, {"a": SEK(1), "b": 1}),
+            (a - b, {"a": 1, "b": SEK(1)}),
+            (a * b, {"a": SEK(1), "b": SEK(1)}),
+            (a / b, {"a": SEK(1), "b": SEK(1)}),
+            (a / b, {"a": 1, "b": SEK(1)}),
+        ],
+    )
+    def test_raises_type_error_for_invalid_combinations(
+        self,
+        expression: Any,
+        values: dict[str, Any],
+    ) -> None:
+        with pytest.raises(TypeError):
+            expression.evaluate(**values)
+
+    def test_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            (a + b).evaluate(a=SEK(1), b=NOK(1))
+
+    def test_raises_division_by_zero(self) -> None:
+        with pytest.raises(DivisionByZero):
+            (a / x).evaluate(a=SEK(1), x=0)
+
+    def test_raises_type_error_when_rounding_scalar(self) -> None:
+        with pytest.raises(TypeError):
+            (x * 2).round(Round.DOWN, x=1)
+
+    def test_raises_key_error_for_unbound_variable(self) -> None:
+        with pytest.raises(KeyError):
+            (a + b).evaluate(a=SEK(1))
+
+
+class TestCompiled:
+    def test_compile_is_cached(self) -> None:
+        expression = a * x
+        compiled = expression.compile()
+        assert isinstance(compiled, CompiledExpression)
+        assert expression.compile() is compiled
+        assert compiled.variables == frozenset({"a", "x"})
+        assert repr(compiled) == ("CompiledExpression((Variable('a') * Variable('x')))")
+
+    @given(lists(tuples(monies(), integers(min_value=0, max_value=100))))
+    def test_evaluates_many_rows(
+        self,
+        rows: list[tuple[Money[Any], int]],
+    ) -> None:
+        compiled = (a * x * Decimal("1.25")).compile()
+        values: list[dict[str, Value]] = [
+            {"a": money, "x": quantity} for money, quantity in rows
+        ]
+        expected = [money * quantity * Fraction(5, 4) for money, quantity in rows]
+        assert compiled.evaluate_many(values) == expected
+        assert compiled.round_many(values, Round.HALF_UP) == [
+            value.round_either(Round.HALF_UP) for value in expected
+        ]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import TypeAlias
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import fractions
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney import SubunitFraction
+from immoney._base import _dispatch_type
+from immoney.currencies import BHD
+from immoney.currencies import JPY
+from immoney.currencies import SEK
+from immoney.currencies import registry
+from immoney.errors import ParseError
+from immoney.google_money import UnitsNanos
+from immoney.google_money import fraction_from_google
+from immoney.google_money import fraction_from_units_nanos
+from immoney.google_money import from_google
+from immoney.google_money import from_google_many
+from immoney.google_money import from_units_nanos
+from immoney.google_money import nanos_per_unit
+from immoney.google_money import to_google
+from immoney.google_money import to_google_many
+from immoney.google_money import to_units_nanos
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+currencies = sampled_from(tuple(registry.values()))
+monetary_values = tuples(integers(), currencies).map(lambda pair: _dispatch_type(*pair))
+MonetaryValue: TypeAlias = Money[Currency] | Overdraft[Currency]
+
+
+class TestFromUnitsNanos:
+    @pytest.mark.parametrize(
+        ("units", "nanos", "currency", "expected"),
+        [
+            (0, 0, SEK, SEK(0)),
+            (1, 500_000_000, SEK, SEK("1.50")),
+            (-1, -500_000_000, SEK, SEK.overdraft("1.50")),
+            (0, -10_000_000, SEK, SEK.overdraft("0.01")),
+            (-2, 0, SEK, SEK.overdraft(2)),
+            (12, 0, JPY, JPY(12)),
+            (0, 1_000_000, BHD, BHD("0.001")),
+            (2**70, 0, SEK, SEK(2**70)),
+        ],
+    )
+    def test_converts_exact_values(
+        self,
+        units: int,
+        nanos: int,
+        currency: Currency,
+        expected: object,
+    ) -> None:
+        assert from_units_nanos(units, nanos, currency) == expected
+
+    @pytest.mark.parametrize(
+        ("units", "nanos", "currency"),
+        [
+            (0, 1, SEK),
+            (1, 5_000_000, SEK),
+            (0, 500_000_000, JPY),
+            (0, 1_000_000_000, SEK),
+            (0, -1_000_000_000, SEK),
+            (1, -10_000_000, SEK),
+            (-1, 10_000_000, SEK),
+        ],
+    )
+    def test_raises_parse_error_for_invalid_or_inexact_values(
+        self,
+        units: int,
+        nanos: int,
+        currency: Currency,
+    ) -> None:
+        with pytest.raises(ParseError):
+            from_units_nanos(units, nanos, currency)
+
+    @given(
+        integers(min_value=0, max_value=2**60),
+        integers(min_value=0, max_value=nanos_per_unit - 1),
+        currencies,
+    )
+    def test_agrees_with_decimal_parsing(
+        self,
+        units: int,
+        nanos: int,
+        currency: Currency,
+    ) -> None:
+        try:
+            expected = currency(Decimal(f"{units}.{nanos:09d}"))
+        except ParseError:
+            with pytest.raises(ParseError):
+                from_units_nanos(units, nanos, currency)
+        else:
+            assert from_units_nanos(units, nanos, currency) == expected
+
+    def test_fraction_is_exact(self) -> None:
+        assert fraction_from_units_nanos(1, 5_000_000, SEK) == SEK.fraction(201, 2)
+        assert fraction_from_units_nanos(-1, -1, JPY) == JPY.fraction(
+            -1_000_000_001, 1_000_000_000
+        )
+        with pytest.raises(ParseError):
+            fraction_from_units_nanos(1, -1, SEK)
+
+
+class TestToUnitsNanos:
+    @given(monetary_values)
+    def test_roundtrips_money_and_overdraft(self, value: MonetaryValue) -> None:
+        units, nanos = to_units_nanos(value)
+        assert -nanos_per_unit < nanos < nanos_per_unit
+        assert units * nanos >= 0
+        assert from_units_nanos(units, nanos, value.currency) is value
+
+    @given(
+        integers(), integers(min_value=-(nanos_per_unit - 1), max_value=0), currencies
+    )
+    def test_roundtrips_fractions(
+        self,
+        units: int,
+        nanos: int,
+        currency: Currency,
+    ) -> None:
+        nanos = nanos if units <= 0 else -nanos
+        value = fraction_from_units_nanos(units, nanos, currency)
+        assert to_units_nanos(value) == (units, nanos)
+
+    @given(fractions(), currencies)
+    def test_raises_value_error_for_fractions_of_nanos(
+        self,
+        fraction: Fraction,
+        currency: Currency,
+    ) -> None:
+        value = SubunitFraction(fraction, currency)
+        nanos = fraction * nanos_per_unit / currency.subunit
+        if nanos.denominator == 1:
+            units, remainder = to_units_nanos(value)
+            assert units * nanos_per_unit + remainder == nanos
+        else:
+            with pytest.raises(ValueError):
+                to_units_nanos(value)
+
+
+class TestMessages:
+    def test_converts_messages(self) -> None:
+        assert to_google(SEK.overdraft("0.01")) == UnitsNanos("SEK", 0, -10_000_000)
+        assert from_google(UnitsNanos("SEK", 0, -10_000_000)) is SEK.overdraft("0.01")
+        assert fraction_from_google(UnitsNanos("SEK", 0, 1)) == SEK.fraction(
+            1, 10_000_000
+        )
+
+    def test_uses_registry(self) -> None:
+        assert from_google(UnitsNanos("JCN", 1, 0), custom_registry) is JCN(1)
+        with pytest.raises(ParseError):
+            from_google(UnitsNanos("SEK", 1, 0), custom_registry)
+        with pytest.raises(ParseError):
+            fraction_from_google(UnitsNanos("ZZZ", 1, 0))
+
+    @given(lists(monetary_values))
+    def test_batch_roundtrips(self, values: list[MonetaryValue]) -> None:
+        messages = to_google_many(values)
+        assert messages == [to_google(value) for value in values]
+        assert from_google_many(messages) == values
+
+    def test_batch_raises_parse_error(self) -> None:
+        with pytest.raises(ParseError):
+            from_google_many([UnitsNanos("SEK", 1, 0), UnitsNanos("SEK", 1, 1)])
+        with pytest.raises(ParseError):
+            from_google_many([UnitsNanos("ZZZ", 1, 0)])
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+
+from immoney import Rate
+from immoney import Round
+from immoney import instrumentation
+from immoney._cache import InstanceCache
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.instrumentation import Event
+
+
+@pytest.fixture(autouse=True)
+def _reset_instrumentation() -> Iterator[None]:
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_is_disabled_by_default() -> None:
+    assert not instrumentation.is_enabled()
+    SEK("1.23")
+    SEK.fraction(1, 3).round_money(Round.DOWN)
+    assert instrumentation.snapshot() == {}
+
+
+def test_disable_restores_original_implementations() -> None:
+    original_call = vars(InstanceCache)["__call__"]
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert vars(InstanceCache)["__call__"] is not original_call
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert vars(InstanceCache)["__call__"] is original_call
+
+
+def test_counts_instantiations_and_cache_hits() -> None:
+    subunits = 918_273_645_192
+    with instrumentation.instrumented():
+        first = SEK.from_subunit(subunits)
+        second = SEK.from_subunit(subunits)
+        NOK.overdraft_from_subunit(subunits)
+
+    assert first is second
+    counts = instrumentation.snapshot()
+    assert counts[Event.INSTANTIATION, "Money", "SEK"] == 1
+    assert counts[Event.CACHE_HIT, "Money", "SEK"] == 1
+    assert counts[Event.INSTANTIATION, "Overdraft", "NOK"] == 1
+
+
+def test_counts_decimal_parses() -> None:
+    with instrumentation.instrumented():
+        SEK(1)
+        SEK("1.01")
+        SEK(Decimal("1.02"))
+
+    counts = instrumentation.snapshot()
+    assert counts[Event.DECIMAL_PARSE, "Currency", "SEK"] == 2
+
+
+def test_counts_rounding() -> None:
+    fraction = SEK.fraction(1, 3)
+    with instrumentation.instrumented():
+        fraction.round_money(Round.DOWN)
+        fraction.round_either(Round.UP)
+
+    assert instrumentation.snapshot()[Event.ROUND, "SubunitFraction", "SEK"] == 2
+
+
+def test_instrumented_restores_previous_state() -> None:
+    instrumentation.enable()
+    with instrumentation.instrumented():
+        pass
+    assert instrumentation.is_enabled()
+
+
+def test_reset_clears_counts() -> None:
+    with instrumentation.instrumented():
+        SEK.fraction(1, 3).round_money(Round.DOWN)
+    assert instrumentation.snapshot()
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+
+def test_hooks_receive_events() -> None:
+    events = list[tuple[Event, str, str]]()
+
+    def hook(event: Event, type_name: str, currency_code: str) -> None:
+        events.append((event, type_name, currency_code))
+
+    instrumentation.add_hook(hook)
+    try:
+        with instrumentation.instrumented():
+            SEK.fraction(1, 3).round_money(Round.DOWN)
+    finally:
+        instrumentation.remove_hook(hook)
+
+    assert (Event.ROUND, "SubunitFraction", "SEK") in events
+    events.clear()
+
+    with instrumentation.instrumented():
+        SEK.fraction(1, 3).round_money(Round.DOWN)
+    assert events == []
+
+
+def test_counts_preallocated_hits() -> None:
+    SEK.preallocate(100)
+    try:
+        with instrumentation.instrumented():
+            SEK.from_subunit(1)
+            SEK.fraction(7, 2).round_money(Round.DOWN)
+            SEK("0.50")
+            SEK.from_subunit(100)
+    finally:
+        SEK.preallocate(0)
+
+    counts = instrumentation.snapshot()
+    assert counts[Event.PREALLOCATED_HIT, "Money", "SEK"] == 3
+    assert (
+        counts.get((Event.INSTANTIATION, "Money", "SEK"), 0)
+        + counts.get((Event.CACHE_HIT, "Money", "SEK"), 0)
+        == 1
+    )
+
+
+def test_counts_instances_without_currency_with_empty_code() -> None:
+    with instrumentation.instrumented():
+        Rate("0.918273645")
+        Rate("0.918273645")
+
+    counts = instrumentation.snapshot()
+    assert counts[Event.INSTANTIATION, "Rate", ""] == 1
+    assert counts[Event.CACHE_HIT, "Rate", ""] == 1
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Money
+from immoney import Overdraft
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import UnbalancedEntry
+from immoney.journal import Journal
+from immoney.journal import Posting
+
+from .strategies import monies
+
+account_names = sampled_from(["cash", "bank", "equity", "revenue"])
+transfers = lists(
+    tuples(account_names, account_names, monies(currencies=sampled_from([SEK, NOK])))
+)
+
+
+def _signed(value: Money[Any] | Overdraft[Any]) -> int:
+    return value.subunits if isinstance(value, Money) else -value.subunits
+
+
+def _journal(rows: list[tuple[str, str, Money[Any]]]) -> Journal:
+    journal = Journal()
+    for source, destination, amount in rows:
+        journal.transfer(source, destination, amount)
+    return journal
+
+
+class TestPost:
+    def test_records_multi_leg_entries_balanced_per_currency(self) -> None:
+        journal = Journal()
+        entry = journal.post(
+            [
+                ("cash", SEK(100)),
+                ("cash", NOK(50)),
+                ("revenue", SEK.overdraft(60)),
+                ("equity", SEK.overdraft(40)),
+                ("revenue", NOK.overdraft(50)),
+            ]
+        )
+        assert entry == 0
+        assert len(journal) == 5
+        assert journal.entry_count == 1
+        assert journal.balances("cash") == {SEK: SEK(100), NOK: NOK(50)}
+        assert journal.balance("revenue", SEK) == SEK.overdraft(60)
+        assert journal.accounts == frozenset({"cash", "revenue", "equity"})
+
+    def test_raises_unbalanced_entry_without_recording(self) -> None:
+        journal = Journal()
+        journal.transfer("equity", "cash", SEK(10))
+        with pytest.raises(UnbalancedEntry, match=r"Money\('1.00', NOK\)"):
+            journal.post(
+                [
+                    ("cash", SEK(10)),
+                    ("revenue", SEK.overdraft(10)),
+                    ("cash", NOK(1)),
+                ]
+            )
+        assert len(journal) == 2
+        assert journal.entry_count == 1
+        assert journal.balances("cash") == {SEK: SEK(10)}
+        assert "revenue" not in journal.accounts
+
+    def test_raises_value_error_for_empty_entry(self) -> None:
+        with pytest.raises(ValueError):
+            Journal().post([])
+
+    def test_raises_type_error_for_invalid_amount(self) -> None:
+        with pytest.raises(TypeError):
+            Journal().post([("cash", SEK.fraction(1))])  # type: ignore[list-item]
+
+
+class TestBalance:
+    @given(transfers)
+    def test_balance_index_agrees_with_summing_postings(
+        self,
+        rows: list[tuple[str, str, Money[Any]]],
+    ) -> None:
+        journal = _journal(rows)
+        for account in ("cash", "bank", "equity", "revenue"):
+            for currency in (SEK, NOK):
+                expected = sum(
+                    _signed(posting.amount)
+                    for posting in journal
+                    if posting.account == account
+                    and posting.amount.currency == currency
+                )
+                assert journal.balance(account, currency) == (
+                    currency.from_subunit(expected)
+                    if expected >= 0
+                    else currency.overdraft_from_subunit(-expected)
+                )
+
+    @given(transfers, integers(min_value=0))
+    def test_balance_at_sequence_number(
+        self,
+        rows: list[tuple[str, str, Money[Any]]],
+        stop: int,
+    ) -> None:
+        journal = _journal(rows)
+        stop %= len(journal) + 1
+        for account in ("cash", "bank"):
+            expected = sum(
+                _signed(posting.amount)
+                for posting in journal.postings(0, stop, account=account)
+                if posting.amount.currency == SEK
+            )
+            assert journal.balance(account, SEK, stop) == (
+                SEK.from_subunit(expected)
+                if expected >= 0
+                else SEK.overdraft_from_subunit(-expected)
+            )
+
+    def test_balance_of_unknown_account_is_zero(self) -> None:
+        assert Journal().balance("cash", SEK) == SEK(0)
+        assert Journal().balances("cash") == {}
+
+
+class TestPostings:
+    def test_range_queries(self) -> None:
+        journal = Journal()
+        journal.transfer("equity", "cash", SEK(100))
+        journal.transfer("cash", "bank", SEK(30))
+        assert list(journal.postings(1, 3)) == [
+            Posting(1, 0, "equity", SEK.overdraft(100)),
+            Posting(2, 1, "bank", SEK(30)),
+        ]
+        assert [posting.sequence for posting in journal.postings(account="cash")] == [
+            0,
+            3,
+        ]
+        assert journal.movement("cash", SEK, start=1) == SEK.overdraft(30)
+        assert journal[-1] == Posting(3, 1, "cash", SEK.overdraft(30))
+        assert journal.entry(1) == list(journal.postings(2))
+
+    @pytest.mark.parametrize(("start", "stop"), [(-1, None), (0, 3), (2, 1)])
+    def test_raises_index_error_for_invalid_range(
+        self,
+        start: int,
+        stop: int | None,
+    ) -> None:
+        journal = Journal()
+        journal.transfer("equity", "cash", SEK(1))
+        with pytest.raises(IndexError):
+            list(journal.postings(start, stop))
+
+    def test_raises_index_error_for_invalid_sequence_and_entry(self) -> None:
+        journal = Journal()
+        journal.transfer("equity", "cash", SEK(1))
+        with pytest.raises(IndexError):
+            journal[2]
+        with pytest.raises(IndexError):
+            journal.entry(1)
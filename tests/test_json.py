@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from fractions import Fraction
+
+import orjson
+import pytest
+from hypothesis import given
+from hypothesis.strategies import fractions
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import SubunitFraction
+from immoney._base import _dispatch_type
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.currencies import registry
+from immoney.errors import ParseError
+from immoney.json import compact_default
+from immoney.json import decode
+from immoney.json import default
+from immoney.json import make_object_hook
+from immoney.json import object_hook
+from immoney.json import parse_compact
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+currencies = sampled_from(tuple(registry.values()))
+monetary_values = tuples(integers(), currencies).map(
+    lambda pair: _dispatch_type(*pair)
+) | tuples(fractions(), currencies).map(lambda pair: SubunitFraction(*pair))
+# orjson only encodes integers in the 64-bit range.
+int64 = integers(min_value=-(2**63) + 1, max_value=2**63 - 1)
+int64_values = tuples(int64, currencies).map(lambda pair: _dispatch_type(*pair)) | (
+    tuples(fractions(max_denominator=2**63 - 1), currencies)
+    .filter(lambda pair: abs(pair[0].numerator) < 2**63)
+    .map(lambda pair: SubunitFraction(*pair))
+)
+
+
+class TestDefault:
+    def test_encodes_money(self) -> None:
+        assert default(SEK("1.50")) == {"subunits": 150, "currency": "SEK"}
+
+    def test_encodes_overdraft(self) -> None:
+        assert default(NOK.overdraft("0.01")) == {
+            "overdraft_subunits": 1,
+            "currency": "NOK",
+        }
+
+    def test_encodes_subunit_fraction(self) -> None:
+        assert default(SEK.fraction(-7, 2)) == {
+            "numerator": -7,
+            "denominator": 2,
+            "currency": "SEK",
+        }
+
+    @pytest.mark.parametrize("value", [object(), Fraction(1, 3), SEK])
+    def test_raises_type_error_for_other_objects(self, value: object) -> None:
+        with pytest.raises(TypeError, match=r"is not JSON serializable$"):
+            default(value)
+        with pytest.raises(TypeError, match=r"is not JSON serializable$"):
+            compact_default(value)
+
+    def test_matches_pydantic_serialization(self) -> None:
+        from immoney._pydantic import MoneyAdapter
+        from immoney._pydantic import OverdraftAdapter
+        from immoney._pydantic import SubunitFractionAdapter
+
+        assert default(SEK(3)) == MoneyAdapter.serialize(SEK(3))
+        assert default(SEK.overdraft(3)) == OverdraftAdapter.serialize(SEK.overdraft(3))
+        assert default(SEK.fraction(1, 3)) == SubunitFractionAdapter.serialize(
+            SEK.fraction(1, 3)
+        )
+
+
+class TestRoundtrip:
+    @given(lists(monetary_values))
+    def test_stdlib_json(self, values: list[object]) -> None:
+        data = json.dumps({"values": values}, default=default)
+        assert json.loads(data, object_hook=object_hook) == {"values": values}
+
+    @given(lists(int64_values))
+    def test_orjson(self, values: list[object]) -> None:
+        data = orjson.dumps({"values": values}, default=default)
+        assert decode(orjson.loads(data)) == {"values": values}
+
+    @given(lists(monetary_values))
+    def test_compact(self, values: list[object]) -> None:
+        data = json.dumps(values, default=compact_default)
+        assert [parse_compact(text) for text in json.loads(data)] == values
+
+    def test_custom_registry(self) -> None:
+        data = json.dumps([JCN(1), JCN.fraction(1, 3)], default=default)
+        assert json.loads(data, object_hook=make_object_hook(custom_registry)) == [
+            JCN(1),
+            JCN.fraction(1, 3),
+        ]
+        assert decode(json.loads(data), custom_registry) == [
+            JCN(1),
+            JCN.fraction(1, 3),
+        ]
+        assert parse_compact("JCN:-100", custom_registry) == JCN.overdraft(1)
+
+
+class TestObjectHook:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"subunits": 1},
+            {"subunits": 1, "currency": "SEK", "note": "a"},
+            {"currency": "SEK", "amount": 1},
+            {"numerator": 1, "denominator": 2, "code": "SEK"},
+        ],
+    )
+    def test_leaves_other_objects_unchanged(self, data: dict[str, object]) -> None:
+        assert object_hook(data) is data
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"subunits": -1, "currency": "SEK"},
+            {"subunits": 1.5, "currency": "SEK"},
+            {"subunits": True, "currency": "SEK"},
+            {"subunits": "1", "currency": "SEK"},
+            {"subunits": 1, "currency": "ZZZ"},
+            {"subunits": 1, "currency": ["SEK"]},
+            {"overdraft_subunits": 0, "currency": "SEK"},
+            {"numerator": 1, "denominator": 0, "currency": "SEK"},
+            {"numerator": 1.5, "denominator": 2, "currency": "SEK"},
+        ],
+    )
+    def test_raises_parse_error_for_invalid_values(
+        self,
+        data: dict[str, object],
+    ) -> None:
+        with pytest.raises(ParseError):
+            object_hook(data)
+
+    def test_rejects_currency_outside_registry(self) -> None:
+        with pytest.raises(ParseError):
+            make_object_hook(custom_registry)({"subunits": 1, "currency": "SEK"})
+
+    def test_decode_walks_nested_structures(self) -> None:
+        assert decode(
+            {"a": [{"b": {"subunits": 1, "currency": "SEK"}}], "c": "SEK:1"}
+        ) == {"a": [{"b": SEK.from_subunit(1)}], "c": "SEK:1"}
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import tempfile
+from itertools import accumulate
+from pathlib import Path
+
+import pytest
+from hypothesis import given
+from hypothesis import settings
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney._base import _dispatch_type
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import ParseError
+from immoney.ledger import Ledger
+
+from .custom_currency import JCN
+from .custom_currency import MCN
+from .custom_currency import registry as custom_registry
+
+values = tuples(
+    integers(min_value=-(2**40), max_value=2**40),
+    sampled_from((SEK, NOK)),
+).map(lambda pair: _dispatch_type(*pair))
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "ledger"
+
+
+class TestLedger:
+    def test_appends_and_reads_values(self, path: Path) -> None:
+        with Ledger(path) as ledger:
+            assert ledger.append(SEK(1)) == 0
+            assert ledger.append(NOK.overdraft(2)) == 1
+            assert len(ledger) == 2
+            assert ledger[0] is SEK(1)
+            assert ledger[-1] is NOK.overdraft(2)
+            assert list(ledger) == [SEK(1), NOK.overdraft(2)]
+            assert list(ledger.iter(1)) == [NOK.overdraft(2)]
+
+    def test_reopens_existing_file(self, path: Path) -> None:
+        with Ledger(path, checkpoint_interval=3) as ledger:
+            ledger.extend(SEK.from_subunit(i) for i in range(10))
+        with Ledger(path, checkpoint_interval=3) as ledger:
+            assert len(ledger) == 10
+            assert ledger.balance(SEK, stop=7) == SEK.from_subunit(sum(range(7)))
+            ledger.append(SEK.overdraft_from_subunit(45))
+            assert ledger.balance(SEK) == SEK(0)
+
+    def test_uses_codes_stored_in_file(self, path: Path) -> None:
+        with Ledger(path, custom_registry) as ledger:
+            ledger.extend([JCN(1), MCN(2)])
+            assert list(ledger.index.codes) == ["JCN", "MCN"]
+        with Ledger(path, custom_registry) as ledger:
+            assert list(ledger) == [JCN(1), MCN(2)]
+
+    def test_discards_partially_written_record(self, path: Path) -> None:
+        with Ledger(path) as ledger:
+            ledger.extend([SEK(1), SEK(2)])
+        with path.open("ab") as file:
+            file.write(b"\x01\x02\x03")
+        with Ledger(path) as ledger:
+            assert list(ledger) == [SEK(1), SEK(2)]
+            ledger.append(SEK(3))
+        with Ledger(path) as ledger:
+            assert list(ledger) == [SEK(1), SEK(2), SEK(3)]
+
+    def test_raises_parse_error_for_invalid_file(self, path: Path) -> None:
+        path.write_bytes(b"not a ledger file")
+        with pytest.raises(ParseError):
+            Ledger(path)
+
+    def test_raises_overflow_error_for_big_values(self, path: Path) -> None:
+        with Ledger(path) as ledger, pytest.raises(OverflowError):
+            ledger.append(SEK.from_subunit(2**63))
+        with Ledger(path) as ledger:
+            assert len(ledger) == 0
+
+    def test_raises_index_error_out_of_range(self, path: Path) -> None:
+        with Ledger(path) as ledger:
+            ledger.append(SEK(1))
+            with pytest.raises(IndexError):
+                ledger[1]
+            with pytest.raises(IndexError):
+                ledger.balance(SEK, stop=2)
+
+    def test_raises_key_error_for_currency_not_in_registry(self, path: Path) -> None:
+        with Ledger(path) as ledger, pytest.raises(KeyError):
+            ledger.append(JCN(1))
+
+    @settings(max_examples=25)
+    @given(items=lists(values, max_size=60), interval=integers(1, 8))
+    def test_balances_match_running_sums(
+        self,
+        items: list[Money[Currency] | Overdraft[Currency]],
+        interval: int,
+    ) -> None:
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            Ledger(Path(directory) / "ledger", checkpoint_interval=interval) as ledger,
+        ):
+            ledger.extend(items)
+            for currency in (SEK, NOK):
+                signed = [
+                    (value.subunits if isinstance(value, Money) else -value.subunits)
+                    if value.currency is currency
+                    else 0
+                    for value in items
+                ]
+                expected = [0, *accumulate(signed)]
+                assert [
+                    ledger.balance(currency, stop=stop)
+                    for stop in range(len(items) + 1)
+                ] == [_dispatch_type(total, currency) for total in expected]
+            assert ledger.balances() == {
+                currency: ledger.balance(currency)
+                for currency in {value.currency for value in items}
+            }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import pickle
 from decimal import Decimal
 from decimal import InvalidOperation
 from fractions import Fraction
@@ -11,16 +13,20 @@ from hypothesis import example
 from hypothesis import given
 from hypothesis.strategies import decimals
 from hypothesis.strategies import integers
+from hypothesis.strategies import sampled_from
 from hypothesis.strategies import text
 from typing_extensions import assert_type
 
 from immoney import Currency
 from immoney import Money
 from immoney import Overdraft
+from immoney import Round
 from immoney import SubunitFraction
+from immoney._cache import InstanceCache
 from immoney.currencies import NOK
 from immoney.currencies import SEK
 from immoney.currencies import SEKType
+from immoney.currencies import registry
 from immoney.errors import DivisionByZero
 from immoney.errors import FrozenInstanceError
 from immoney.errors import ParseError
@@ -68,6 +74,7 @@ def test_raises_type_error_when_instantiated_with_invalid_args() -> None:
 @given(money=monies(), name=text(), value=valid_sek_decimals | text())
 @example(SEK(23), "value", Decimal("123"))
 @example(NOK(23), "currency", SEK)
+@example(SEK(23), "_hash", 1)
 def test_raises_on_assignment(money: Money[Any], name: str, value: object) -> None:
     initial = getattr(money, name, None)
     with pytest.raises(FrozenInstanceError):
@@ -75,6 +82,15 @@ def test_raises_on_assignment(money: Money[Any], name: str, value: object) -> No
     assert getattr(money, name, None) == initial
 
 
+def test_raises_on_reinitialization() -> None:
+    value = SEK(1)
+    with pytest.raises(FrozenInstanceError):
+        value.__init__(500, SEK)
+    assert value.subunits == 100
+    assert SEK(1) is value
+    assert hash(value) == hash((Money, SEK, 100))
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     (
@@ -120,6 +136,13 @@ def test_hash() -> None:
     assert hash(SEK(13)) == hash(SEK(13))
 
 
+def test_hash_is_equal_for_uncached_instances() -> None:
+    uncached = InstanceCache._instantiate.__wrapped__(Money, 1300, SEK)
+    assert uncached is not SEK(13)
+    assert hash(uncached) == hash(SEK(13))
+    assert {uncached: "a"}[SEK(13)] == "a"
+
+
 def test_can_check_equality_with_zero() -> None:
     assert SEK(0) == 0
     assert 0 == SEK(0)
@@ -375,6 +398,33 @@ def test_returns_subunit_fraction_when_multiplied_with_decimal(
     assert reverse_applied.value == product.value
 
 
+@given(
+    monies(),
+    decimals(allow_infinity=False, allow_nan=False, places=6),
+    sampled_from(Round),
+)
+@example(SEK("9.99"), Decimal("1.25"), Round.HALF_UP)
+def test_multiply_and_round_equals_rounded_product(
+    a: Money[Any],
+    b: Decimal,
+    rounding: Round,
+) -> None:
+    assert a.multiply_and_round(b, rounding) == (a * b).round_either(rounding)
+    fraction = Fraction(b)
+    assert a.multiply_and_round(fraction, rounding) == (a * fraction).round_either(
+        rounding
+    )
+    assert a.multiply_and_round(3, rounding) == a * 3
+
+
+@pytest.mark.parametrize("factor", [object(), 1.0, ""])
+def test_multiply_and_round_raises_type_error_for_invalid_factor(
+    factor: object,
+) -> None:
+    with pytest.raises(TypeError):
+        SEK(1).multiply_and_round(factor, Round.DOWN)  # type: ignore[arg-type]
+
+
 @given(valid_money_subunits, valid_money_subunits)
 @example(0, 0)
 def test_raises_type_error_for_multiplication_between_instances(
@@ -604,3 +654,16 @@ class TestTruediv:
     def test_rtruediv_raises_division_by_zero(self) -> None:
         with pytest.raises(DivisionByZero):
             10 / SEK(0)
+
+
+@given(monies(currencies=sampled_from(tuple(registry.values()))))
+def test_pickle_roundtrip_returns_interned_instance(value: Money[Any]) -> None:
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored is value
+    assert restored.currency is value.currency
+
+
+def test_copy_returns_self() -> None:
+    value = SEK("1.50")
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import io
+
+import msgpack
+import pytest
+from hypothesis import given
+from hypothesis.strategies import fractions
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import SubunitFraction
+from immoney._base import _dispatch_type
+from immoney.binary import CurrencyIndex
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.currencies import registry
+from immoney.errors import ParseError
+from immoney.msgpack import _read_signed
+from immoney.msgpack import _read_varint
+from immoney.msgpack import _write_signed
+from immoney.msgpack import _write_varint
+from immoney.msgpack import default
+from immoney.msgpack import ext_hook
+from immoney.msgpack import money_code
+from immoney.msgpack import packb
+from immoney.msgpack import packer
+from immoney.msgpack import subunit_fraction_code
+from immoney.msgpack import unpackb
+from immoney.msgpack import unpacker
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+currencies = sampled_from(tuple(registry.values()))
+monetary_values = tuples(integers(), currencies).map(
+    lambda pair: _dispatch_type(*pair)
+) | tuples(fractions(), currencies).map(lambda pair: SubunitFraction(*pair))
+
+
+class TestVarint:
+    @given(integers(min_value=0))
+    def test_roundtrips_unsigned(self, value: int) -> None:
+        buffer = bytearray()
+        _write_varint(buffer, value)
+        assert _read_varint(bytes(buffer), 0) == (value, len(buffer))
+
+    @given(integers())
+    def test_roundtrips_signed(self, value: int) -> None:
+        buffer = bytearray()
+        _write_signed(buffer, value)
+        assert _read_signed(bytes(buffer), 0) == (value, len(buffer))
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(0, b"\x00"), (-1, b"\x01"), (1, b"\x02"), (-64, b"\x7f"), (64, b"\x80\x01")],
+    )
+    def test_zigzag_encoding(self, value: int, expected: bytes) -> None:
+        buffer = bytearray()
+        _write_signed(buffer, value)
+        assert buffer == expected
+
+    def test_raises_parse_error_for_truncated_varint(self) -> None:
+        with pytest.raises(ParseError):
+            _read_varint(b"\x80", 0)
+
+
+class TestCodec:
+    @given(lists(monetary_values))
+    def test_roundtrips_values(self, values: list[object]) -> None:
+        assert unpackb(packb({"values": values})) == {"values": values}
+
+    def test_decodes_interned_instances(self) -> None:
+        assert unpackb(packb(SEK("1.50"))) is SEK("1.50")
+        assert unpackb(packb(NOK.overdraft(3))) is NOK.overdraft(3)
+
+    def test_encodes_extension_types(self) -> None:
+        index = CurrencyIndex(codes=["SEK"])
+        assert packb([SEK(1), SEK.overdraft(1)], index) == msgpack.packb(
+            [
+                msgpack.ExtType(money_code, b"\x00\xc8\x01"),
+                msgpack.ExtType(money_code, b"\x00\xc7\x01"),
+            ]
+        )
+        assert packb(SEK.fraction(-1, 3), index) == msgpack.packb(
+            msgpack.ExtType(subunit_fraction_code, b"\x00\x01\x03")
+        )
+
+    def test_uses_currency_index(self) -> None:
+        index = CurrencyIndex(custom_registry)
+        data = packb([JCN(1), JCN.fraction(1, 3)], index)
+        assert unpackb(data, index) == [JCN(1), JCN.fraction(1, 3)]
+        with pytest.raises(KeyError):
+            packb(SEK(1), index)
+
+    def test_default_ids_do_not_depend_on_registry_contents(self) -> None:
+        data = packb([SEK(1), NOK.overdraft(2), SEK.fraction(1, 3)])
+        index = CurrencyIndex({"NOK": NOK, "SEK": SEK})
+        assert unpackb(data, index) == [SEK(1), NOK.overdraft(2), SEK.fraction(1, 3)]
+
+    def test_raises_type_error_for_other_objects(self) -> None:
+        with pytest.raises(TypeError):
+            default(object())
+
+    def test_leaves_other_extension_types(self) -> None:
+        assert ext_hook(1, b"abc") == msgpack.ExtType(1, b"abc")
+
+    @pytest.mark.parametrize(
+        ("code", "data"),
+        [
+            (money_code, b""),
+            (money_code, b"\x00"),
+            (money_code, b"\x00\x02\x00"),
+            (money_code, b"\xff\x7f\x02"),
+            (subunit_fraction_code, b"\x00\x02\x00"),
+            (subunit_fraction_code, b"\x00\x02"),
+        ],
+    )
+    def test_raises_parse_error_for_invalid_data(
+        self,
+        code: int,
+        data: bytes,
+    ) -> None:
+        with pytest.raises(ParseError):
+            ext_hook(code, data)
+
+
+class TestStreaming:
+    @given(lists(monetary_values, max_size=20), integers(min_value=1, max_value=7))
+    def test_feeds_chunks(self, values: list[object], chunk_size: int) -> None:
+        stream = packer()
+        data = b"".join(stream.pack(value) for value in values)
+        decoded = list[object]()
+        unpacking = unpacker()
+        for start in range(0, len(data), chunk_size):
+            unpacking.feed(data[start : start + chunk_size])
+            decoded.extend(unpacking)
+        assert decoded == values
+
+    def test_reads_file_like(self) -> None:
+        values = [SEK(1), SEK.overdraft(2), SEK.fraction(1, 3)]
+        data = io.BytesIO(b"".join(packb(value) for value in values))
+        assert list(unpacker(data)) == values
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import fractions
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney import Round
+from immoney import SubunitFraction
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.currencies import SEKType
+from immoney.errors import CurrencyMismatch
+from immoney.errors import DivisionByZero
+from immoney.numpy import fractions_to_numpy
+from immoney.numpy import from_numpy
+from immoney.numpy import from_structured
+from immoney.numpy import round_subunits
+from immoney.numpy import to_numpy
+from immoney.numpy import to_structured
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+
+class TestToNumpy:
+    @given(lists(integers(min_value=-(2**63), max_value=2**63 - 1)))
+    def test_roundtrips_int64_values(self, subunits: list[int]) -> None:
+        values = from_numpy(np.array(subunits, dtype=np.int64), SEK)
+        array, currency = to_numpy(values, SEK)
+        assert currency is SEK
+        assert array.dtype == np.int64
+        assert array.tolist() == subunits
+
+    @given(lists(integers(), min_size=1))
+    def test_roundtrips_arbitrary_values(self, subunits: list[int]) -> None:
+        values = from_numpy(np.array(subunits, dtype=object), SEK)
+        array, _ = to_numpy(values)
+        assert array.tolist() == subunits
+
+    def test_falls_back_to_object_array_on_overflow(self) -> None:
+        values: list[Money[Currency] | Overdraft[Currency]] = [
+            SEK.from_subunit(2**63),
+            SEK.overdraft_from_subunit(1),
+        ]
+        array, _ = to_numpy(values)
+        assert array.dtype == object
+        assert array.tolist() == [2**63, -1]
+
+    def test_maps_overdraft_to_negative_subunits(self) -> None:
+        values: list[Money[SEKType] | Overdraft[SEKType]] = [
+            SEK("0.01"),
+            SEK.overdraft("1.50"),
+            SEK(0),
+        ]
+        array, currency = to_numpy(values)
+        assert array.tolist() == [1, -150, 0]
+        assert currency is SEK
+
+    def test_raises_currency_mismatch_for_mixed_currencies(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            to_numpy([SEK(1), NOK(1)])
+
+    def test_raises_currency_mismatch_for_unexpected_currency(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            to_numpy([NOK(1)], SEK)
+
+    def test_empty_input_requires_currency(self) -> None:
+        with pytest.raises(ValueError, match=r"Currency must be given"):
+            to_numpy([])
+        array, currency = to_numpy([], SEK)
+        assert array.dtype == np.int64
+        assert array.shape == (0,)
+        assert currency is SEK
+
+    def test_raises_type_error_for_subunit_fraction(self) -> None:
+        with pytest.raises(TypeError):
+            to_numpy([SEK.fraction(1, 3)])  # type: ignore[arg-type]
+
+
+class TestFromNumpy:
+    def test_returns_money_and_overdraft(self) -> None:
+        assert from_numpy(np.array([0, 1, -1]), SEK) == [
+            Money(0, SEK),
+            SEK.from_subunit(1),
+            SEK.overdraft_from_subunit(1),
+        ]
+
+    def test_raises_type_error_for_float_array(self) -> None:
+        with pytest.raises(TypeError, match=r"got dtype float64"):
+            from_numpy(np.array([1.0]), SEK)
+
+    def test_raises_type_error_for_non_integer_object_elements(self) -> None:
+        with pytest.raises(TypeError, match=r"Expected integer elements"):
+            from_numpy(np.array([1.5, Decimal("2.7")], dtype=object), SEK)
+        with pytest.raises(TypeError, match=r"Expected integer elements"):
+            from_numpy(np.array([1, Fraction(1, 1)], dtype=object), SEK)
+
+    def test_accepts_numpy_integers_in_object_arrays(self) -> None:
+        array = np.array([np.int64(150), 2**70], dtype=object)
+        assert from_numpy(array, SEK) == [SEK("1.50"), SEK.from_subunit(2**70)]
+
+
+class TestFractionsToNumpy:
+    def test_converts_numerators_and_denominators(self) -> None:
+        numerators, denominators, currency = fractions_to_numpy(
+            [SEK.fraction(1, 3), SEK.fraction(-4, 6), SEK.fraction(2**70, 3)]
+        )
+        assert currency is SEK
+        assert numerators.tolist() == [1, -2, 2**70]
+        assert denominators.tolist() == [3, 3, 3]
+        assert numerators.dtype == object
+        assert denominators.dtype == np.int64
+
+    def test_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            fractions_to_numpy([SEK.fraction(1, 3), NOK.fraction(1, 3)])
+
+
+class TestRoundSubunits:
+    @given(
+        values=lists(fractions(), max_size=20),
+        rounding=sampled_from(Round),
+    )
+    def test_matches_subunit_fraction_rounding(
+        self,
+        values: list[Fraction],
+        rounding: Round,
+    ) -> None:
+        sek_values = [SubunitFraction(value, SEK) for value in values]
+        numerators, denominators, _ = fractions_to_numpy(sek_values, SEK)
+        result = round_subunits(numerators, denominators, rounding)
+        assert result.tolist() == [
+            value._round_subunit(rounding) for value in sek_values
+        ]
+
+    @given(
+        numerator=integers(),
+        denominator=integers().filter(bool),
+        rounding=sampled_from(Round),
+    )
+    def test_handles_arbitrary_precision_and_negative_denominators(
+        self,
+        numerator: int,
+        denominator: int,
+        rounding: Round,
+    ) -> None:
+        expected = SEK.fraction(numerator, denominator)._round_subunit(rounding)
+        result = round_subunits(
+            np.array([numerator], dtype=object),
+            np.array([denominator], dtype=object),
+            rounding,
+        )
+        assert result.tolist() == [expected]
+
+    @pytest.mark.parametrize("rounding", Round)
+    def test_handles_int64_extremes(self, rounding: Round) -> None:
+        minimum = -(2**63)
+        maximum = 2**63 - 1
+        numerators = np.array([minimum, maximum, minimum], dtype=np.int64)
+        denominators = np.array([maximum, minimum, -1], dtype=np.int64)
+        result = round_subunits(numerators, denominators, rounding)
+        assert result.tolist() == [
+            SEK.fraction(n, d)._round_subunit(rounding)
+            for n, d in ((minimum, maximum), (maximum, minimum), (minimum, -1))
+        ]
+
+    @pytest.mark.parametrize("rounding", Round)
+    def test_handles_uint64_values_above_int64_max(self, rounding: Round) -> None:
+        numerators = np.array([2**63, 2**64 - 1, 3], dtype=np.uint64)
+        denominators = np.array([1, 2, 2**64 - 1], dtype=np.uint64)
+        result = round_subunits(numerators, denominators, rounding)
+        assert result.tolist() == [
+            SEK.fraction(n, d)._round_subunit(rounding)
+            for n, d in ((2**63, 1), (2**64 - 1, 2), (3, 2**64 - 1))
+        ]
+
+    def test_keeps_small_uint64_values_in_int64(self) -> None:
+        result = round_subunits(
+            np.array([3], dtype=np.uint64),
+            np.array([2], dtype=np.uint64),
+            Round.UP,
+        )
+        assert result.dtype == np.int64
+        assert result.tolist() == [2]
+
+    def test_raises_division_by_zero(self) -> None:
+        with pytest.raises(DivisionByZero):
+            round_subunits([1], [0], Round.DOWN)
+
+    def test_raises_type_error_for_float_input(self) -> None:
+        with pytest.raises(TypeError):
+            round_subunits([0.5], [1], Round.DOWN)
+
+    def test_raises_type_error_for_non_integer_object_elements(self) -> None:
+        with pytest.raises(TypeError, match=r"Expected integer elements"):
+            round_subunits(np.array([1, 0.5], dtype=object), [1, 1], Round.DOWN)
+        with pytest.raises(TypeError, match=r"Expected integer elements"):
+            round_subunits([1], np.array([Decimal("2.5")], dtype=object), Round.DOWN)
+
+
+class TestStructured:
+    def test_roundtrips_mixed_currencies(self) -> None:
+        values: list[Money[Currency] | Overdraft[Currency]] = [
+            SEK("1.50"),
+            NOK.overdraft("0.01"),
+            SEK(0),
+        ]
+        array = to_structured(values)
+        assert array["subunits"].tolist() == [150, -1, 0]
+        assert array["currency"].tolist() == ["SEK", "NOK", "SEK"]
+        assert from_structured(array) == values
+
+    def test_uses_given_registry(self) -> None:
+        array = to_structured([JCN("1.23")])
+        assert from_structured(array, custom_registry) == [JCN("1.23")]
+
+    def test_raises_overflow_error_for_large_values(self) -> None:
+        with pytest.raises(OverflowError):
+            to_structured([SEK.from_subunit(2**63)])
+
+    def test_converts_empty_input(self) -> None:
+        array = to_structured([])
+        assert array.shape == (0,)
+        assert from_structured(array) == []
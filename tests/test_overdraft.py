@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import pickle
 from decimal import Decimal
 from fractions import Fraction
 from typing import Any
@@ -8,19 +10,23 @@ import pytest
 from hypothesis import assume
 from hypothesis import example
 from hypothesis import given
+from hypothesis.strategies import decimals
 from hypothesis.strategies import integers
 from hypothesis.strategies import just
+from hypothesis.strategies import sampled_from
 from hypothesis.strategies import text
 from typing_extensions import assert_type
 
 from immoney import Currency
 from immoney import Money
 from immoney import Overdraft
+from immoney import Round
 from immoney import SubunitFraction
 from immoney._base import ParsableMoneyValue
 from immoney.currencies import NOK
 from immoney.currencies import SEK
 from immoney.currencies import SEKType
+from immoney.currencies import registry
 from immoney.errors import DivisionByZero
 from immoney.errors import FrozenInstanceError
 from immoney.errors import InvalidOverdraftValue
@@ -75,6 +81,7 @@ def test_raises_type_error_when_instantiated_with_non_currency() -> None:
 @given(money=monies(), name=text(), value=valid_sek_decimals | text())
 @example(SEK(23), "value", Decimal("123"))
 @example(NOK(23), "currency", SEK)
+@example(SEK.overdraft(23), "_hash", 1)
 def test_raises_on_assignment(money: Money[Any], name: str, value: object) -> None:
     initial = getattr(money, name, None)
     with pytest.raises(FrozenInstanceError):
@@ -82,6 +89,14 @@ def test_raises_on_assignment(money: Money[Any], name: str, value: object) -> No
     assert getattr(money, name, None) == initial
 
 
+def test_raises_on_reinitialization() -> None:
+    value = SEK.overdraft(1)
+    with pytest.raises(FrozenInstanceError):
+        value.__init__(500, SEK)
+    assert value.subunits == 100
+    assert SEK.overdraft(1) is value
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     (
@@ -486,6 +501,21 @@ class TestMul:
         ):
             b * a  # type: ignore[operator]
 
+    @given(
+        overdrafts(),
+        decimals(allow_infinity=False, allow_nan=False, places=6),
+        sampled_from(Round),
+    )
+    @example(SEK.overdraft("9.99"), Decimal("1.25"), Round.HALF_UP)
+    def test_multiply_and_round_equals_rounded_product(
+        self,
+        a: Overdraft[Currency],
+        b: Decimal,
+        rounding: Round,
+    ) -> None:
+        assert a.multiply_and_round(b, rounding) == (a * b).round_either(rounding)
+        assert a.multiply_and_round(-2, rounding) == a * -2
+
 
 class TestTruediv:
     @pytest.mark.parametrize(
@@ -602,3 +632,16 @@ class TestFloordiv:
         non_zero = value + value.currency.one_subunit
         with pytest.raises(DivisionByZero):
             non_zero // 0
+
+
+@given(overdrafts(currencies=sampled_from(tuple(registry.values()))))
+def test_pickle_roundtrip_returns_interned_instance(value: Overdraft[Any]) -> None:
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored is value
+    assert restored.currency is value.currency
+
+
+def test_copy_returns_self() -> None:
+    value = SEK.overdraft("1.50")
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value
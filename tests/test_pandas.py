@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+
+from immoney._base import _dispatch_type
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import CurrencyMismatch
+from immoney.pandas import MoneyArray
+from immoney.pandas import MoneyDtype
+
+int64 = integers(min_value=-(2**62), max_value=2**62 - 1)
+
+
+# Operators of extension arrays are unknown to the pandas stubs.
+def series(*values: object) -> Any:
+    return pd.Series(values, dtype="money")
+
+
+class TestMoneyArray:
+    def test_dtype_is_registered(self) -> None:
+        assert pd.api.types.pandas_dtype("money") == MoneyDtype()
+
+    def test_roundtrips_values(self) -> None:
+        values = [SEK("1.50"), NOK.overdraft("0.25"), pd.NA, SEK(0)]
+        assert series(*values).tolist() == values
+
+    def test_missing_values(self) -> None:
+        array = MoneyArray._from_sequence([SEK(1), None, np.nan])
+        assert array.isna().tolist() == [False, True, True]
+
+    def test_raises_overflow_error_for_large_values(self) -> None:
+        with pytest.raises(OverflowError):
+            series(SEK.from_subunit(2**63))
+
+    def test_from_subunits(self) -> None:
+        array = MoneyArray.from_subunits(np.array([1, -2]), SEK)
+        assert list(array) == [SEK.from_subunit(1), SEK.overdraft_from_subunit(2)]
+        assert array.subunits.tolist() == [1, -2]
+        assert not array.subunits.flags.writeable
+
+    def test_setitem_extends_currencies(self) -> None:
+        values = series(SEK(1), SEK(2))
+        values[1] = NOK(3)
+        assert values.tolist() == [SEK(1), NOK(3)]
+
+    def test_concat(self) -> None:
+        result = pd.concat([series(SEK(1), None), series(NOK(2))], ignore_index=True)
+        assert result.dtype == MoneyDtype()
+        assert result.tolist() == [SEK(1), pd.NA, NOK(2)]
+
+    def test_take_with_fill_value(self) -> None:
+        array = series(SEK(1)).array
+        assert list(array.take([0, -1], allow_fill=True, fill_value=NOK(2))) == [
+            SEK(1),
+            NOK(2),
+        ]
+        assert list(array.take([-1], allow_fill=True)) == [pd.NA]
+
+
+class TestArithmetic:
+    @given(lists(int64), lists(int64))
+    def test_add_and_subtract_match_scalars(self, a: list[int], b: list[int]) -> None:
+        a, b = a[: len(b)], b[: len(a)]
+        left = MoneyArray.from_subunits(np.array(a, dtype=np.int64), SEK)
+        right = MoneyArray.from_subunits(np.array(b, dtype=np.int64), SEK)
+        assert list(left + right) == [
+            x + y for x, y in zip(list(left), list(right), strict=False)
+        ]
+        assert list(left - right) == [
+            x - y for x, y in zip(list(left), list(right), strict=False)
+        ]
+
+    def test_scalar_operands(self) -> None:
+        values = series(SEK(1), SEK.overdraft(2), None)
+        assert (values + SEK(1)).tolist() == [SEK(2), SEK.overdraft(1), pd.NA]
+        assert (SEK(1) - values).tolist() == [SEK(0), SEK(3), pd.NA]
+        assert (values * 3).tolist() == [SEK(3), SEK.overdraft(6), pd.NA]
+        assert (-values).tolist() == [SEK.overdraft(1), SEK(2), pd.NA]
+
+    def test_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            series(SEK(1)) + series(NOK(1))
+        with pytest.raises(CurrencyMismatch):
+            series(SEK(1)) + NOK(1)
+
+    def test_raises_overflow_error(self) -> None:
+        values = MoneyArray.from_subunits([2**63 - 1], SEK)
+        with pytest.raises(OverflowError):
+            values + SEK.from_subunit(1)
+        with pytest.raises(OverflowError):
+            values * 2
+        with pytest.raises(OverflowError):
+            -MoneyArray.from_subunits([-(2**63)], SEK)
+
+    def test_equality(self) -> None:
+        values = series(SEK(1), NOK(1), None)
+        assert (values == SEK(1)).tolist() == [True, False, False]
+
+
+class TestReductions:
+    def test_sum(self) -> None:
+        assert series(SEK(1), SEK.overdraft(3), None).sum() == SEK.overdraft(2)
+
+    def test_sum_is_exact_beyond_int64(self) -> None:
+        values = MoneyArray.from_subunits([2**62, 2**62, 2**62], SEK)
+        assert pd.Series(values).sum() == SEK.from_subunit(3 * 2**62)
+
+    def test_sum_without_skipna_propagates_missing(self) -> None:
+        assert series(SEK(1), None).sum(skipna=False) is pd.NA
+
+    def test_min_max(self) -> None:
+        values = series(SEK(1), SEK.overdraft(3), SEK(2))
+        assert values.min() == SEK.overdraft(3)
+        assert values.max() == SEK(2)
+
+    def test_sum_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            series(SEK(1), NOK(1)).sum()
+
+
+class TestGroupBy:
+    def test_sum(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "key": ["a", "b", "a", "c", "d"],
+                "value": series(SEK(1), NOK(2), SEK.overdraft(3), None, SEK(4)),
+            }
+        )
+        result = frame.groupby("key")["value"].sum()
+        assert result.dtype == MoneyDtype()
+        assert result.index.tolist() == ["a", "b", "c", "d"]
+        assert result.tolist() == [SEK.overdraft(2), NOK(2), pd.NA, SEK(4)]
+
+    def test_sum_raises_currency_mismatch(self) -> None:
+        frame = pd.DataFrame({"key": [1, 1], "value": series(SEK(1), NOK(1))})
+        with pytest.raises(CurrencyMismatch):
+            frame.groupby("key")["value"].sum()
+
+    def test_sum_raises_overflow_error(self) -> None:
+        frame = pd.DataFrame(
+            {"key": [1, 1], "value": MoneyArray.from_subunits([2**63 - 1, 1], SEK)}
+        )
+        with pytest.raises(OverflowError):
+            frame.groupby("key")["value"].sum()
+
+    @given(
+        lists(integers(-(2**56), 2**56), max_size=50),
+        lists(integers(0, 3), max_size=50),
+    )
+    def test_matches_sequential_sum(self, subunits: list[int], keys: list[int]) -> None:
+        keys = keys[: len(subunits)]
+        subunits = subunits[: len(keys)]
+        frame = pd.DataFrame(
+            {"key": keys, "value": MoneyArray.from_subunits(subunits, SEK)}
+        )
+        totals = dict[int, int]()
+        for key, value in zip(keys, subunits, strict=False):
+            totals[key] = totals.get(key, 0) + value
+        result = frame.groupby("key")["value"].sum()
+        assert dict(result.items()) == {
+            key: _dispatch_type(total, SEK) for key, total in totals.items()
+        }
+
+
+class TestArrow:
+    def test_roundtrips_through_parquet(self, tmp_path: Path) -> None:
+        frame = pd.DataFrame({"value": series(SEK("1.50"), None, NOK.overdraft(2))})
+        path = tmp_path / "values.parquet"
+        frame.to_parquet(path)
+        result = pd.read_parquet(path)
+        assert result["value"].dtype == MoneyDtype()
+        assert result["value"].tolist() == frame["value"].tolist()
+
+    def test_from_arrow_table(self) -> None:
+        table = pa.table({"value": pa.array(series(SEK(1), None))})
+        assert table.to_pandas()["value"].tolist() == [SEK(1), pd.NA]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from functools import reduce
+from operator import add
+from pathlib import Path
+
+import pytest
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.parallel import Monetary
+from immoney.parallel import PartialSum
+from immoney.parallel import parallel_group_sum
+from immoney.parallel import parallel_sum
+from immoney.parallel import parallel_sum_file
+from immoney.parallel import parse_csv_line
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+
+def random_values(
+    seed: int,
+    count: int,
+) -> list[Money[Currency] | Overdraft[Currency]]:
+    rng = random.Random(seed)
+    values = list[Money[Currency] | Overdraft[Currency]]()
+    for _ in range(count):
+        currency = rng.choice((SEK, NOK))
+        subunits = rng.randint(1, 100_000)
+        values.append(
+            currency.from_subunit(subunits)
+            if rng.random() < 0.6
+            else currency.overdraft_from_subunit(subunits)
+        )
+    return values
+
+
+def sequential_sum(values: Sequence[Monetary]) -> dict[Currency, Monetary]:
+    result = dict[Currency, Monetary]()
+    for currency in (SEK, NOK):
+        of_currency = [value for value in values if value.currency is currency]
+        if of_currency:
+            result[currency] = reduce(add, of_currency)
+    return result
+
+
+def parse_row(row: tuple[str, int]) -> Monetary:
+    code, subunits = row
+    currency = {"SEK": SEK, "NOK": NOK}[code]
+    return currency.from_subunit(subunits)
+
+
+def parse_group_row(row: tuple[str, str, int]) -> tuple[str, Monetary]:
+    group, code, subunits = row
+    return group, parse_row((code, subunits))
+
+
+def parse_custom_line(line: str) -> Monetary:
+    return JCN(line)
+
+
+class TestPartialSum:
+    def test_keeps_integer_totals_for_money_and_overdraft(self) -> None:
+        partial = PartialSum[None]()
+        partial.add(None, SEK(3))
+        partial.add(None, SEK.overdraft(5))
+        assert partial.totals == {(None, "SEK"): -200}
+        assert partial.resolve() == {None: {SEK: SEK.overdraft(2)}}
+
+    def test_becomes_fraction_when_subunit_fraction_is_added(self) -> None:
+        partial = PartialSum[None]()
+        partial.add(None, SEK(1))
+        partial.add(None, SEK.fraction(1, 3))
+        (result,) = partial.resolve()[None].values()
+        assert result == SEK.fraction(301, 3)
+        assert result == SEK(1) + SEK.fraction(1, 3)
+
+    def test_merge_adds_totals(self) -> None:
+        a = PartialSum[str]()
+        a.add("x", SEK(1))
+        b = PartialSum[str]()
+        b.add("x", SEK(2))
+        b.add("y", NOK(3))
+        a.merge(b)
+        assert a.resolve() == {"x": {SEK: SEK(3)}, "y": {NOK: NOK(3)}}
+
+    def test_raises_type_error_for_non_monetary_value(self) -> None:
+        with pytest.raises(TypeError):
+            PartialSum[None]().add(None, 1)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1_000])
+def test_parallel_sum_equals_sequential_sum(chunk_size: int) -> None:
+    values = random_values(seed=chunk_size, count=300)
+    result = parallel_sum(values, chunk_size=chunk_size, max_workers=2)
+    assert result == sequential_sum(values)
+
+
+def test_parallel_sum_of_empty_input_is_empty() -> None:
+    assert parallel_sum([], max_workers=1) == {}
+
+
+def test_parallel_sum_can_parse_rows_in_workers() -> None:
+    rows = [("SEK", 100), ("NOK", 5), ("SEK", 250)]
+    result = parallel_sum(rows, parse_row, chunk_size=2, max_workers=2)
+    assert result == {SEK: SEK("3.50"), NOK: NOK("0.05")}
+
+
+def test_parallel_group_sum_sums_per_group_and_currency() -> None:
+    rows: list[tuple[str, Monetary]] = [
+        ("a", SEK(1)),
+        ("b", SEK(2)),
+        ("a", NOK(3)),
+        ("a", SEK.overdraft(4)),
+    ]
+    result = parallel_group_sum(rows, chunk_size=1, max_workers=2)
+    assert result == {
+        "a": {SEK: SEK.overdraft(3), NOK: NOK(3)},
+        "b": {SEK: SEK(2)},
+    }
+
+
+def test_parallel_group_sum_can_parse_rows_in_workers() -> None:
+    rows = [("a", "SEK", 1), ("a", "SEK", 2), ("b", "NOK", 3)]
+    result = parallel_group_sum(rows, parse_group_row, chunk_size=2, max_workers=2)
+    assert result == {"a": {SEK: SEK.from_subunit(3)}, "b": {NOK: NOK.from_subunit(3)}}
+
+
+def test_parse_csv_line() -> None:
+    assert parse_csv_line("SEK,12.50") == SEK("12.50")
+    assert parse_csv_line("NOK,-0.01") == NOK.overdraft("0.01")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 1_000_000])
+def test_parallel_sum_file_equals_sequential_sum(
+    tmp_path: Path,
+    chunk_size: int,
+) -> None:
+    values = random_values(seed=chunk_size, count=200)
+    path = tmp_path / "ledger.csv"
+    path.write_text(
+        "\n".join(
+            f"{value.currency.code},"
+            f"{'-' if isinstance(value, Overdraft) else ''}{value.decimal}"
+            for value in values
+        )
+        + "\n\n"
+    )
+    result = parallel_sum_file(path, chunk_size=chunk_size, max_workers=2)
+    assert result == sequential_sum(values)
+
+
+def test_parallel_sum_file_with_custom_registry(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.txt"
+    path.write_text("1.50\n2.25\n")
+    result = parallel_sum_file(
+        path,
+        parse_custom_line,
+        max_workers=1,
+        registry=custom_registry,
+    )
+    assert result == {JCN: JCN("3.75")}
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_raises_value_error_for_non_positive_chunk_size(
+    tmp_path: Path,
+    chunk_size: int,
+) -> None:
+    with pytest.raises(ValueError, match=r"Chunk size must be positive"):
+        parallel_sum([SEK(1), SEK(2)], chunk_size=chunk_size, max_workers=1)
+    with pytest.raises(ValueError, match=r"Chunk size must be positive"):
+        parallel_group_sum([("a", SEK(1))], chunk_size=chunk_size, max_workers=1)
+    path = tmp_path / "ledger.csv"
+    path.write_text("SEK,1.00\n")
+    with pytest.raises(ValueError, match=r"Chunk size must be positive"):
+        parallel_sum_file(path, chunk_size=chunk_size, max_workers=1)
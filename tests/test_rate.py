@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+import pytest
+from hypothesis import example
+from hypothesis import given
+from hypothesis.strategies import fractions
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from typing_extensions import assert_type
+
+from immoney import Money
+from immoney import Overdraft
+from immoney import Rate
+from immoney import Round
+from immoney import SubunitFraction
+from immoney.currencies import SEK
+from immoney.currencies import SEKType
+from immoney.errors import FrozenInstanceError
+
+from .strategies import monies
+from .strategies import overdrafts
+from .strategies import subunit_fractions
+
+
+class TestInit:
+    @pytest.mark.parametrize(
+        ("args", "numerator", "denominator"),
+        [
+            ((0,), 0, 1),
+            ((3,), 3, 1),
+            (("0.25",), 1, 4),
+            ((Decimal("-1.5"),), -3, 2),
+            ((Fraction(6, 4),), 3, 2),
+            ((6, 4), 3, 2),
+            ((Decimal("0.5"), 3), 1, 6),
+        ],
+    )
+    def test_normalizes_value(
+        self,
+        args: tuple[Any, ...],
+        numerator: int,
+        denominator: int,
+    ) -> None:
+        rate = Rate(*args)
+        assert rate.numerator == numerator
+        assert rate.denominator == denominator
+        assert rate.fraction == Fraction(numerator, denominator)
+
+    def test_caches_instance(self) -> None:
+        assert Rate("0.25") is Rate(Fraction(1, 4))
+        assert Rate(1, 4) is Rate.from_percentage(25)
+
+    def test_raises_for_invalid_value(self) -> None:
+        with pytest.raises(ValueError):
+            Rate("foo")
+        with pytest.raises(ZeroDivisionError):
+            Rate(1, 0)
+
+    def test_raises_type_error_for_float(self) -> None:
+        with pytest.raises(TypeError, match=r"float"):
+            Rate(0.1)  # type: ignore[arg-type]
+        with pytest.raises(TypeError, match=r"float"):
+            Rate(1, 0.5)  # type: ignore[arg-type]
+        with pytest.raises(TypeError, match=r"float"):
+            Rate.from_percentage(12.5)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        ("percentage", "expected"),
+        [
+            (25, Rate(1, 4)),
+            ("12.5", Rate(1, 8)),
+            (Decimal("-100"), Rate(-1)),
+            (Fraction(1, 3), Rate(1, 300)),
+        ],
+    )
+    def test_from_percentage(self, percentage: Any, expected: Rate) -> None:
+        assert Rate.from_percentage(percentage) == expected
+
+
+def test_repr() -> None:
+    assert repr(Rate("0.25")) == "Rate('1/4')"
+    assert repr(Rate(-2)) == "Rate('-2')"
+
+
+def test_hash_is_equal_for_uncached_instances() -> None:
+    uncached = Rate._construct(1, 4)
+    assert uncached is not Rate(1, 4)
+    assert uncached == Rate(1, 4)
+    assert hash(uncached) == hash(Rate(1, 4))
+    assert Rate(1, 4) != Rate(1, 3)
+    assert Rate(1, 4) != Fraction(1, 4)
+
+
+def test_raises_frozen_instance_error_on_assignment() -> None:
+    with pytest.raises(FrozenInstanceError):
+        Rate(1).numerator = 2  # type: ignore[misc]
+
+
+def test_raises_frozen_instance_error_on_reinitialization() -> None:
+    rate = Rate(1, 4)
+    with pytest.raises(FrozenInstanceError):
+        rate.__init__(5)
+    assert (rate.numerator, rate.denominator) == (1, 4)
+
+
+def test_pickle_and_copy_return_interned_instance() -> None:
+    rate = Rate("0.25")
+    assert pickle.loads(pickle.dumps(rate)) is rate
+    assert copy.copy(rate) is rate
+    assert copy.deepcopy(rate) is rate
+
+
+class TestMul:
+    @given(fractions(), fractions())
+    def test_composes_rates(self, a: Fraction, b: Fraction) -> None:
+        product = Rate(a) * Rate(b)
+        assert_type(product, Rate)
+        assert product == Rate(a * b)
+
+    def test_returns_subunit_fraction_for_values(self) -> None:
+        rate = Rate("0.25")
+        assert_type(SEK(1) * rate, SubunitFraction[SEKType])
+        assert_type(rate * SEK(1), SubunitFraction[SEKType])
+        assert SEK(1) * rate == rate * SEK(1) == SEK.fraction(25)
+        assert SEK.overdraft(1) * rate == SEK.fraction(-25)
+        assert SEK.fraction(1, 3) * rate == SEK.fraction(1, 12)
+
+    @given(monies() | overdrafts() | subunit_fractions(), fractions())
+    def test_agrees_with_fraction_multiplication(
+        self,
+        value: Money[Any] | Overdraft[Any] | SubunitFraction[Any],
+        fraction: Fraction,
+    ) -> None:
+        assert value * Rate(fraction) == value * fraction
+
+    @pytest.mark.parametrize("other", [object(), 1, 1.0, Fraction(1, 2)])
+    def test_raises_type_error_for_invalid_other(self, other: object) -> None:
+        with pytest.raises(TypeError):
+            Rate(1) * other  # type: ignore[operator]
+        with pytest.raises(TypeError):
+            other * Rate(1)  # type: ignore[operator]
+
+
+class TestApply:
+    @pytest.mark.parametrize(
+        ("rate", "value", "rounding", "expected"),
+        [
+            (Rate("0.25"), SEK("0.10"), Round.HALF_UP, SEK("0.03")),
+            (Rate("0.25"), SEK("0.10"), Round.HALF_EVEN, SEK("0.02")),
+            (Rate("0.25"), SEK("0.10"), Round.DOWN, SEK("0.02")),
+            (Rate("0.5"), SEK.overdraft("0.03"), Round.DOWN, SEK.overdraft("0.02")),
+            (Rate("0.5"), SEK.overdraft("0.03"), Round.UP, SEK.overdraft("0.01")),
+            (Rate(-1), SEK(1), Round.DOWN, SEK.overdraft(1)),
+            (Rate(0), SEK.overdraft(1), Round.DOWN, SEK(0)),
+        ],
+    )
+    def test_rounds_product(
+        self,
+        rate: Rate,
+        value: Money[SEKType] | Overdraft[SEKType],
+        rounding: Round,
+        expected: Money[SEKType] | Overdraft[SEKType],
+    ) -> None:
+        assert rate.apply(value, rounding) == expected
+
+    @given(
+        lists(monies() | overdrafts(), max_size=10),
+        fractions(),
+        sampled_from(Round),
+    )
+    @example([SEK("9.99")], Fraction(5, 4), Round.HALF_UP)
+    def test_agrees_with_rounding_subunit_fraction(
+        self,
+        values: list[Money[Any] | Overdraft[Any]],
+        fraction: Fraction,
+        rounding: Round,
+    ) -> None:
+        rate = Rate(fraction)
+        expected = [(value * fraction).round_either(rounding) for value in values]
+        assert [rate.apply(value, rounding) for value in values] == expected
+        assert rate.apply_many(values, rounding) == expected
+        assert rate.apply_many(iter(values), rounding) == expected
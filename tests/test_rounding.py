@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Any
+
+import pytest
+from hypothesis import example
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+from hypothesis.strategies import tuples
+
+from immoney import Round
+from immoney import SubunitFraction
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import CurrencyMismatch
+from immoney.rounding import round_many
+from immoney.rounding import round_subunits
+from immoney.rounding import round_subunits_to_total
+from immoney.rounding import round_to_total
+
+from .strategies import subunit_fractions
+
+sek_fractions = subunit_fractions(currencies=sampled_from([SEK]))
+ratios = tuples(integers(), integers(min_value=1))
+
+
+class TestRoundSubunits:
+    @given(lists(subunit_fractions()), sampled_from(Round))
+    @example(
+        [SEK.fraction(Fraction(n, 2)) for n in range(-5, 6)],
+        Round.HALF_EVEN,
+    )
+    @example(
+        [SEK.fraction(Fraction(n, 2)) for n in range(-5, 6)],
+        Round.HALF_DOWN,
+    )
+    @example(
+        [SEK.fraction(Fraction(n, 2)) for n in range(-5, 6)],
+        Round.HALF_UP,
+    )
+    def test_agrees_with_round_either(
+        self,
+        values: list[SubunitFraction[Any]],
+        rounding: Round,
+    ) -> None:
+        expected = [value.round_either(rounding) for value in values]
+        assert round_many(values, rounding) == expected
+        assert round_many(iter(values), rounding) == expected
+        assert round_subunits(values, rounding) == [
+            value._round_subunit(rounding) for value in values
+        ]
+
+    @given(lists(ratios), sampled_from(Round))
+    def test_accepts_ratios(
+        self,
+        values: list[tuple[int, int]],
+        rounding: Round,
+    ) -> None:
+        assert round_subunits(values, rounding) == [
+            SEK.fraction(Fraction(*value))._round_subunit(rounding) for value in values
+        ]
+
+    @pytest.mark.parametrize("denominator", [0, -1])
+    def test_raises_value_error_for_non_positive_denominator(
+        self,
+        denominator: int,
+    ) -> None:
+        with pytest.raises(ValueError):
+            round_subunits([(1, 1), (1, denominator)], Round.DOWN)
+
+
+class TestRoundToTotal:
+    @given(lists(sek_fractions), sampled_from(Round))
+    def test_sum_equals_rounded_exact_total(
+        self,
+        values: list[SubunitFraction[Any]],
+        rounding: Round,
+    ) -> None:
+        rounded = round_to_total(values, rounding)
+        exact_total = SEK.fraction(sum((value.value for value in values), Fraction(0)))
+        assert sum(rounded, SEK(0)) == exact_total.round_either(rounding)
+        # Every value is either rounded down or up.
+        for value, result in zip(values, rounded, strict=True):
+            assert result in (
+                value.round_either(Round.DOWN),
+                value.round_either(Round.UP),
+            )
+
+    @given(lists(ratios, max_size=20), sampled_from(Round))
+    def test_subunits_agree_with_values(
+        self,
+        values: list[tuple[int, int]],
+        rounding: Round,
+    ) -> None:
+        fractions_ = [SEK.fraction(Fraction(*value)) for value in values]
+        assert [
+            SEK.from_subunit(subunits)
+            if subunits >= 0
+            else SEK.overdraft_from_subunit(-subunits)
+            for subunits in round_subunits_to_total(values, rounding)
+        ] == round_to_total(fractions_, rounding)
+
+    def test_rounds_up_largest_remainders_first(self) -> None:
+        assert round_subunits_to_total(
+            [(1, 4), (3, 4), (1, 2), (1, 2)], Round.HALF_UP
+        ) == [0, 1, 1, 0]
+
+    def test_returns_empty_list_for_no_values(self) -> None:
+        assert round_to_total([], Round.DOWN) == []
+        assert round_subunits_to_total([], Round.DOWN) == []
+
+    def test_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            round_to_total([SEK.fraction(1), NOK.fraction(1)], Round.DOWN)
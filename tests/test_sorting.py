@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+
+from immoney import Money
+from immoney import Overdraft
+from immoney import SubunitFraction
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import CurrencyMismatch
+from immoney.sorting import nlargest
+from immoney.sorting import nsmallest
+from immoney.sorting import sort_key
+from immoney.sorting import sorted_values
+
+from .strategies import SEKMonetary
+from .strategies import monies
+from .strategies import overdrafts
+from .strategies import sek_monetaries
+
+mixed_currency_values = lists(
+    monies(currencies=sampled_from([SEK, NOK]))
+    | overdrafts(currencies=sampled_from([SEK, NOK]))
+)
+
+
+@given(sek_monetaries, sek_monetaries)
+def test_sort_key_agrees_with_comparison(a: SEKMonetary, b: SEKMonetary) -> None:
+    assert (sort_key(a) < sort_key(b)) is (a < b)
+    assert (sort_key(a) == sort_key(b)) is (a == b)
+
+
+def test_sort_key_raises_type_error_for_invalid_value() -> None:
+    with pytest.raises(TypeError):
+        sort_key(1)  # type: ignore[arg-type]
+
+
+class TestSortedValues:
+    @given(lists(sek_monetaries), sampled_from([False, True]))
+    def test_agrees_with_sorted(
+        self,
+        values: list[SEKMonetary],
+        reverse: bool,
+    ) -> None:
+        assert sorted_values(values, reverse=reverse) == sorted(values, reverse=reverse)
+        assert sorted_values(iter(values), reverse=reverse) == sorted(
+            values, reverse=reverse
+        )
+
+    @given(mixed_currency_values)
+    def test_groups_by_currency(
+        self,
+        values: list[Money[Any] | Overdraft[Any]],
+    ) -> None:
+        result = sorted_values(values, by_currency=True)
+        nok = [value for value in values if value.currency is NOK]
+        sek = [value for value in values if value.currency is SEK]
+        assert result == sorted(nok) + sorted(sek)
+
+    def test_raises_currency_mismatch(self) -> None:
+        with pytest.raises(CurrencyMismatch):
+            sorted_values([SEK(1), NOK(1)])
+
+    def test_sorts_empty_iterable(self) -> None:
+        assert sorted_values([]) == []
+
+
+class TestSelection:
+    @given(lists(sek_monetaries), integers(min_value=0, max_value=5))
+    def test_agrees_with_sorted(self, values: list[SEKMonetary], n: int) -> None:
+        assert nlargest(n, values) == sorted(values, reverse=True)[:n]
+        assert nsmallest(n, values) == sorted(values)[:n]
+
+    def test_keeps_instances(self) -> None:
+        values: list[SEKMonetary] = [
+            SEK(1),
+            SEK.overdraft(1),
+            SubunitFraction(150, SEK),
+        ]
+        assert nlargest(1, values)[0] is values[2]
+        assert nsmallest(1, values)[0] is values[1]
+
+    @pytest.mark.parametrize("select", [nlargest, nsmallest])
+    def test_raises_currency_mismatch(self, select: Any) -> None:
+        with pytest.raises(CurrencyMismatch):
+            select(1, [SEK(1), NOK(1)])
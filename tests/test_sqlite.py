@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from fractions import Fraction
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+
+from immoney import Currency
+from immoney import Money
+from immoney import Overdraft
+from immoney._base import _dispatch_type
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.errors import ParseError
+from immoney.sqlite import executemany
+from immoney.sqlite import expand
+from immoney.sqlite import register
+from immoney.sqlite import row_factory
+from immoney.sqlite import typed_rows
+
+from .custom_currency import JCN
+from .custom_currency import registry as custom_registry
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    connection.execute(
+        "CREATE TABLE entries (id INTEGER, amount INTEGER, currency TEXT)"
+    )
+    yield connection
+    connection.close()
+
+
+class TestExpand:
+    def test_expands_money_and_overdraft(self) -> None:
+        assert expand([SEK(1), "a", NOK.overdraft(2)]) == (100, "SEK", "a", -200, "NOK")
+
+
+class TestColumnPairs:
+    @given(lists(integers(min_value=-(2**50), max_value=2**50), max_size=20))
+    def test_aggregates_inside_sqlite(self, subunits: list[int]) -> None:
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE entries (amount INTEGER, currency TEXT)")
+        executemany(
+            connection,
+            "INSERT INTO entries VALUES (?, ?)",
+            ([_dispatch_type(value, SEK)] for value in subunits),
+        )
+        cursor = connection.execute(
+            "SELECT amount, currency FROM entries ORDER BY amount"
+        )
+        assert [value for (value,) in typed_rows(cursor)] == sorted(
+            _dispatch_type(value, SEK) for value in subunits
+        )
+        cursor = connection.execute(
+            "SELECT COALESCE(SUM(amount), 0), 'SEK' FROM entries"
+        )
+        assert list(typed_rows(cursor)) == [(_dispatch_type(sum(subunits), SEK),)]
+
+    def test_typed_rows_combines_given_columns(
+        self,
+        connection: sqlite3.Connection,
+    ) -> None:
+        executemany(
+            connection,
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            [(1, SEK(3)), (2, NOK.overdraft(2)), (3, SEK.overdraft(1))],
+        )
+        cursor = connection.execute(
+            "SELECT currency, SUM(amount), COUNT(*) FROM entries "
+            "GROUP BY currency ORDER BY currency"
+        )
+        assert list(typed_rows(cursor, (1, 0))) == [
+            (NOK.overdraft(2), 1),
+            (SEK(2), 2),
+        ]
+
+    def test_orders_by_signed_subunits(self, connection: sqlite3.Connection) -> None:
+        values: list[Money[Currency] | Overdraft[Currency]] = [
+            SEK(3),
+            SEK.overdraft(5),
+            SEK(0),
+        ]
+        executemany(
+            connection,
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            ((i, value) for i, value in enumerate(values)),
+        )
+        cursor = connection.execute(
+            "SELECT amount, currency FROM entries ORDER BY amount"
+        )
+        assert [value for (value,) in typed_rows(cursor)] == sorted(values)
+
+    def test_null_subunits_become_none(self, connection: sqlite3.Connection) -> None:
+        cursor = connection.execute("SELECT SUM(amount), 'SEK' FROM entries")
+        assert list(typed_rows(cursor)) == [(None,)]
+
+    def test_row_factory(self, connection: sqlite3.Connection) -> None:
+        executemany(connection, "INSERT INTO entries VALUES (?, ?, ?)", [(1, JCN(1))])
+        connection.row_factory = row_factory((1, 2), registry=custom_registry)
+        assert connection.execute("SELECT * FROM entries").fetchall() == [(1, JCN(1))]
+
+    def test_raises_value_error_for_overlapping_columns(self) -> None:
+        with pytest.raises(ValueError):
+            row_factory((0, 1), (1, 2))
+
+    def test_raises_type_error_for_non_integer_subunits(
+        self,
+        connection: sqlite3.Connection,
+    ) -> None:
+        cursor = connection.execute("SELECT 1.5, 'SEK'")
+        with pytest.raises(TypeError):
+            list(typed_rows(cursor))
+
+
+class TestRegister:
+    @pytest.fixture(autouse=True)
+    def registered(self) -> Iterator[None]:
+        adapters = dict(sqlite3.adapters)
+        converters = dict(sqlite3.converters)
+        register()
+        yield
+        sqlite3.adapters.clear()
+        sqlite3.adapters.update(adapters)
+        sqlite3.converters.clear()
+        sqlite3.converters.update(converters)
+
+    def test_roundtrips_values_through_declared_types(self) -> None:
+        connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        connection.execute("CREATE TABLE t (money MONEY, fraction SUBUNIT_FRACTION)")
+        values = [
+            (SEK("1.50"), SEK.fraction(1, 3)),
+            (NOK.overdraft("0.01"), NOK.fraction(Fraction(-7, 2))),
+        ]
+        connection.executemany("INSERT INTO t VALUES (?, ?)", values)
+        assert connection.execute("SELECT money, fraction FROM t").fetchall() == values
+        assert connection.execute("SELECT money FROM t").fetchone() == (SEK("1.50"),)
+        assert connection.execute("SELECT CAST(money AS TEXT) FROM t").fetchall() == [
+            ("SEK:150",),
+            ("NOK:-1",),
+        ]
+
+    def test_raises_parse_error_for_invalid_stored_value(self) -> None:
+        connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        connection.execute("CREATE TABLE t (money MONEY)")
+        connection.execute("INSERT INTO t VALUES ('SEK:1.5')")
+        with pytest.raises(ParseError):
+            connection.execute("SELECT money FROM t").fetchall()
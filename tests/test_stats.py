@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import math
+import pickle
+from fractions import Fraction
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
+from hypothesis.strategies import sampled_from
+
+from immoney import Money
+from immoney import Overdraft
+from immoney.currencies import NOK
+from immoney.currencies import SEK
+from immoney.stats import QuantileSketch
+from immoney.stats import StreamStats
+
+from .strategies import monies
+from .strategies import overdrafts
+
+signed_subunits = integers(min_value=-(10**12), max_value=10**12)
+quantiles = floats(min_value=0, max_value=1)
+mixed_currency_values = lists(
+    monies(currencies=sampled_from([SEK, NOK]))
+    | overdrafts(currencies=sampled_from([SEK, NOK])),
+    min_size=1,
+)
+
+
+def _signed(value: Money[Any] | Overdraft[Any]) -> int:
+    return value.subunits if isinstance(value, Money) else -value.subunits
+
+
+class TestQuantileSketch:
+    @given(lists(signed_subunits, min_size=1), quantiles)
+    def test_estimates_within_relative_accuracy(
+        self,
+        values: list[int],
+        q: float,
+    ) -> None:
+        sketch = QuantileSketch(relative_accuracy=0.02)
+        for value in values:
+            sketch.add(value)
+        expected = sorted(values)[math.floor(q * (len(values) - 1))]
+        assert math.isclose(sketch.quantile(q), expected, rel_tol=0.02 + 1e-9)
+
+    @given(lists(signed_subunits), lists(signed_subunits))
+    def test_merge_equals_single_sketch(
+        self,
+        first: list[int],
+        second: list[int],
+    ) -> None:
+        merged, other, single = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in first:
+            merged.add(value)
+            single.add(value)
+        for value in second:
+            other.add(value)
+            single.add(value)
+        merged.merge(other)
+        assert merged.count == single.count
+        assert merged.zero_count == single.zero_count
+        assert merged.positive == single.positive
+        assert merged.negative == single.negative
+
+    def test_bounds_number_of_buckets(self) -> None:
+        sketch = QuantileSketch(max_buckets=16)
+        for exponent in range(100):
+            sketch.add(2**exponent)
+            sketch.add(-(2**exponent))
+        assert len(sketch.positive) == 16
+        assert len(sketch.negative) == 16
+        assert sketch.count == 200
+        # Large magnitudes are kept accurate.
+        assert math.isclose(sketch.quantile(1), 2**99, rel_tol=0.01)
+        assert math.isclose(sketch.quantile(0), -(2**99), rel_tol=0.01)
+
+    def test_raises_value_error_for_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0)
+        with pytest.raises(ValueError):
+            QuantileSketch(max_buckets=0)
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(0.5)
+        sketch = QuantileSketch()
+        sketch.add(1)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+class TestStreamStats:
+    @given(mixed_currency_values)
+    def test_exact_statistics_agree_with_builtins(
+        self,
+        values: list[Money[Any] | Overdraft[Any]],
+    ) -> None:
+        stats = StreamStats()
+        stats.update(values)
+        for currency in (SEK, NOK):
+            subunits = [
+                _signed(value) for value in values if value.currency == currency
+            ]
+            assert stats.count(currency) == len(subunits)
+            if not subunits:
+                with pytest.raises(KeyError):
+                    stats.total(currency)
+                continue
+            assert stats.total(currency) == sum(
+                (value for value in values if value.currency == currency),
+                currency.from_subunit(0),
+            )
+            assert stats.minimum(currency) == min(
+                value for value in values if value.currency == currency
+            )
+            assert stats.maximum(currency) == max(
+                value for value in values if value.currency == currency
+            )
+            assert stats.mean(currency) == currency.fraction(
+                Fraction(sum(subunits), len(subunits))
+            )
+
+    @given(mixed_currency_values, quantiles)
+    def test_quantiles_are_within_exact_bounds(
+        self,
+        values: list[Money[Any] | Overdraft[Any]],
+        q: float,
+    ) -> None:
+        stats = StreamStats()
+        for value in values:
+            stats.add(value)
+        currency = values[0].currency
+        assert (
+            stats.minimum(currency)
+            <= stats.quantile(currency, q)
+            <= stats.maximum(currency)
+        )
+
+    @given(mixed_currency_values, mixed_currency_values)
+    def test_merge_equals_single_stream(
+        self,
+        first: list[Money[Any] | Overdraft[Any]],
+        second: list[Money[Any] | Overdraft[Any]],
+    ) -> None:
+        merged, other, single = StreamStats(), StreamStats(), StreamStats()
+        merged.update(first)
+        other.update(second)
+        single.update(first + second)
+        # Partial states are sent between processes by pickling.
+        merged.merge(pickle.loads(pickle.dumps(other)))
+        for currency in (SEK, NOK):
+            assert merged.count(currency) == single.count(currency)
+            if not single.count(currency):
+                continue
+            assert merged.total(currency) == single.total(currency)
+            assert merged.minimum(currency) == single.minimum(currency)
+            assert merged.maximum(currency) == single.maximum(currency)
+            assert merged.mean(currency) == single.mean(currency)
+            assert merged.quantile(currency, 0.5) == single.quantile(currency, 0.5)
+
+    def test_failed_merge_leaves_statistics_unchanged(self) -> None:
+        stats = StreamStats()
+        stats.update([SEK(1), SEK(3)])
+        other = StreamStats(relative_accuracy=0.05)
+        other.update([SEK(5), NOK(2)])
+        with pytest.raises(ValueError):
+            stats.merge(other)
+        assert set(stats.summaries) == {"SEK"}
+        assert stats.count(SEK) == 2
+        assert stats.total(SEK) == SEK(4)
+        assert stats.maximum(SEK) == SEK(3)
+
+        summary = stats.summaries["SEK"]
+        with pytest.raises(ValueError):
+            summary.merge(other.summaries["SEK"])
+        assert (summary.count, summary.total) == (2, 400)
+        assert (summary.minimum, summary.maximum) == (100, 300)
+        assert summary.sketch.count == 2
+
+    def test_adds_raw_subunits(self) -> None:
+        stats = StreamStats()
+        stats.add_subunits(SEK, -150)
+        stats.add_subunits(SEK, 50)
+        assert stats.total(SEK) == SEK.overdraft(1)
+        assert stats.minimum(SEK) == SEK.overdraft("1.50")
+        assert stats.maximum(SEK) == SEK("0.50")
+        assert stats.mean(SEK) == SEK.fraction(-50)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import math
+import pickle
 from decimal import Decimal
 from fractions import Fraction
 from typing import Any
@@ -7,7 +10,9 @@ from typing import Any
 import pytest
 from hypothesis import example
 from hypothesis import given
+from hypothesis.strategies import fractions
 from hypothesis.strategies import integers
+from hypothesis.strategies import sampled_from
 from typing_extensions import assert_type
 
 from immoney import Currency
@@ -15,9 +20,13 @@ from immoney import Money
 from immoney import Overdraft
 from immoney import Round
 from immoney import SubunitFraction
+from immoney._base import _round_ratio
+from immoney._cache import InstanceCache
 from immoney.currencies import NOK
 from immoney.currencies import SEK
 from immoney.currencies import SEKType
+from immoney.currencies import registry
+from immoney.errors import FrozenInstanceError
 from immoney.errors import ParseError
 
 from .strategies import SEKMonetary
@@ -81,6 +90,23 @@ def test_hash() -> None:
     assert hash(SEK.fraction(13)) == hash(SEK.fraction(13))
 
 
+def test_hash_is_equal_for_uncached_instances() -> None:
+    uncached = InstanceCache._instantiate.__wrapped__(
+        SubunitFraction, Fraction(1, 3), SEK
+    )
+    assert uncached is not SEK.fraction(1, 3)
+    assert hash(uncached) == hash(SEK.fraction(1, 3))
+    with pytest.raises(FrozenInstanceError):
+        uncached._hash = 1  # type: ignore[attr-defined]
+
+
+def test_raises_on_reinitialization() -> None:
+    value = SEK.fraction(1, 3)
+    with pytest.raises(FrozenInstanceError):
+        value.__init__(Fraction(5), SEK)
+    assert value.value == Fraction(1, 3)
+
+
 def test_can_check_equality_with_zero() -> None:
     assert SEK.fraction(0) == 0
     assert 0 == SEK.fraction(0)
@@ -246,6 +272,37 @@ def test_round_either_returns_money_for_positive_fraction() -> None:
     assert SEK("3.32") == fraction.round_either(Round.HALF_DOWN)
 
 
+def _reference_round(value: Fraction, rounding: Round) -> int:
+    remainder = value % 1
+    match rounding:
+        case Round.DOWN:
+            return math.floor(value)
+        case Round.UP:
+            return math.ceil(value)
+        case Round.HALF_UP:
+            return (
+                math.ceil(value) if remainder >= Fraction(1, 2) else math.floor(value)
+            )
+        case Round.HALF_EVEN:
+            return round(value)
+        case Round.HALF_DOWN:
+            return math.ceil(value) if remainder > Fraction(1, 2) else math.floor(value)
+
+
+@given(fractions(), sampled_from(Round))
+@example(Fraction(5, 2), Round.HALF_EVEN)
+@example(Fraction(-5, 2), Round.HALF_EVEN)
+@example(Fraction(-5, 2), Round.HALF_UP)
+@example(Fraction(-5, 2), Round.HALF_DOWN)
+def test_round_ratio_agrees_with_fraction_rounding(
+    value: Fraction,
+    rounding: Round,
+) -> None:
+    assert _round_ratio(
+        value.numerator, value.denominator, rounding
+    ) == _reference_round(value, rounding)
+
+
 class TestAdd:
     @pytest.mark.parametrize(
         ("a", "b", "expected"),
@@ -551,3 +608,18 @@ class TestOrdering:
             b < a  # noqa: B015
         with pytest.raises(TypeError):
             b <= a  # noqa: B015
+
+
+@given(subunit_fractions(currencies=sampled_from(tuple(registry.values()))))
+def test_pickle_roundtrip_returns_interned_instance(
+    value: SubunitFraction[Any],
+) -> None:
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored is value
+    assert restored.currency is value.currency
+
+
+def test_copy_returns_self() -> None:
+    value = SEK.fraction(1, 3)
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value